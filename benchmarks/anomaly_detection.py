@@ -0,0 +1,53 @@
+"""Time anomaly detection over every campaign at once on each backend.
+
+Run with: PYTHONPATH=. python -m benchmarks.anomaly_detection --scale 10000 --days 90
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.campaign_summaries import open_stores
+from benchmarks.synthetic_load import END_DATE, load
+from dashboard.data.models.analytics import AnomalyMethodEnum
+from dashboard.data.store.analytics_store import SQLiteAnalyticsStore
+from dashboard.services.anomaly_service import ANOMALY_WINDOW_DAYS, detect_anomalies
+from dashboard.services.result_cache import result_cache
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", type=int, default=10_000, help="campaigns")
+    parser.add_argument("--days", type=int, default=90, help="days scored")
+    parser.add_argument("--backends", nargs="+", default=["memory", "columnar"])
+    args = parser.parse_args()
+    start_date: date = END_DATE - timedelta(days=args.days - 1)
+
+    # Time the detection itself, not a cached result
+    result_cache.max_entries = 0
+    print(  # noqa: T201
+        f"{'backend':>9} {'rows':>12} {'method':>7} {'anomalies':>10} {'detect s':>9}",
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for backend, store in open_stores(Path(directory)).items():
+            if backend not in args.backends:
+                continue
+            rows, _ = load(store, args.scale, args.days + ANOMALY_WINDOW_DAYS, 0)
+            with patch("dashboard.services.anomaly_service.analytics_store", store):
+                for method in AnomalyMethodEnum:
+                    started = time.perf_counter()
+                    anomalies = detect_anomalies(start_date, END_DATE, method)
+                    seconds = time.perf_counter() - started
+                    print(  # noqa: T201
+                        f"{backend:>9} {rows:>12,} {method.value:>7} "
+                        f"{len(anomalies):>10,} {seconds:>9.2f}",
+                    )
+            if isinstance(store, SQLiteAnalyticsStore):
+                store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Compare single-row add/update/delete loops with the batch APIs of InMemoryStore.
+
+Run with: PYTHONPATH=. python -m benchmarks.bulk_mutations
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from datetime import date, timedelta
+
+from dashboard.data.models.analytics import CampaignAnalyticsSchema, MetricsSchema
+from dashboard.data.store.analytics_store import AnalyticsStore
+
+DEFAULT_ROW_COUNTS = [10_000, 100_000, 1_000_000]
+DAYS_PER_CAMPAIGN = 31
+DATE_SHIFT = timedelta(days=DAYS_PER_CAMPAIGN)
+
+
+def make_rows(count: int) -> list[CampaignAnalyticsSchema]:
+    metrics = MetricsSchema(impressions=100, clicks=5, ctr_pct=5.0, cost_usd=1.0)
+    start = date(2025, 1, 1)
+    return [
+        CampaignAnalyticsSchema.model_construct(
+            id=f"row-{i}",
+            campaign_id=f"campaign-{i // DAYS_PER_CAMPAIGN}",
+            date=start + timedelta(days=i % DAYS_PER_CAMPAIGN),
+            metrics=metrics,
+        )
+        for i in range(count)
+    ]
+
+
+def timed(action: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    action()
+    return time.perf_counter() - started
+
+
+def shifted_dates(rows: list[CampaignAnalyticsSchema]) -> dict[str, dict[str, date]]:
+    """Move every row past the generated window so no unique key collides."""
+    return {row.id: {"date": row.date + DATE_SHIFT} for row in rows}
+
+
+def measure_loop(rows: list[CampaignAnalyticsSchema]) -> tuple[float, float, float]:
+    store = AnalyticsStore()
+    store.set_max_bytes(None)
+    updates = shifted_dates(rows)
+
+    def add_all() -> None:
+        for row in rows:
+            store.add(row)
+
+    def update_all() -> None:
+        for item_id, changes in updates.items():
+            store.update(item_id, changes)
+
+    def delete_all() -> None:
+        for item_id in updates:
+            store.delete(item_id)
+
+    return timed(add_all), timed(update_all), timed(delete_all)
+
+
+def measure_batch(rows: list[CampaignAnalyticsSchema]) -> tuple[float, float, float]:
+    store = AnalyticsStore()
+    store.set_max_bytes(None)
+    updates = shifted_dates(rows)
+    return (
+        timed(lambda: store.add_many(rows)),
+        timed(lambda: store.update_many(updates)),
+        timed(lambda: store.delete_many(updates)),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROW_COUNTS)
+    args = parser.parse_args()
+
+    header = f"{'rows':>10} {'mode':>6} {'add s':>8} {'update s':>9} {'delete s':>9}"
+    print(header)  # noqa: T201
+    for count in args.rows:
+        for mode, measure in (("loop", measure_loop), ("batch", measure_batch)):
+            add_s, update_s, delete_s = measure(make_rows(count))
+            timings = f"{add_s:>8.2f} {update_s:>9.2f} {delete_s:>9.2f}"
+            print(f"{count:>10,} {mode:>6} {timings}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Compare per-campaign summary loops with one grouped pass on every backend.
+
+Run with: PYTHONPATH=. python -m benchmarks.campaign_summaries
+"""
+
+import argparse
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import date, timedelta
+from pathlib import Path
+
+from benchmarks.bulk_mutations import DAYS_PER_CAMPAIGN, make_rows
+from dashboard.data.store.analytics_store import AnalyticsStore, SQLiteAnalyticsStore
+from dashboard.data.store.columnar_analytics_store import ColumnarAnalyticsStore
+
+DEFAULT_CAMPAIGN_COUNTS = [1_000, 5_000]
+WINDOW = (date(2025, 1, 1), date(2025, 1, 1) + timedelta(days=DAYS_PER_CAMPAIGN))
+
+type SummaryStore = AnalyticsStore | SQLiteAnalyticsStore | ColumnarAnalyticsStore
+
+
+def timed(action: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    action()
+    return time.perf_counter() - started
+
+
+def open_stores(directory: Path) -> dict[str, SummaryStore]:
+    memory_store = AnalyticsStore()
+    memory_store.set_max_bytes(None)
+    return {
+        "memory": memory_store,
+        "sqlite": SQLiteAnalyticsStore(directory / "stores.sqlite3"),
+        "columnar": ColumnarAnalyticsStore(),
+    }
+
+
+def measure(store: SummaryStore, campaign_ids: list[str]) -> tuple[float, float]:
+    def loop() -> None:
+        for campaign_id in campaign_ids:
+            store.summarize(campaign_id, *WINDOW)
+
+    return timed(loop), timed(lambda: store.summarize_all(*WINDOW))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--campaigns",
+        type=int,
+        nargs="+",
+        default=DEFAULT_CAMPAIGN_COUNTS,
+    )
+    args = parser.parse_args()
+
+    print(f"{'campaigns':>10} {'backend':>9} {'loop s':>8} {'grouped s':>10}")  # noqa: T201
+    for count in args.campaigns:
+        rows = make_rows(count * DAYS_PER_CAMPAIGN)
+        campaign_ids = list(dict.fromkeys(row.campaign_id for row in rows))
+        with tempfile.TemporaryDirectory() as directory:
+            for backend, store in open_stores(Path(directory)).items():
+                store.add_many(rows)
+                loop_s, grouped_s = measure(store, campaign_ids)
+                print(f"{count:>10,} {backend:>9} {loop_s:>8.2f} {grouped_s:>10.2f}")  # noqa: T201
+                if isinstance(store, SQLiteAnalyticsStore):
+                    store.close()
+
+
+if __name__ == "__main__":
+    main()
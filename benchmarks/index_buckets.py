@@ -0,0 +1,68 @@
+"""Measure add/delete cost of InMemoryStore as a single index bucket grows.
+
+Run with: PYTHONPATH=. python -m benchmarks.index_buckets
+"""
+
+import argparse
+import time
+from datetime import date
+
+from dashboard.data.models.analytics import CampaignAnalyticsSchema, MetricsSchema
+from dashboard.data.store.memory_store import InMemoryStore
+
+DEFAULT_BUCKET_SIZES = [1_000, 10_000, 100_000]
+DEFAULT_PROBE_OPS = 1_000
+
+
+def make_rows(count: int, prefix: str) -> list[CampaignAnalyticsSchema]:
+    metrics = MetricsSchema(impressions=100, clicks=5, ctr_pct=5.0, cost_usd=1.0)
+    return [
+        CampaignAnalyticsSchema.model_construct(
+            id=f"{prefix}-{i}",
+            campaign_id="campaign-1",
+            date=date(2025, 1, 1),
+            metrics=metrics,
+        )
+        for i in range(count)
+    ]
+
+
+def measure(bucket_size: int, probe_ops: int) -> tuple[float, float]:
+    """Return (add, delete) microseconds per op against a bucket of bucket_size."""
+    store = InMemoryStore[CampaignAnalyticsSchema](max_items=bucket_size * 2)
+    store.add_index("campaign_id")
+    store.add_index("date")
+    for row in make_rows(bucket_size, "base"):
+        store.add(row)
+
+    probes = make_rows(probe_ops, "probe")
+
+    started = time.perf_counter()
+    for row in probes:
+        store.add(row)
+    add_s = time.perf_counter() - started
+
+    # Delete from the front of the bucket, the worst case for list.remove
+    victims = [row.id for row in store.get_by_index("campaign_id", "campaign-1")]
+    started = time.perf_counter()
+    for item_id in victims[:probe_ops]:
+        store.delete(item_id)
+    delete_s = time.perf_counter() - started
+
+    return add_s / probe_ops * 1e6, delete_s / probe_ops * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_BUCKET_SIZES)
+    parser.add_argument("--ops", type=int, default=DEFAULT_PROBE_OPS)
+    args = parser.parse_args()
+
+    print(f"{'bucket size':>12} {'add us/op':>10} {'delete us/op':>13}")  # noqa: T201
+    for size in args.sizes:
+        add_us, delete_us = measure(size, args.ops)
+        print(f"{size:>12,} {add_us:>10.2f} {delete_us:>13.2f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Measure how long an analytics store takes to restart from its snapshot and log.
+
+Run with: PYTHONPATH=. python -m benchmarks.persistence_restart
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bulk_mutations import make_rows
+from dashboard.data.models.analytics import CampaignAnalyticsSchema
+from dashboard.data.store.analytics_store import AnalyticsStore
+from dashboard.data.store.persistence import FsyncPolicyEnum, StorePersistence
+
+DEFAULT_ROW_COUNTS = [100_000, 1_000_000]
+LOG_TAIL_ROWS = 10_000
+
+
+def open_store(directory: Path) -> tuple[AnalyticsStore, StorePersistence]:
+    store = AnalyticsStore()
+    store.set_max_bytes(None)
+    persistence = StorePersistence(
+        directory,
+        "analytics",
+        CampaignAnalyticsSchema,
+        FsyncPolicyEnum.NEVER,
+        compact_bytes=None,
+    )
+    store.enable_persistence(persistence)
+    return store, persistence
+
+
+def measure(count: int, directory: Path) -> tuple[float, float, float]:
+    """Return (load from scratch, snapshot, restart) seconds for count rows."""
+    rows = make_rows(count + LOG_TAIL_ROWS)
+    store, persistence = open_store(directory)
+
+    started = time.perf_counter()
+    store.add_many(rows[:count])
+    load_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    store.save_snapshot()
+    snapshot_s = time.perf_counter() - started
+
+    # Leave a log tail behind the snapshot, as a crash between compactions would
+    store.add_many(rows[count:])
+    persistence.close()
+
+    started = time.perf_counter()
+    _, persistence = open_store(directory)
+    restart_s = time.perf_counter() - started
+    persistence.close()
+
+    return load_s, snapshot_s, restart_s
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROW_COUNTS)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'add_many s':>11} {'snapshot s':>11} {'restart s':>10}")  # noqa: T201
+    for count in args.rows:
+        with tempfile.TemporaryDirectory() as directory:
+            load_s, snapshot_s, restart_s = measure(count, Path(directory))
+        print(f"{count:>10,} {load_s:>11.2f} {snapshot_s:>11.2f} {restart_s:>10.2f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Time generating and bulk-loading a seeded synthetic analytics dataset.
+
+Run with: PYTHONPATH=. python -m benchmarks.synthetic_load --scale 10000 --days 730
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.campaign_summaries import SummaryStore, open_stores
+from dashboard.data.store.analytics_store import SQLiteAnalyticsStore
+from dashboard.services.analytics_service import load_synthetic_analytics
+
+END_DATE = date(2025, 12, 31)
+
+
+def load(store: SummaryStore, scale: int, days: int, seed: int) -> tuple[int, float]:
+    started = time.perf_counter()
+    with patch("dashboard.services.analytics_service.analytics_store", store):
+        rows = load_synthetic_analytics(scale, days, seed=seed, end_date=END_DATE)
+    return rows, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", type=int, default=1_000, help="campaigns")
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        default=["memory", "sqlite", "columnar"],
+    )
+    args = parser.parse_args()
+
+    print(f"{'backend':>9} {'rows':>12} {'load s':>8} {'rows/s':>10}")  # noqa: T201
+    with tempfile.TemporaryDirectory() as directory:
+        for backend, store in open_stores(Path(directory)).items():
+            if backend not in args.backends:
+                continue
+            rows, seconds = load(store, args.scale, args.days, args.seed)
+            print(f"{backend:>9} {rows:>12,} {seconds:>8.2f} {rows / seconds:>10,.0f}")  # noqa: T201
+            if isinstance(store, SQLiteAnalyticsStore):
+                store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
+from dashboard.app.components.analytics_charts import (
+    display_anomaly_alerts,
+    display_budget_pacing,
+    display_campaign_analytics_dashboard,
+)
 from dashboard.app.components.campaign_card import campaign_card
 from dashboard.app.components.image_uploader import image_uploader
-from dashboard.app.components.analytics_charts import display_campaign_analytics_dashboard
 from dashboard.app.components.targeting_selector import (
     age_range_selector,
     interest_selector,
@@ -11,6 +15,8 @@ from dashboard.app.components.targeting_selector import (
 __all__ = [
     "age_range_selector",
     "campaign_card",
+    "display_anomaly_alerts",
+    "display_budget_pacing",
     "display_campaign_analytics_dashboard",
     "image_uploader",
     "interest_selector",
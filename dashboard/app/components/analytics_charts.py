@@ -1,17 +1,38 @@
 from collections.abc import Callable
 from datetime import UTC, date, datetime, timedelta
+from typing import Any
 
 import altair as alt
 import pandas as pd
 import streamlit as st
 
-from dashboard.data.models.analytics import CampaignAnalyticsSchema, MetricsSchema
+from dashboard.data.models.analytics import (
+    AnomalyMetricEnum,
+    CampaignAnalyticsSchema,
+    CampaignAnomalySchema,
+    CampaignPacingSchema,
+    DistributionMetricEnum,
+    ForecastPointSchema,
+    MetricSeriesPointSchema,
+    MetricsSchema,
+    MetricsSummarySchema,
+    PacingStatusEnum,
+    PeriodComparisonSchema,
+    SeriesResolutionEnum,
+)
 from dashboard.data.models.campaign import CampaignSchema
 from dashboard.data.store import campaign_store
 from dashboard.services.analytics_service import (
-    calculate_campaign_performance_summary,
+    compare_all_campaigns_performance,
+    compare_campaign_performance,
     get_all_campaigns_performance,
-    get_campaign_analytics,
+    get_campaign_metric_series,
+    get_metric_distribution,
+)
+from dashboard.services.forecast_service import (
+    FORECAST_MAX_DAYS,
+    FORECAST_MIN_DAYS,
+    get_campaign_forecast,
 )
 
 
@@ -35,28 +56,94 @@ def display_date_range_selector() -> tuple[date, date]:
     return start_date, end_date
 
 
-def display_metrics_summary(metrics: MetricsSchema) -> None:
-    """Display a summary of metrics in a clean UI."""
+def display_metrics_summary(
+    metrics: MetricsSchema,
+    previous: MetricsSchema | None = None,
+) -> None:
+    """Display a summary of metrics in a clean UI.
+
+    With the previous period's metrics, each tile shows the change from it.
+    """
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        st.metric("Impressions", f"{metrics.impressions:,}")
+        st.metric(
+            "Impressions",
+            f"{metrics.impressions:,}",
+            **_delta(metrics, previous, "impressions"),
+        )
 
     with col2:
-        st.metric("Clicks", f"{metrics.clicks:,}")
+        st.metric(
+            "Clicks",
+            f"{metrics.clicks:,}",
+            **_delta(metrics, previous, "clicks"),
+        )
 
     with col3:
-        st.metric("CTR", f"{metrics.ctr_pct:.2f}%")
+        st.metric(
+            "CTR",
+            f"{metrics.ctr_pct:.2f}%",
+            **_delta(metrics, previous, "ctr_pct"),
+        )
 
     with col4:
-        st.metric("Cost", f"${metrics.cost_usd:.2f}")
+        # More spend is neither good nor bad on its own
+        st.metric(
+            "Cost",
+            f"${metrics.cost_usd:.2f}",
+            **_delta(metrics, previous, "cost_usd", color="off"),
+        )
+
+    if isinstance(metrics, MetricsSummarySchema):
+        st.metric(
+            "Unique Users",
+            f"~{metrics.unique_users:,}",
+            **(
+                _delta(metrics, previous, "unique_users")
+                if isinstance(previous, MetricsSummarySchema)
+                else {}
+            ),
+            help="Estimated with HyperLogLog sketches, typically within 1.6%",
+        )
+
+
+def _delta(
+    metrics: MetricsSchema,
+    previous: MetricsSchema | None,
+    field_name: str,
+    color: str = "normal",
+) -> dict[str, Any]:
+    """Return st.metric arguments showing a metric's change from previous.
+
+    Counts and cost change by percent and CTR by percentage points; a metric
+    with nothing in the previous period is marked new.
+    """
+    if previous is None:
+        return {}
+    current, before = getattr(metrics, field_name), getattr(previous, field_name)
+    if field_name == "ctr_pct":
+        delta = f"{current - before:+.2f} pp"
+    elif before:
+        delta = f"{(current / before - 1) * 100:+.1f}%"
+    elif current:
+        delta = "new"
+    else:
+        return {}
+    if color == "normal":
+        return {"delta": delta}
+    return {"delta": delta, "delta_color": color}
 
 
 def display_campaign_performance_chart(
-    analytics_list: list[CampaignAnalyticsSchema],
+    analytics_list: list[CampaignAnalyticsSchema] | list[MetricSeriesPointSchema],
     metric_name: str = "impressions",
+    forecast: list[ForecastPointSchema] | None = None,
 ) -> None:
-    """Display a time series chart for campaign performance."""
+    """Display a time series chart for campaign performance.
+
+    Daily forecast points, if given, continue the line dashed inside a band.
+    """
     if not analytics_list:
         st.info("No data available for the selected date range")
         return
@@ -67,7 +154,11 @@ def display_campaign_performance_chart(
         metric_value = getattr(analytic.metrics, metric_name)
         chart_data.append(
             {
-                "date": analytic.date,
+                "date": (
+                    analytic.start
+                    if isinstance(analytic, MetricSeriesPointSchema)
+                    else analytic.date
+                ),
                 "value": metric_value,
                 "metric": metric_name.replace("_", " ").title(),
             },
@@ -96,6 +187,25 @@ def display_campaign_performance_chart(
         .interactive()
     )
 
+    if forecast:
+        forecast_df = pd.DataFrame([point.model_dump() for point in forecast])
+        band = (
+            alt.Chart(forecast_df)
+            .mark_area(opacity=0.2)
+            .encode(
+                x="date:T",
+                y="lower:Q",
+                y2="upper:Q",
+                tooltip=["date:T", "lower:Q", "upper:Q"],
+            )
+        )
+        expected = (
+            alt.Chart(forecast_df)
+            .mark_line(strokeDash=[4, 4])
+            .encode(x="date:T", y="expected:Q", tooltip=["date:T", "expected:Q"])
+        )
+        chart = alt.layer(chart, band, expected)
+
     st.altair_chart(chart, use_container_width=True)
 
 
@@ -118,6 +228,19 @@ def display_metric_selector(
     )
 
 
+def display_resolution_selector() -> SeriesResolutionEnum | None:
+    """Display a chart resolution selector; None lets the date range decide."""
+    resolution: SeriesResolutionEnum | None = st.radio(
+        "Group By",
+        options=[None, *SeriesResolutionEnum],
+        format_func=lambda resolution: (
+            resolution.value.title() if resolution else "Auto"
+        ),
+        horizontal=True,
+    )
+    return resolution
+
+
 def display_campaign_comparison_chart(
     campaign_metrics: dict[str, MetricsSchema],
     metric_name: str = "impressions",
@@ -174,6 +297,105 @@ def display_campaign_comparison_chart(
     st.altair_chart(chart, use_container_width=True)
 
 
+def display_distribution_panel(
+    start_date: date,
+    end_date: date,
+    campaign_id: str | None = None,
+) -> None:
+    """Display p50/p90/p99 of daily CPC and spend for one or all campaigns."""
+    distributions = get_metric_distribution(start_date, end_date, campaign_id)
+    if not distributions:
+        st.info("No daily data available for distributions")
+        return
+
+    metric_titles = {
+        DistributionMetricEnum.CPC: "Cost per Click",
+        DistributionMetricEnum.SPEND: "Daily Spend",
+    }
+    for distribution in distributions:
+        st.markdown(
+            f"**{metric_titles[distribution.metric]}** "
+            f"({distribution.count:,} campaign-days)",
+        )
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.metric("Median", f"${distribution.p50:,.2f}")
+
+        with col2:
+            st.metric("p90", f"${distribution.p90:,.2f}")
+
+        with col3:
+            st.metric("p99", f"${distribution.p99:,.2f}")
+
+
+def display_anomaly_alerts(anomalies: list[CampaignAnomalySchema]) -> None:
+    """Display campaigns whose CTR or spend recently broke from their trend."""
+    if not anomalies:
+        st.success("No campaign broke its CTR or spend trend recently")
+        return
+
+    flagged = {anomaly.campaign_id for anomaly in anomalies}
+    st.warning(f"{len(flagged):,} campaigns broke their CTR or spend trend recently")
+
+    metric_titles = {
+        AnomalyMetricEnum.CTR: "CTR (%)",
+        AnomalyMetricEnum.SPEND: "Cost (USD)",
+    }
+    rows = []
+    for anomaly in anomalies:
+        campaign = campaign_store.get(anomaly.campaign_id)
+        rows.append(
+            {
+                "Campaign": campaign.name if campaign else anomaly.campaign_id,
+                "Date": anomaly.date,
+                "Metric": metric_titles[anomaly.metric],
+                "Value": round(anomaly.value, 2),
+                "Expected": round(anomaly.expected, 2),
+                "Score": round(anomaly.score, 1),
+            },
+        )
+    st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
+
+
+def display_budget_pacing(pacing: list[CampaignPacingSchema]) -> None:
+    """Display active campaigns whose spend is off pace with their budget."""
+    at_risk = [campaign for campaign in pacing if campaign.at_risk]
+    if not at_risk:
+        st.success(f"All {len(pacing):,} active campaigns are on budget pace")
+        return
+
+    st.warning(f"{len(at_risk):,} of {len(pacing):,} active campaigns are off pace")
+
+    status_titles = {
+        PacingStatusEnum.EXHAUSTED: "Budget spent",
+        PacingStatusEnum.OVERPACING: "Overpacing",
+        PacingStatusEnum.UNDERPACING: "Underpacing",
+    }
+    rows = []
+    for pace in at_risk:
+        campaign = campaign_store.get(pace.campaign_id)
+        rows.append(
+            {
+                "Campaign": campaign.name if campaign else pace.campaign_id,
+                "Status": status_titles[pace.status],
+                "Budget (USD)": pace.budget_usd,
+                "Spent (USD)": pace.spend_to_date_usd,
+                "Expected (USD)": pace.expected_spend_usd,
+                "Daily Spend (USD)": pace.daily_run_rate_usd,
+                "Runs Out": pace.projected_exhaustion_date,
+            },
+        )
+    st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
+
+
+def _compared_with(comparison: PeriodComparisonSchema) -> str:
+    return (
+        f"Changes compared with {comparison.previous_start_date:%b %d} - "
+        f"{comparison.previous_end_date:%b %d, %Y}"
+    )
+
+
 def display_campaign_analytics_dashboard(
     campaign: CampaignSchema | None = None,
 ) -> None:
@@ -184,25 +406,47 @@ def display_campaign_analytics_dashboard(
         # Single campaign view
         st.subheader(f"Campaign: {campaign.name}")
 
-        # Get campaign analytics
-        analytics_list = get_campaign_analytics(
+        # Display summary metrics with their change from the previous period
+        comparison = compare_campaign_performance(
             campaign.id,
             start_date,
             end_date,
         )
+        display_metrics_summary(comparison.current, comparison.previous)
+        st.caption(_compared_with(comparison))
+
+        # Display performance chart
+        st.subheader("Performance Over Time")
+        selected_metric = display_metric_selector()
+        resolution = display_resolution_selector()
+
+        forecast_days = st.slider(
+            "Forecast Days",
+            min_value=FORECAST_MIN_DAYS,
+            max_value=FORECAST_MAX_DAYS,
+            value=14,
+        )
 
-        # Display summary metrics
-        summary = calculate_campaign_performance_summary(
+        # The store sums points down to a count the chart can plot
+        analytics_list = get_campaign_metric_series(
             campaign.id,
             start_date,
             end_date,
+            resolution,
         )
-        display_metrics_summary(summary)
-
-        # Display performance chart
-        st.subheader("Performance Over Time")
-        selected_metric = display_metric_selector()
-        display_campaign_performance_chart(analytics_list, selected_metric)
+        # Forecasts are daily, so they only continue a daily series; CTR has none
+        forecast = None
+        if analytics_list and analytics_list[0].resolution is SeriesResolutionEnum.DAY:
+            campaign_forecast = get_campaign_forecast(
+                campaign.id,
+                end_date,
+                forecast_days,
+            )
+            forecast = getattr(campaign_forecast, selected_metric, None)
+        display_campaign_performance_chart(analytics_list, selected_metric, forecast)
+
+        st.subheader("Daily Distribution")
+        display_distribution_panel(start_date, end_date, campaign.id)
 
     else:
         # All campaigns view
@@ -215,19 +459,16 @@ def display_campaign_analytics_dashboard(
             st.info("No campaign data available for the selected date range")
             return
 
-        # Display overall summary
-        overall_metrics = MetricsSchema(
-            impressions=sum(m.impressions for m in campaign_metrics.values()),
-            clicks=sum(m.clicks for m in campaign_metrics.values()),
-            ctr_pct=sum(m.clicks for m in campaign_metrics.values())
-            / max(sum(m.impressions for m in campaign_metrics.values()), 1)
-            * 100,
-            cost_usd=sum(m.cost_usd for m in campaign_metrics.values()),
-        )
-
-        display_metrics_summary(overall_metrics)
+        # Display overall summary; users reached by several campaigns are
+        # only counted once
+        comparison = compare_all_campaigns_performance(start_date, end_date)
+        display_metrics_summary(comparison.current, comparison.previous)
+        st.caption(_compared_with(comparison))
 
         # Display comparison chart
         st.subheader("Campaign Comparison")
         selected_metric = display_metric_selector()
         display_campaign_comparison_chart(campaign_metrics, selected_metric)
+
+        st.subheader("Daily Distribution")
+        display_distribution_panel(start_date, end_date)
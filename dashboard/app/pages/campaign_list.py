@@ -1,4 +1,5 @@
 from datetime import UTC, datetime
+from operator import attrgetter
 from typing import Any, TypedDict, cast
 
 import streamlit as st
@@ -28,6 +29,14 @@ SORT_OLDEST = "Oldest"
 SORT_BUDGET_HIGH_LOW = "Budget (High to Low)"
 SORT_BUDGET_LOW_HIGH = "Budget (Low to High)"
 
+# Sort option -> (field, descending)
+SORT_ORDERS: dict[str, tuple[str, bool]] = {
+    SORT_NEWEST: ("created_at", True),
+    SORT_OLDEST: ("created_at", False),
+    SORT_BUDGET_HIGH_LOW: ("budget_usd", True),
+    SORT_BUDGET_LOW_HIGH: ("budget_usd", False),
+}
+
 # Navigation targets
 REDIRECT_CREATE_CAMPAIGN = "Create Campaign"
 REDIRECT_EDIT_CAMPAIGN = "Edit Campaign"
@@ -89,25 +98,14 @@ def filter_and_sort_campaigns(
         campaigns = [c for c in campaigns if c.status.value in status_filter]
 
     # Apply sorting
-    if sort_by == SORT_NEWEST:
-        return sorted(
-            campaigns,
-            key=lambda c: c.created_at,
-            reverse=True,
-        )
-    if sort_by == SORT_OLDEST:
-        return sorted(campaigns, key=lambda c: c.created_at)
-    if sort_by == SORT_BUDGET_HIGH_LOW:
-        return sorted(
-            campaigns,
-            key=lambda c: c.budget_usd,
-            reverse=True,
-        )
-    if sort_by == SORT_BUDGET_LOW_HIGH:
-        return sorted(campaigns, key=lambda c: c.budget_usd)
-
-    # Default case
-    return campaigns
+    sort_order = SORT_ORDERS.get(sort_by)
+    if sort_order is None:
+        # Default case
+        return campaigns
+
+    # Only the user's already-filtered campaigns are sorted, never the store
+    field_name, descending = sort_order
+    return sorted(campaigns, key=attrgetter(field_name), reverse=descending)
 
 
 def display_campaigns(campaigns: list[CampaignSchema]) -> None:
@@ -301,9 +301,9 @@ def campaign_form_step4() -> None:
     """Handle Step 4: Review and Submit"""
     # Review and submit step
     display_campaign_preview(
-        cast(dict[str, Any], st.session_state[SESSION_CAMPAIGN_DATA]),
-        cast(BannerData, st.session_state[SESSION_BANNER_DATA]),
-        cast(TargetingData, st.session_state[SESSION_TARGETING_DATA]),
+        cast("dict[str, Any]", st.session_state[SESSION_CAMPAIGN_DATA]),
+        cast("BannerData", st.session_state[SESSION_BANNER_DATA]),
+        cast("TargetingData", st.session_state[SESSION_TARGETING_DATA]),
     )
 
     col1, col2 = st.columns(2)
@@ -315,15 +315,13 @@ def campaign_form_step4() -> None:
 
     with col2:
         if st.button(BUTTON_CREATE_CAMPAIGN, key="create_campaign_btn"):
-            # Create banner
+            # Validate every model before writing any of them
             banner = AdBannerSchema.model_validate(
                 st.session_state[SESSION_BANNER_DATA],
             )
-            added_banner = banner_store.add(banner)
 
-            # Create targeting
             targeting_data = cast(
-                TargetingData,
+                "TargetingData",
                 st.session_state[SESSION_TARGETING_DATA],
             )
             targeting = AudienceTargetingSchema(
@@ -331,14 +329,14 @@ def campaign_form_step4() -> None:
                 locations=targeting_data["locations"],
                 interests=targeting_data["interests"],
             )
-            added_targeting = targeting_store.add(targeting)
 
-            # Create campaign
             campaign_data = st.session_state[SESSION_CAMPAIGN_DATA]
-            campaign_data["banner_id"] = added_banner.id
-            campaign_data["targeting_id"] = added_targeting.id
-
+            campaign_data["banner_id"] = banner.id
+            campaign_data["targeting_id"] = targeting.id
             campaign = CampaignSchema.model_validate(campaign_data)
+
+            banner_store.add(banner)
+            targeting_store.add(targeting)
             campaign_store.add(campaign)
 
             # Success message and reset
@@ -1,8 +1,16 @@
+from datetime import UTC, datetime, timedelta
+
 import streamlit as st
 
-from dashboard.app.components import display_campaign_analytics_dashboard
+from dashboard.app.components import (
+    display_anomaly_alerts,
+    display_budget_pacing,
+    display_campaign_analytics_dashboard,
+)
 from dashboard.data.store import campaign_store
 from dashboard.services.analytics_service import generate_mock_analytics_data
+from dashboard.services.anomaly_service import ANOMALY_RECENT_DAYS, detect_anomalies
+from dashboard.services.pacing_service import calculate_budget_pacing
 
 
 def main() -> None:
@@ -28,6 +36,17 @@ def main() -> None:
             st.switch_page("pages/create_campaign.py")
         return
 
+    # Flag campaigns whose CTR or spend broke its trend in the last few days
+    today = datetime.now(UTC).date()
+    with st.expander("Anomalies", expanded=True):
+        display_anomaly_alerts(
+            detect_anomalies(today - timedelta(days=ANOMALY_RECENT_DAYS - 1), today),
+        )
+
+    # Active campaigns heading for an overspent or unspent budget
+    with st.expander("Budget Pacing", expanded=True):
+        display_budget_pacing(calculate_budget_pacing(today))
+
     # Add campaign selector in sidebar
     with st.sidebar:
         st.header("Dashboard Controls")
@@ -1,5 +1,27 @@
 from dashboard.data.models.ad_copy import AdCopySchema
-from dashboard.data.models.analytics import CampaignAnalyticsSchema, MetricsSchema
+from dashboard.data.models.analytics import (
+    AnomalyMethodEnum,
+    AnomalyMetricEnum,
+    CampaignAnalyticsSchema,
+    CampaignAnomalySchema,
+    CampaignForecastSchema,
+    CampaignHourlyMetricsSchema,
+    CampaignPacingSchema,
+    DateBucketSchema,
+    DistributionMetricEnum,
+    ForecastMethodEnum,
+    ForecastPointSchema,
+    MetricQuantilesSchema,
+    MetricSeriesPointSchema,
+    MetricsSchema,
+    MetricsSummarySchema,
+    MetricTotalsSchema,
+    PacingStatusEnum,
+    PeriodComparisonSchema,
+    ReachSketchSchema,
+    RollupGranularityEnum,
+    SeriesResolutionEnum,
+)
 from dashboard.data.models.campaign import (
     AdBannerSchema,
     CampaignListItemSchema,
@@ -22,14 +44,33 @@ __all__ = [
     "AdBannerSchema",
     "AdCopySchema",
     "AgeRangeSchema",
+    "AnomalyMethodEnum",
+    "AnomalyMetricEnum",
     "AudienceTargetingSchema",
     "CampaignAnalyticsSchema",
+    "CampaignAnomalySchema",
+    "CampaignForecastSchema",
+    "CampaignHourlyMetricsSchema",
     "CampaignListItemSchema",
+    "CampaignPacingSchema",
     "CampaignSchema",
     "CampaignStatusEnum",
+    "DateBucketSchema",
+    "DistributionMetricEnum",
+    "ForecastMethodEnum",
+    "ForecastPointSchema",
     "InterestSchema",
     "LocationSchema",
+    "MetricQuantilesSchema",
+    "MetricSeriesPointSchema",
+    "MetricTotalsSchema",
     "MetricsSchema",
+    "MetricsSummarySchema",
+    "PacingStatusEnum",
+    "PeriodComparisonSchema",
+    "ReachSketchSchema",
+    "RollupGranularityEnum",
+    "SeriesResolutionEnum",
     "UserLoginSchema",
     "UserRegistrationSchema",
     "UserSchema",
@@ -1,8 +1,12 @@
-from datetime import date
+import calendar
+from collections.abc import Iterator
+from datetime import UTC, date, datetime, time, timedelta
+from enum import Enum
+from itertools import islice
 from typing import Annotated
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, Field
 
 
 class MetricsSchema(BaseModel):
@@ -26,3 +30,268 @@ class CampaignAnalyticsSchema(BaseModel):
     campaign_id: Annotated[str, Field(description="ID of the campaign")]
     date: Annotated[date, Field(description="Date of the analytics data")]
     metrics: Annotated[MetricsSchema, Field(description="Campaign metrics")]
+
+
+class MetricsSummarySchema(MetricsSchema):
+    unique_users: Annotated[
+        int,
+        Field(
+            ge=0,
+            description="Estimated distinct users reached; HyperLogLog, ~1.6% error",
+        ),
+    ]
+
+
+class PeriodComparisonSchema(BaseModel):
+    current: Annotated[
+        MetricsSummarySchema,
+        Field(description="Metrics of the selected date range"),
+    ]
+    previous: Annotated[
+        MetricsSummarySchema,
+        Field(description="Metrics of the equally long period just before it"),
+    ]
+    previous_start_date: Annotated[date, Field(description="First previous day")]
+    previous_end_date: Annotated[date, Field(description="Last previous day")]
+
+
+class ReachSketchSchema(BaseModel):
+    id: Annotated[
+        str,
+        Field(
+            default_factory=lambda: str(uuid4()),
+            description="Unique identifier for the reach sketch",
+        ),
+    ]
+    campaign_id: Annotated[str, Field(description="ID of the campaign")]
+    date: Annotated[date, Field(description="Day the users were reached")]
+    registers: Annotated[
+        bytes,
+        Field(description="HyperLogLog registers of the users reached that day"),
+    ]
+
+
+class MetricTotalsSchema(BaseModel):
+    impressions: Annotated[int, Field(ge=0, description="Summed impressions")]
+    clicks: Annotated[int, Field(ge=0, description="Summed clicks")]
+    cost_usd: Annotated[float, Field(ge=0, description="Summed cost in USD")]
+    days: Annotated[int, Field(ge=0, description="Daily rows that were summed")]
+
+
+class RollupGranularityEnum(str, Enum):
+    DAY = "day"
+    WEEK = "week"  # ISO week, Monday to Sunday
+    MONTH = "month"
+
+    def period_start(self, day: date) -> date:
+        """Return the first day of the period containing day."""
+        if self is RollupGranularityEnum.WEEK:
+            return day - timedelta(days=day.weekday())
+        if self is RollupGranularityEnum.MONTH:
+            return day.replace(day=1)
+        return day
+
+    def period_end(self, day: date) -> date:
+        """Return the last day of the period containing day."""
+        if self is RollupGranularityEnum.WEEK:
+            return day + timedelta(days=6 - day.weekday())
+        if self is RollupGranularityEnum.MONTH:
+            return day.replace(day=calendar.monthrange(day.year, day.month)[1])
+        return day
+
+
+class DateBucketSchema(BaseModel):
+    granularity: Annotated[
+        RollupGranularityEnum,
+        Field(description="Rollup table the bucket is read from"),
+    ]
+    start_date: Annotated[date, Field(description="First day covered")]
+    end_date: Annotated[date, Field(description="Last day covered")]
+
+
+def _utc_hour(moment: datetime) -> datetime:
+    """Floor a datetime to its hour in UTC, reading naive values as UTC."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return moment.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+
+
+class CampaignHourlyMetricsSchema(BaseModel):
+    id: Annotated[
+        str,
+        Field(
+            default_factory=lambda: str(uuid4()),
+            description="Unique identifier for hourly analytics record",
+        ),
+    ]
+    campaign_id: Annotated[str, Field(description="ID of the campaign")]
+    hour: Annotated[
+        datetime,
+        AfterValidator(_utc_hour),
+        Field(description="Start of the UTC hour the metrics cover"),
+    ]
+    metrics: Annotated[MetricsSchema, Field(description="Campaign metrics")]
+
+
+class SeriesResolutionEnum(str, Enum):
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+    def period_start(self, moment: datetime) -> datetime:
+        """Return the start of the period containing moment."""
+        if self is SeriesResolutionEnum.HOUR:
+            return moment.replace(minute=0, second=0, microsecond=0)
+        day = RollupGranularityEnum(self.value).period_start(moment.date())
+        return datetime.combine(day, time.min, tzinfo=moment.tzinfo)
+
+    def next_start(self, moment: datetime) -> datetime:
+        """Return the start of the period after the one containing moment."""
+        if self is SeriesResolutionEnum.HOUR:
+            return self.period_start(moment) + timedelta(hours=1)
+        day = RollupGranularityEnum(self.value).period_end(moment.date())
+        return datetime.combine(
+            day + timedelta(days=1),
+            time.min,
+            tzinfo=moment.tzinfo,
+        )
+
+    def period_starts(self, start: datetime, end: datetime) -> Iterator[datetime]:
+        """Yield the start of every period overlapping [start, end]."""
+        moment = self.period_start(start)
+        while moment <= end:
+            yield moment
+            moment = self.next_start(moment)
+
+    @classmethod
+    def fitting(
+        cls,
+        start: datetime,
+        end: datetime,
+        max_points: int,
+    ) -> "SeriesResolutionEnum":
+        """Return the finest resolution that covers [start, end] in max_points."""
+        for resolution in cls:
+            periods = islice(resolution.period_starts(start, end), max_points + 1)
+            if sum(1 for _ in periods) <= max_points:
+                return resolution
+        return cls.MONTH
+
+    def coarsest(self, other: "SeriesResolutionEnum") -> "SeriesResolutionEnum":
+        resolutions = list(SeriesResolutionEnum)
+        return max(self, other, key=resolutions.index)
+
+
+class MetricSeriesPointSchema(BaseModel):
+    campaign_id: Annotated[str, Field(description="ID of the campaign")]
+    start: Annotated[datetime, Field(description="Start of the period")]
+    resolution: Annotated[
+        SeriesResolutionEnum,
+        Field(description="Length of the period the metrics are summed over"),
+    ]
+    metrics: Annotated[MetricsSchema, Field(description="Summed metrics")]
+
+
+class DistributionMetricEnum(str, Enum):
+    CPC = "cpc_usd"  # Daily cost per click; days without clicks are skipped
+    SPEND = "cost_usd"  # Daily spend
+
+
+class MetricQuantilesSchema(BaseModel):
+    metric: Annotated[DistributionMetricEnum, Field(description="Daily metric")]
+    count: Annotated[int, Field(ge=0, description="Campaign-days in the sample")]
+    p50: Annotated[float, Field(ge=0, description="Median")]
+    p90: Annotated[float, Field(ge=0, description="90th percentile")]
+    p99: Annotated[float, Field(ge=0, description="99th percentile")]
+
+
+class AnomalyMetricEnum(str, Enum):
+    CTR = "ctr_pct"
+    SPEND = "cost_usd"
+
+
+class AnomalyMethodEnum(str, Enum):
+    ZSCORE = "zscore"  # Rolling mean and standard deviation
+    MAD = "mad"  # Rolling median and median absolute deviation; outlier-robust
+
+
+class CampaignAnomalySchema(BaseModel):
+    campaign_id: Annotated[str, Field(description="ID of the campaign")]
+    date: Annotated[date, Field(description="Day that broke the trend")]
+    metric: Annotated[AnomalyMetricEnum, Field(description="Daily metric")]
+    value: Annotated[float, Field(description="Value on that day")]
+    expected: Annotated[
+        float,
+        Field(description="Mean or median of the days before it"),
+    ]
+    score: Annotated[
+        float,
+        Field(description="Deviation from expected in standard deviations"),
+    ]
+
+
+class PacingStatusEnum(str, Enum):
+    ON_PACE = "on_pace"
+    OVERPACING = "overpacing"  # Projected to overspend the budget by the end date
+    UNDERPACING = "underpacing"  # Projected to leave budget unspent at the end
+    EXHAUSTED = "exhausted"  # Budget already spent
+
+
+class CampaignPacingSchema(BaseModel):
+    campaign_id: Annotated[str, Field(description="ID of the campaign")]
+    budget_usd: Annotated[float, Field(gt=0, description="Campaign budget in USD")]
+    spend_to_date_usd: Annotated[
+        float,
+        Field(ge=0, description="Spend from the start up to the pacing date"),
+    ]
+    daily_budget_usd: Annotated[
+        float | None,
+        Field(
+            description="Even daily share of the budget, the slope of the expected "
+            "spend curve; None without an end date",
+        ),
+    ]
+    expected_spend_usd: Annotated[
+        float | None,
+        Field(description="Spend due by the pacing date; None without an end date"),
+    ]
+    daily_run_rate_usd: Annotated[
+        float,
+        Field(ge=0, description="Average daily spend over the last few days"),
+    ]
+    projected_exhaustion_date: Annotated[
+        date | None,
+        Field(description="Day the budget runs out at the run rate; None if never"),
+    ]
+    status: Annotated[PacingStatusEnum, Field(description="Pace against budget")]
+
+    @property
+    def at_risk(self) -> bool:
+        return self.status is not PacingStatusEnum.ON_PACE
+
+
+class ForecastMethodEnum(str, Enum):
+    SMOOTHING = "smoothing"  # Simple exponential smoothing of the level
+    TREND = "trend"  # Least-squares linear trend
+
+
+class ForecastPointSchema(BaseModel):
+    date: Annotated[date, Field(description="Forecast day")]
+    expected: Annotated[float, Field(ge=0, description="Most likely value")]
+    lower: Annotated[float, Field(ge=0, description="Lower edge of the band")]
+    upper: Annotated[float, Field(ge=0, description="Upper edge of the band")]
+
+
+class CampaignForecastSchema(BaseModel):
+    campaign_id: Annotated[str, Field(description="ID of the campaign")]
+    method: Annotated[ForecastMethodEnum, Field(description="Fitted model")]
+    impressions: Annotated[
+        list[ForecastPointSchema],
+        Field(description="Daily impressions"),
+    ]
+    clicks: Annotated[list[ForecastPointSchema], Field(description="Daily clicks")]
+    cost_usd: Annotated[
+        list[ForecastPointSchema],
+        Field(description="Daily cost in USD"),
+    ]
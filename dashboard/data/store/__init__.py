@@ -1,34 +1,154 @@
+from pydantic import BaseModel
+
+from dashboard.data.models import (
+    AdBannerSchema,
+    AdCopySchema,
+    AudienceTargetingSchema,
+    CampaignAnalyticsSchema,
+    CampaignHourlyMetricsSchema,
+    CampaignSchema,
+    InterestSchema,
+    ReachSketchSchema,
+    UserSchema,
+)
 from dashboard.data.store.ad_copy_store import AdCopyStore
-from dashboard.data.store.analytics_store import AnalyticsStore
+from dashboard.data.store.analytics_store import (
+    AnalyticsStore,
+    HourlyAnalyticsStore,
+    SQLiteAnalyticsStore,
+)
+from dashboard.data.store.backend import (
+    StoreBackendEnum,
+    create_analytics_store,
+    create_campaign_store,
+)
 from dashboard.data.store.banner_store import BannerStore
-from dashboard.data.store.campaign_store import CampaignStore
+from dashboard.data.store.campaign_store import CampaignStore, SQLiteCampaignStore
+from dashboard.data.store.columnar_analytics_store import ColumnarAnalyticsStore
+from dashboard.data.store.memory_budget import MemoryBudget
 from dashboard.data.store.memory_store import InMemoryStore
+from dashboard.data.store.persistence import FsyncPolicyEnum, StorePersistence
+from dashboard.data.store.reach_store import ReachStore
+from dashboard.data.store.sqlite_store import SQLiteStore
 from dashboard.data.store.targeting_store import InterestStore, TargetingStore
 from dashboard.data.store.user_store import UserStore
+from dashboard.data.store.virtual_analytics_store import VirtualAnalyticsStore
+from dashboard.settings import (
+    AD_COPY_STORE_FSYNC,
+    ANALYTICS_STORE_FSYNC,
+    BANNER_STORE_FSYNC,
+    CAMPAIGN_STORE_FSYNC,
+    HOURLY_ANALYTICS_STORE_FSYNC,
+    INTEREST_STORE_FSYNC,
+    REACH_STORE_FSYNC,
+    STORE_DATA_DIR,
+    STORE_MEMORY_BUDGET_BYTES,
+    TARGETING_STORE_FSYNC,
+    USER_STORE_FSYNC,
+)
 
 # Create singleton instances for stores
 user_store = UserStore()
-campaign_store = CampaignStore()
+campaign_store = create_campaign_store()
 banner_store = BannerStore()
 targeting_store = TargetingStore()
 interest_store = InterestStore()
-analytics_store = AnalyticsStore()
+analytics_store = create_analytics_store(campaign_store)
+hourly_analytics_store = HourlyAnalyticsStore()
+reach_store = ReachStore()
 ad_copy_store = AdCopyStore()
 
+_all_stores: list[
+    InMemoryStore | SQLiteStore | ColumnarAnalyticsStore | VirtualAnalyticsStore
+] = [
+    user_store,
+    campaign_store,
+    banner_store,
+    targeting_store,
+    interest_store,
+    analytics_store,
+    hourly_analytics_store,
+    reach_store,
+    ad_copy_store,
+]
+
+# Global byte budget shared by every store held in memory
+memory_budget = MemoryBudget(
+    STORE_MEMORY_BUDGET_BYTES,
+    [store for store in _all_stores if isinstance(store, InMemoryStore)],
+)
+
+# Restore each store from disk and keep logging to it when persistence is on
+if STORE_DATA_DIR is not None:
+    persisted_stores: list[
+        tuple[
+            str,
+            InMemoryStore
+            | SQLiteStore
+            | ColumnarAnalyticsStore
+            | VirtualAnalyticsStore,
+            type[BaseModel],
+            str,
+        ]
+    ] = [
+        ("users", user_store, UserSchema, USER_STORE_FSYNC),
+        ("campaigns", campaign_store, CampaignSchema, CAMPAIGN_STORE_FSYNC),
+        ("banners", banner_store, AdBannerSchema, BANNER_STORE_FSYNC),
+        ("targeting", targeting_store, AudienceTargetingSchema, TARGETING_STORE_FSYNC),
+        ("interests", interest_store, InterestSchema, INTEREST_STORE_FSYNC),
+        ("analytics", analytics_store, CampaignAnalyticsSchema, ANALYTICS_STORE_FSYNC),
+        (
+            "hourly_analytics",
+            hourly_analytics_store,
+            CampaignHourlyMetricsSchema,
+            HOURLY_ANALYTICS_STORE_FSYNC,
+        ),
+        ("reach", reach_store, ReachSketchSchema, REACH_STORE_FSYNC),
+        ("ad_copies", ad_copy_store, AdCopySchema, AD_COPY_STORE_FSYNC),
+    ]
+    for name, store, model, fsync_policy in persisted_stores:
+        # SQLite stores are durable on their own; columnar and virtual ones are
+        # not persisted
+        if not isinstance(store, InMemoryStore):
+            continue
+        store.enable_persistence(
+            StorePersistence(
+                STORE_DATA_DIR,
+                name,
+                model,
+                FsyncPolicyEnum(fsync_policy),
+            ),
+        )
+    memory_budget.enforce()
+
 __all__ = [
     "AdCopyStore",
     "AnalyticsStore",
     "BannerStore",
     "CampaignStore",
+    "ColumnarAnalyticsStore",
+    "FsyncPolicyEnum",
+    "HourlyAnalyticsStore",
     "InMemoryStore",
     "InterestStore",
+    "MemoryBudget",
+    "ReachStore",
+    "SQLiteAnalyticsStore",
+    "SQLiteCampaignStore",
+    "SQLiteStore",
+    "StoreBackendEnum",
+    "StorePersistence",
     "TargetingStore",
     "UserStore",
+    "VirtualAnalyticsStore",
     "ad_copy_store",
     "analytics_store",
     "banner_store",
     "campaign_store",
+    "hourly_analytics_store",
     "interest_store",
+    "memory_budget",
+    "reach_store",
     "targeting_store",
     "user_store",
 ]
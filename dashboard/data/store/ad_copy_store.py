@@ -1,10 +1,15 @@
 from dashboard.data.models.ad_copy import AdCopySchema
 from dashboard.data.store.memory_store import InMemoryStore
+from dashboard.settings import AD_COPY_STORE_MAX_BYTES
 
 
 class AdCopyStore(InMemoryStore[AdCopySchema]):
     def __init__(self) -> None:
-        super().__init__(id_field="id", max_items=10000)
+        super().__init__(
+            id_field="id",
+            max_items=None,
+            max_bytes=AD_COPY_STORE_MAX_BYTES,
+        )
         self.add_index("campaign_id")
 
     def get_by_campaign(self, campaign_id: str) -> list[AdCopySchema]:
@@ -1,26 +1,381 @@
-from datetime import date
+from collections.abc import Sequence
+from datetime import date, datetime, timedelta
+from pathlib import Path
 
-from dashboard.data.models.analytics import CampaignAnalyticsSchema
+from dashboard.data.models.analytics import (
+    CampaignAnalyticsSchema,
+    CampaignHourlyMetricsSchema,
+    DateBucketSchema,
+    DistributionMetricEnum,
+    MetricTotalsSchema,
+    RollupGranularityEnum,
+    SeriesResolutionEnum,
+)
+from dashboard.data.store.daily_matrix import DailyMetricMatrix
+from dashboard.data.store.indexed_store import IndexedStore
 from dashboard.data.store.memory_store import InMemoryStore
+from dashboard.data.store.quantile_index import QuantileIndex, ValueOf
+from dashboard.data.store.quantile_sketch import QuantileSketch
+from dashboard.data.store.rollup_index import RollupIndex
+from dashboard.data.store.sqlite_store import SQLiteStore
+from dashboard.settings import (
+    ANALYTICS_STORE_MAX_BYTES,
+    HOURLY_ANALYTICS_STORE_MAX_BYTES,
+)
 
+# One row per campaign per day; re-ingesting a day upserts the existing row
+CAMPAIGN_DATE_INDEX = ("campaign_id", "date")
+CAMPAIGN_HOUR_INDEX = ("campaign_id", "hour")
+METRIC_FIELDS = ("metrics.impressions", "metrics.clicks", "metrics.cost_usd")
+ROLLUP_GRANULARITIES = (RollupGranularityEnum.WEEK, RollupGranularityEnum.MONTH)
+_NO_ROWS = (0, 0, 0.0, 0)
+DISTRIBUTION_METRICS = (DistributionMetricEnum.CPC, DistributionMetricEnum.SPEND)
+_INSTANT = timedelta(microseconds=1)
 
-class AnalyticsStore(InMemoryStore[CampaignAnalyticsSchema]):
-    def __init__(self) -> None:
-        super().__init__(id_field="id", max_items=50000)
+
+def _daily_cpc(row: CampaignAnalyticsSchema) -> float | None:
+    metrics = row.metrics
+    return metrics.cost_usd / metrics.clicks if metrics.clicks else None
+
+
+def _daily_spend(row: CampaignAnalyticsSchema) -> float:
+    return row.metrics.cost_usd
+
+
+DISTRIBUTION_VALUES: tuple[ValueOf, ...] = (_daily_cpc, _daily_spend)
+
+
+def sketch_rows(
+    rows: list[CampaignAnalyticsSchema],
+) -> tuple[QuantileSketch, ...]:
+    """Sketch the daily distribution metrics of rows, in DISTRIBUTION_METRICS order."""
+    sketches = []
+    for value_of in DISTRIBUTION_VALUES:
+        sketch = QuantileSketch()
+        sketch.add_array(
+            [value for value in map(value_of, rows) if value is not None],
+        )
+        sketches.append(sketch)
+    return tuple(sketches)
+
+
+def merge_sketches(
+    parts: list[tuple[QuantileSketch, ...]],
+) -> tuple[QuantileSketch, ...]:
+    merged = tuple(QuantileSketch() for _ in DISTRIBUTION_METRICS)
+    for sketches in parts:
+        for total, sketch in zip(merged, sketches, strict=True):
+            total.update(sketch)
+    return merged
+
+
+def check_whole_period(bucket: DateBucketSchema) -> None:
+    granularity = bucket.granularity
+    if granularity is RollupGranularityEnum.DAY:
+        return
+    if (
+        granularity.period_start(bucket.start_date) != bucket.start_date
+        or granularity.period_end(bucket.start_date) != bucket.end_date
+    ):
+        raise ValueError(f"{bucket!r} is not a whole {granularity.value}")
+
+
+class AnalyticsQueriesMixin:
+    """Analytics indexes and lookups shared by the in-memory and SQLite stores."""
+
+    def _add_analytics_indexes(self: IndexedStore[CampaignAnalyticsSchema]) -> None:
         self.add_index("campaign_id")
         self.add_index("date")
+        self.add_range_index("date")
+        self.add_composite_index(CAMPAIGN_DATE_INDEX, unique=True)
 
-    def get_by_campaign(self, campaign_id: str) -> list[CampaignAnalyticsSchema]:
+    def get_by_campaign(
+        self: IndexedStore[CampaignAnalyticsSchema],
+        campaign_id: str,
+    ) -> list[CampaignAnalyticsSchema]:
         return self.get_by_index("campaign_id", campaign_id)
 
-    def get_by_date(self, target_date: date) -> list[CampaignAnalyticsSchema]:
+    def get_by_date(
+        self: IndexedStore[CampaignAnalyticsSchema],
+        target_date: date,
+    ) -> list[CampaignAnalyticsSchema]:
         return self.get_by_index("date", target_date)
 
+    def get_by_date_range(
+        self: IndexedStore[CampaignAnalyticsSchema],
+        start_date: date,
+        end_date: date,
+    ) -> list[CampaignAnalyticsSchema]:
+        return self.get_by_range("date", start_date, end_date)
+
     def get_by_campaign_and_date_range(
-        self,
+        self: IndexedStore[CampaignAnalyticsSchema],
         campaign_id: str,
         start_date: date,
         end_date: date,
     ) -> list[CampaignAnalyticsSchema]:
-        campaign_analytics = self.get_by_campaign(campaign_id)
-        return [a for a in campaign_analytics if start_date <= a.date <= end_date]
+        return self.get_by_composite(
+            CAMPAIGN_DATE_INDEX,
+            (campaign_id,),
+            start_date,
+            end_date,
+        )
+
+    def summarize(
+        self: IndexedStore[CampaignAnalyticsSchema],
+        campaign_id: str,
+        start_date: date,
+        end_date: date,
+    ) -> MetricTotalsSchema:
+        """Sum one campaign's metrics over an inclusive date window."""
+        sums = self.sum_by(
+            "campaign_id",
+            METRIC_FIELDS,
+            "date",
+            (start_date, end_date),
+            filters={"campaign_id": campaign_id},
+        )
+        return _totals(*sums.get(campaign_id, _NO_ROWS))
+
+    def summarize_all(
+        self: IndexedStore[CampaignAnalyticsSchema],
+        start_date: date,
+        end_date: date,
+    ) -> dict[str, MetricTotalsSchema]:
+        """Sum every campaign's metrics over a window in one grouped pass."""
+        sums = self.sum_by("campaign_id", METRIC_FIELDS, "date", (start_date, end_date))
+        return {campaign_id: _totals(*totals) for campaign_id, totals in sums.items()}
+
+    def summarize_periods(
+        self: IndexedStore[CampaignAnalyticsSchema],
+        periods: Sequence[tuple[date, date]],
+        campaign_id: str | None = None,
+    ) -> dict[str, list[MetricTotalsSchema]]:
+        """Sum metrics per campaign over several date windows in one pass.
+
+        Each campaign with rows in any window gets one total per window, e.g.
+        a period and the one before it; campaign_id limits it to one campaign.
+        """
+        sums = self.sum_by_windows(
+            "campaign_id",
+            METRIC_FIELDS,
+            "date",
+            periods,
+            filters=None if campaign_id is None else {"campaign_id": campaign_id},
+        )
+        return {
+            campaign_id: [_totals(*window) for window in totals]
+            for campaign_id, totals in sums.items()
+        }
+
+    def daily_matrix(
+        self: IndexedStore[CampaignAnalyticsSchema],
+        start_date: date,
+        end_date: date,
+    ) -> DailyMetricMatrix:
+        """Lay out every campaign's daily metrics in a window as a matrix."""
+        groups = self.values_by(
+            "campaign_id",
+            METRIC_FIELDS,
+            "date",
+            (start_date, end_date),
+        )
+        return DailyMetricMatrix.from_groups(groups, start_date, end_date)
+
+    def rollup_totals(
+        self: IndexedStore[CampaignAnalyticsSchema],
+        campaign_id: str,
+        buckets: list[DateBucketSchema],
+    ) -> list[MetricTotalsSchema]:
+        """Sum one campaign's metrics per bucket, one range query each."""
+        totals = []
+        for bucket in buckets:
+            sums = self.sum_by(
+                "campaign_id",
+                METRIC_FIELDS,
+                "date",
+                (bucket.start_date, bucket.end_date),
+                filters={"campaign_id": campaign_id},
+            )
+            totals.append(_totals(*sums.get(campaign_id, _NO_ROWS)))
+        return totals
+
+    def distribution_sketches(
+        self: IndexedStore[CampaignAnalyticsSchema],
+        buckets: list[DateBucketSchema],
+        campaign_id: str | None = None,
+    ) -> tuple[QuantileSketch, ...]:
+        """Sketch daily CPC and spend over buckets, by scanning their rows."""
+        rows = []
+        for bucket in buckets:
+            if campaign_id is None:
+                rows.extend(
+                    self.get_by_range("date", bucket.start_date, bucket.end_date),
+                )
+            else:
+                rows.extend(
+                    self.get_by_composite(
+                        CAMPAIGN_DATE_INDEX,
+                        (campaign_id,),
+                        bucket.start_date,
+                        bucket.end_date,
+                    ),
+                )
+        return sketch_rows(rows)
+
+
+def _totals(
+    impressions: float,
+    clicks: float,
+    cost: float,
+    days: int,
+) -> MetricTotalsSchema:
+    # SQLite TOTAL() returns floats, so counts are normalized back to int
+    return MetricTotalsSchema(
+        impressions=int(impressions),
+        clicks=int(clicks),
+        cost_usd=cost,
+        days=days,
+    )
+
+
+class AnalyticsStore(AnalyticsQueriesMixin, InMemoryStore[CampaignAnalyticsSchema]):
+    def __init__(self) -> None:
+        super().__init__(
+            id_field="id",
+            max_items=None,
+            max_bytes=ANALYTICS_STORE_MAX_BYTES,
+        )
+        self._add_analytics_indexes()
+        # Running totals per campaign make any date-window summary O(log n)
+        self.add_prefix_sum_index("campaign_id", "date", METRIC_FIELDS)
+        for granularity in ROLLUP_GRANULARITIES:
+            self.add_rollup_index(
+                granularity.value,
+                RollupIndex(
+                    "campaign_id",
+                    "date",
+                    METRIC_FIELDS,
+                    granularity.period_start,
+                ),
+            )
+            self.add_quantile_index(
+                f"{granularity.value}_quantiles",
+                QuantileIndex(
+                    "campaign_id",
+                    "date",
+                    DISTRIBUTION_VALUES,
+                    granularity.period_start,
+                ),
+            )
+
+    def rollup_totals(
+        self,
+        campaign_id: str,
+        buckets: list[DateBucketSchema],
+    ) -> list[MetricTotalsSchema]:
+        """Read week and month buckets from the rollup tables, days from the rows."""
+        rollups = {
+            granularity: self.get_rollups(
+                granularity.value,
+                campaign_id,
+                [b.start_date for b in buckets if b.granularity is granularity],
+            )
+            for granularity in ROLLUP_GRANULARITIES
+        }
+
+        totals = []
+        for bucket in buckets:
+            if bucket.granularity is RollupGranularityEnum.DAY:
+                totals.append(
+                    self.summarize(campaign_id, bucket.start_date, bucket.end_date),
+                )
+                continue
+
+            check_whole_period(bucket)
+            sums = rollups[bucket.granularity].get(bucket.start_date, _NO_ROWS)
+            totals.append(_totals(*sums))
+        return totals
+
+    def distribution_sketches(
+        self,
+        buckets: list[DateBucketSchema],
+        campaign_id: str | None = None,
+    ) -> tuple[QuantileSketch, ...]:
+        """Merge week and month sketches from the quantile index; scan day rows."""
+        parts = []
+        for bucket in buckets:
+            check_whole_period(bucket)
+            if bucket.granularity is RollupGranularityEnum.DAY:
+                parts.append(super().distribution_sketches([bucket], campaign_id))
+                continue
+            sketches = self.merge_quantile_sketches(
+                f"{bucket.granularity.value}_quantiles",
+                campaign_id,
+                [bucket.start_date],
+            )
+            if sketches is not None:
+                parts.append(sketches)
+        return merge_sketches(parts)
+
+
+class SQLiteAnalyticsStore(
+    AnalyticsQueriesMixin,
+    SQLiteStore[CampaignAnalyticsSchema],
+):
+    def __init__(self, path: Path) -> None:
+        super().__init__(CampaignAnalyticsSchema, "analytics", path)
+        self._add_analytics_indexes()
+
+
+class HourlyAnalyticsStore(InMemoryStore[CampaignHourlyMetricsSchema]):
+    """Hourly metrics kept next to the daily rows, for intraday pacing."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            id_field="id",
+            max_items=None,
+            max_bytes=HOURLY_ANALYTICS_STORE_MAX_BYTES,
+        )
+        self.add_index("campaign_id")
+        self.add_range_index("hour")
+        self.add_composite_index(CAMPAIGN_HOUR_INDEX, unique=True)
+        self.add_prefix_sum_index("campaign_id", "hour", METRIC_FIELDS)
+
+    def get_by_campaign_and_hour_range(
+        self,
+        campaign_id: str,
+        start: datetime,
+        end: datetime,
+    ) -> list[CampaignHourlyMetricsSchema]:
+        return self.get_by_composite(CAMPAIGN_HOUR_INDEX, (campaign_id,), start, end)
+
+    def downsample(
+        self,
+        campaign_id: str,
+        start: datetime,
+        end: datetime,
+        resolution: SeriesResolutionEnum,
+    ) -> dict[datetime, MetricTotalsSchema]:
+        """Sum one campaign's hours per period of resolution within [start, end].
+
+        Each period is two bisects in the prefix sums, so the cost follows the
+        number of points returned rather than the hours they cover. Periods
+        without data are left out; edge periods only sum hours in the window.
+        """
+        totals = {}
+        for period_start in resolution.period_starts(start, end):
+            bounds = (
+                max(period_start, start),
+                min(resolution.next_start(period_start) - _INSTANT, end),
+            )
+            sums = self.sum_by(
+                "campaign_id",
+                METRIC_FIELDS,
+                "hour",
+                bounds,
+                filters={"campaign_id": campaign_id},
+            )
+            if campaign_id in sums:
+                totals[period_start] = _totals(*sums[campaign_id])
+        return totals
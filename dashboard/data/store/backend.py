@@ -0,0 +1,49 @@
+from enum import Enum
+
+from dashboard.data.store.analytics_store import AnalyticsStore, SQLiteAnalyticsStore
+from dashboard.data.store.campaign_store import CampaignStore, SQLiteCampaignStore
+from dashboard.data.store.columnar_analytics_store import ColumnarAnalyticsStore
+from dashboard.data.store.virtual_analytics_store import VirtualAnalyticsStore
+from dashboard.settings import (
+    ANALYTICS_STORE_BACKEND,
+    CAMPAIGN_STORE_BACKEND,
+    SQLITE_STORE_PATH,
+)
+
+
+class StoreBackendEnum(str, Enum):
+    MEMORY = "memory"
+    SQLITE = "sqlite"
+    # NumPy columns; only implemented for analytics
+    COLUMNAR = "columnar"
+    # Read-only mock rows computed from the campaigns; only for analytics
+    VIRTUAL = "virtual"
+
+
+def create_campaign_store() -> CampaignStore | SQLiteCampaignStore:
+    backend = StoreBackendEnum(CAMPAIGN_STORE_BACKEND)
+    if backend in {StoreBackendEnum.COLUMNAR, StoreBackendEnum.VIRTUAL}:
+        raise ValueError(
+            f"The {backend.value} backend only supports the analytics store",
+        )
+    if backend is StoreBackendEnum.SQLITE:
+        return SQLiteCampaignStore(SQLITE_STORE_PATH)
+    return CampaignStore()
+
+
+def create_analytics_store(
+    campaign_store: CampaignStore | SQLiteCampaignStore,
+) -> (
+    AnalyticsStore
+    | SQLiteAnalyticsStore
+    | ColumnarAnalyticsStore
+    | VirtualAnalyticsStore
+):
+    backend = StoreBackendEnum(ANALYTICS_STORE_BACKEND)
+    if backend is StoreBackendEnum.VIRTUAL:
+        return VirtualAnalyticsStore(campaign_store)
+    if backend is StoreBackendEnum.SQLITE:
+        return SQLiteAnalyticsStore(SQLITE_STORE_PATH)
+    if backend is StoreBackendEnum.COLUMNAR:
+        return ColumnarAnalyticsStore()
+    return AnalyticsStore()
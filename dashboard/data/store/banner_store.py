@@ -1,10 +1,15 @@
 from dashboard.data.models.campaign import AdBannerSchema
 from dashboard.data.store.memory_store import InMemoryStore
+from dashboard.settings import BANNER_STORE_MAX_BYTES
 
 
 class BannerStore(InMemoryStore[AdBannerSchema]):
     def __init__(self) -> None:
-        super().__init__(id_field="id", max_items=10000)
+        super().__init__(
+            id_field="id",
+            max_items=None,
+            max_bytes=BANNER_STORE_MAX_BYTES,
+        )
         self.add_index("created_by")
 
     def get_by_user(self, user_id: str) -> list[AdBannerSchema]:
@@ -1,21 +1,54 @@
+from pathlib import Path
+
 from dashboard.data.models.campaign import CampaignSchema, CampaignStatusEnum
+from dashboard.data.store.indexed_store import IndexedStore
 from dashboard.data.store.memory_store import InMemoryStore
+from dashboard.data.store.sqlite_store import SQLiteStore
+from dashboard.settings import CAMPAIGN_STORE_MAX_BYTES
 
 
-class CampaignStore(InMemoryStore[CampaignSchema]):
-    def __init__(self) -> None:
-        super().__init__(id_field="id", max_items=5000)
+class CampaignQueriesMixin:
+    """Campaign indexes and lookups shared by the in-memory and SQLite stores."""
+
+    def _add_campaign_indexes(self: IndexedStore[CampaignSchema]) -> None:
         self.add_index("created_by")
         self.add_index("status")
+        self.add_range_index("created_at")
+        self.add_range_index("budget_usd")
 
-    def get_by_user(self, user_id: str) -> list[CampaignSchema]:
+    def get_by_user(
+        self: IndexedStore[CampaignSchema],
+        user_id: str,
+    ) -> list[CampaignSchema]:
         return self.get_by_index("created_by", user_id)
 
-    def get_by_status(self, status: CampaignStatusEnum) -> list[CampaignSchema]:
+    def get_by_status(
+        self: IndexedStore[CampaignSchema],
+        status: CampaignStatusEnum,
+    ) -> list[CampaignSchema]:
         return self.get_by_index("status", status)
 
-    def count_by_user(self, user_id: str) -> int:
-        return len(self.get_by_user(user_id))
+    def count_by_user(self: IndexedStore[CampaignSchema], user_id: str) -> int:
+        return len(self.get_by_index("created_by", user_id))
+
+    def count_by_status(
+        self: IndexedStore[CampaignSchema],
+        status: CampaignStatusEnum,
+    ) -> int:
+        return len(self.get_by_index("status", status))
+
+
+class CampaignStore(CampaignQueriesMixin, InMemoryStore[CampaignSchema]):
+    def __init__(self) -> None:
+        super().__init__(
+            id_field="id",
+            max_items=None,
+            max_bytes=CAMPAIGN_STORE_MAX_BYTES,
+        )
+        self._add_campaign_indexes()
+
 
-    def count_by_status(self, status: CampaignStatusEnum) -> int:
-        return len(self.get_by_status(status))
+class SQLiteCampaignStore(CampaignQueriesMixin, SQLiteStore[CampaignSchema]):
+    def __init__(self, path: Path) -> None:
+        super().__init__(CampaignSchema, "campaigns", path)
+        self._add_campaign_indexes()
@@ -0,0 +1,473 @@
+import builtins
+from collections.abc import Iterable, Sequence
+from datetime import date
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from dashboard.data.models.analytics import (
+    CampaignAnalyticsSchema,
+    DateBucketSchema,
+    MetricsSchema,
+    MetricTotalsSchema,
+)
+from dashboard.data.store.daily_matrix import DailyMetricMatrix
+from dashboard.data.store.generation import next_generation
+from dashboard.data.store.quantile_sketch import QuantileSketch
+from dashboard.data.store.rw_lock import ReadWriteLock, read_locked, write_locked
+
+_INITIAL_CAPACITY = 1024
+_COLUMN_TYPES: dict[str, npt.DTypeLike] = {
+    "campaign": np.int32,
+    "day": np.int32,
+    "impressions": np.int64,
+    "clicks": np.int64,
+    "ctr": np.float64,
+    "cost": np.float64,
+}
+
+
+class ColumnarAnalyticsStore:
+    """Analytics rows kept as NumPy columns instead of pydantic objects.
+
+    campaign_id is dictionary-encoded to an int32 code and date is stored as an
+    int32 proleptic ordinal, so one daily row costs 40 bytes plus its ID.
+    Deleting a row moves the last row into its slot, keeping the columns dense.
+    Models are only built when a caller asks for rows, and summaries are
+    vectorized reductions over the columns. It offers the AnalyticsStore API
+    with (campaign_id, date) upserts, but has no eviction or persistence.
+    """
+
+    def __init__(self) -> None:
+        self._lock = ReadWriteLock()
+        self._generation = next_generation()
+        self._size = 0
+        self._columns = {
+            name: np.zeros(_INITIAL_CAPACITY, dtype=dtype)
+            for name, dtype in _COLUMN_TYPES.items()
+        }
+        self._ids: builtins.list[str] = []
+        self._row_of: dict[str, int] = {}
+        self._key_row: dict[tuple[int, int], int] = {}
+        self._campaign_codes: dict[str, int] = {}
+        self._campaign_ids: builtins.list[str] = []
+
+    @write_locked
+    def add(self, item: CampaignAnalyticsSchema) -> CampaignAnalyticsSchema:
+        return self._insert(item)
+
+    @write_locked
+    def add_many(
+        self,
+        items: Iterable[CampaignAnalyticsSchema],
+    ) -> builtins.list[CampaignAnalyticsSchema]:
+        stored = {}
+        for item in items:
+            row = self._insert(item)
+            stored[row.id] = row
+        return builtins.list(stored.values())
+
+    @read_locked
+    def get(self, item_id: str) -> CampaignAnalyticsSchema | None:
+        row = self._row_of.get(item_id)
+        return self._materialize_row(row) if row is not None else None
+
+    @read_locked
+    def get_by_campaign(
+        self,
+        campaign_id: str,
+    ) -> builtins.list[CampaignAnalyticsSchema]:
+        code = self._campaign_codes.get(campaign_id)
+        if code is None:
+            return []
+        return self._materialize(self._select(code=code))
+
+    @read_locked
+    def get_by_date(self, target_date: date) -> builtins.list[CampaignAnalyticsSchema]:
+        day = target_date.toordinal()
+        return self._materialize(self._select(start=day, end=day))
+
+    @read_locked
+    def get_by_date_range(
+        self,
+        start_date: date,
+        end_date: date,
+    ) -> builtins.list[CampaignAnalyticsSchema]:
+        rows = self._select(start=start_date.toordinal(), end=end_date.toordinal())
+        return self._materialize(rows)
+
+    @read_locked
+    def get_by_campaign_and_date_range(
+        self,
+        campaign_id: str,
+        start_date: date,
+        end_date: date,
+    ) -> builtins.list[CampaignAnalyticsSchema]:
+        code = self._campaign_codes.get(campaign_id)
+        if code is None:
+            return []
+        rows = self._select(
+            code=code,
+            start=start_date.toordinal(),
+            end=end_date.toordinal(),
+        )
+        return self._materialize(rows)
+
+    @read_locked
+    def list(
+        self,
+        filters: dict[str, Any] | None = None,
+    ) -> builtins.list[CampaignAnalyticsSchema]:
+        items = self._materialize(np.arange(self._size))
+        if not filters:
+            return items
+        return [
+            item
+            for item in items
+            if all(
+                hasattr(item, key) and getattr(item, key) == value
+                for key, value in filters.items()
+            )
+        ]
+
+    @read_locked
+    def summarize(
+        self,
+        campaign_id: str,
+        start_date: date,
+        end_date: date,
+    ) -> MetricTotalsSchema:
+        """Sum one campaign's metrics over an inclusive date window."""
+        code = self._campaign_codes.get(campaign_id)
+        if code is None:
+            return _empty_totals()
+
+        mask = self._window_mask(start_date, end_date)
+        mask &= self._column("campaign") == code
+        return MetricTotalsSchema(
+            impressions=int(self._column("impressions")[mask].sum()),
+            clicks=int(self._column("clicks")[mask].sum()),
+            cost_usd=float(self._column("cost")[mask].sum()),
+            days=int(np.count_nonzero(mask)),
+        )
+
+    @read_locked
+    def summarize_all(
+        self,
+        start_date: date,
+        end_date: date,
+    ) -> dict[str, MetricTotalsSchema]:
+        """Sum every campaign's metrics over a window in one grouped pass."""
+        days, impressions, clicks, cost = self._sum_per_campaign(
+            self._window_mask(start_date, end_date),
+        )
+        return {
+            self._campaign_ids[code]: MetricTotalsSchema(
+                impressions=int(impressions[code]),
+                clicks=int(clicks[code]),
+                cost_usd=float(cost[code]),
+                days=int(days[code]),
+            )
+            for code in np.flatnonzero(days)
+        }
+
+    @read_locked
+    def summarize_periods(
+        self,
+        periods: Sequence[tuple[date, date]],
+        campaign_id: str | None = None,
+    ) -> dict[str, builtins.list[MetricTotalsSchema]]:
+        """Sum metrics per campaign over several date windows in one pass.
+
+        The span of all windows is selected once and split per window, so a
+        period and the one before it cost little more than the period alone.
+        """
+        if not periods:
+            return {}
+        mask = self._window_mask(
+            min(start for start, _ in periods),
+            max(end for _, end in periods),
+        )
+        if campaign_id is not None:
+            code = self._campaign_codes.get(campaign_id)
+            if code is None:
+                return {}
+            mask &= self._column("campaign") == code
+
+        rows = np.flatnonzero(mask)
+        days = self._column("day")[rows]
+        windows = [
+            self._sum_per_campaign(
+                rows[(days >= start.toordinal()) & (days <= end.toordinal())],
+            )
+            for start, end in periods
+        ]
+        active = np.flatnonzero(sum(window[0] for window in windows))
+        return {
+            self._campaign_ids[code]: [
+                MetricTotalsSchema(
+                    impressions=int(impressions[code]),
+                    clicks=int(clicks[code]),
+                    cost_usd=float(cost[code]),
+                    days=int(row_counts[code]),
+                )
+                for row_counts, impressions, clicks, cost in windows
+            ]
+            for code in active
+        }
+
+    @read_locked
+    def daily_matrix(self, start_date: date, end_date: date) -> DailyMetricMatrix:
+        """Lay out every campaign's daily metrics in a window as a matrix."""
+        mask = self._window_mask(start_date, end_date)
+        codes, rows = np.unique(self._column("campaign")[mask], return_inverse=True)
+        matrix = DailyMetricMatrix(
+            [self._campaign_ids[code] for code in codes.tolist()],
+            start_date,
+            (end_date - start_date).days + 1,
+        )
+        matrix.fill(
+            rows,
+            self._column("day")[mask] - start_date.toordinal(),
+            (self._column(name)[mask] for name in ("impressions", "clicks", "cost")),
+        )
+        return matrix
+
+    def rollup_totals(
+        self,
+        campaign_id: str,
+        buckets: builtins.list[DateBucketSchema],
+    ) -> builtins.list[MetricTotalsSchema]:
+        """Sum one campaign's metrics per bucket with a masked sum each."""
+        return [
+            self.summarize(campaign_id, bucket.start_date, bucket.end_date)
+            for bucket in buckets
+        ]
+
+    @read_locked
+    def distribution_sketches(
+        self,
+        buckets: builtins.list[DateBucketSchema],
+        campaign_id: str | None = None,
+    ) -> tuple[QuantileSketch, ...]:
+        """Sketch daily CPC and spend over buckets straight from the columns."""
+        mask = np.zeros(self._size, dtype=bool)
+        for bucket in buckets:
+            mask |= self._window_mask(bucket.start_date, bucket.end_date)
+        if campaign_id is not None:
+            code = self._campaign_codes.get(campaign_id)
+            if code is None:
+                return QuantileSketch(), QuantileSketch()
+            mask &= self._column("campaign") == code
+
+        clicks = self._column("clicks")[mask]
+        cost = self._column("cost")[mask]
+        cpc, spend = QuantileSketch(), QuantileSketch()
+        cpc.add_array(cost[clicks > 0] / clicks[clicks > 0])
+        spend.add_array(cost)
+        return cpc, spend
+
+    @write_locked
+    def update(
+        self,
+        item_id: str,
+        data: dict[str, Any],
+    ) -> CampaignAnalyticsSchema | None:
+        row = self._row_of.get(item_id)
+        if row is None:
+            return None
+
+        item = self._materialize_row(row)
+        for field_name, value in data.items():
+            if hasattr(item, field_name):
+                setattr(item, field_name, value)
+
+        owner = self._key_row.get(self._key_of(item))
+        if owner is not None and owner != row:
+            owner_id = self._ids[owner]
+            raise ValueError(f"Update of {item_id} collides with item {owner_id}")
+
+        self._write_row(row, item)
+        return item
+
+    @write_locked
+    def delete(self, item_id: str) -> bool:
+        row = self._row_of.get(item_id)
+        if row is None:
+            return False
+        self._remove_row(row)
+        return True
+
+    @write_locked
+    def delete_many(self, item_ids: Iterable[str]) -> int:
+        deleted = 0
+        for item_id in dict.fromkeys(item_ids):
+            row = self._row_of.get(item_id)
+            if row is not None:
+                self._remove_row(row)
+                deleted += 1
+        return deleted
+
+    def count(self) -> int:
+        return self._size
+
+    def size_bytes(self) -> int:
+        """Bytes held by the column buffers; IDs and dictionaries not included."""
+        return sum(column.nbytes for column in self._columns.values())
+
+    @property
+    def generation(self) -> int:
+        """Number that grows on every change to the rows."""
+        return self._generation
+
+    @write_locked
+    def clear(self) -> None:
+        self._generation = next_generation()
+        self._size = 0
+        self._ids.clear()
+        self._row_of.clear()
+        self._key_row.clear()
+        self._campaign_codes.clear()
+        self._campaign_ids.clear()
+
+    def _insert(self, item: CampaignAnalyticsSchema) -> CampaignAnalyticsSchema:
+        key = self._key_of(item)
+
+        # The (campaign_id, date) key is unique: re-ingesting a day upserts it
+        row = self._key_row.get(key)
+        if row is not None:
+            owner_id = self._ids[row]
+            if owner_id != item.id:
+                item = item.model_copy(update={"id": owner_id})
+        else:
+            row = self._row_of.get(item.id)
+            if row is None:
+                row = self._append_row(item.id)
+
+        self._write_row(row, item)
+        return item
+
+    def _append_row(self, item_id: str) -> int:
+        row = self._size
+        if row == len(self._columns["day"]):
+            for name, column in self._columns.items():
+                grown = np.zeros(len(column) * 2, dtype=column.dtype)
+                grown[:row] = column[:row]
+                self._columns[name] = grown
+
+        self._size += 1
+        self._ids.append(item_id)
+        self._row_of[item_id] = row
+        return row
+
+    def _write_row(self, row: int, item: CampaignAnalyticsSchema) -> None:
+        self._generation = next_generation()
+        columns = self._columns
+        # A fresh row holds stale values, but no live key points past the end
+        old_key = (int(columns["campaign"][row]), int(columns["day"][row]))
+        if self._key_row.get(old_key) == row:
+            del self._key_row[old_key]
+
+        code, day = self._key_of(item)
+        columns["campaign"][row] = code
+        columns["day"][row] = day
+        columns["impressions"][row] = item.metrics.impressions
+        columns["clicks"][row] = item.metrics.clicks
+        columns["ctr"][row] = item.metrics.ctr_pct
+        columns["cost"][row] = item.metrics.cost_usd
+        self._key_row[code, day] = row
+
+    def _remove_row(self, row: int) -> None:
+        self._generation = next_generation()
+        columns = self._columns
+        key = (int(columns["campaign"][row]), int(columns["day"][row]))
+        del self._key_row[key]
+        del self._row_of[self._ids[row]]
+
+        last = self._size - 1
+        if row != last:
+            for column in columns.values():
+                column[row] = column[last]
+            moved_id = self._ids[last]
+            self._ids[row] = moved_id
+            self._row_of[moved_id] = row
+            self._key_row[int(columns["campaign"][row]), int(columns["day"][row])] = row
+
+        self._ids.pop()
+        self._size = last
+
+    def _key_of(self, item: CampaignAnalyticsSchema) -> tuple[int, int]:
+        code = self._campaign_codes.get(item.campaign_id)
+        if code is None:
+            code = self._campaign_codes[item.campaign_id] = len(self._campaign_ids)
+            self._campaign_ids.append(item.campaign_id)
+        return code, item.date.toordinal()
+
+    def _column(self, name: str) -> npt.NDArray[Any]:
+        return self._columns[name][: self._size]
+
+    def _sum_per_campaign(
+        self,
+        rows: npt.NDArray[np.bool_] | npt.NDArray[np.intp],
+    ) -> tuple[npt.NDArray[Any], ...]:
+        """Return row counts, impressions, clicks and cost per campaign code."""
+        codes = self._column("campaign")[rows]
+        groups = len(self._campaign_ids)
+        return tuple(
+            np.bincount(codes, weights=weights, minlength=groups)
+            for weights in (
+                None,
+                self._column("impressions")[rows],
+                self._column("clicks")[rows],
+                self._column("cost")[rows],
+            )
+        )
+
+    def _window_mask(self, start_date: date, end_date: date) -> npt.NDArray[np.bool_]:
+        days = self._column("day")
+        return (days >= start_date.toordinal()) & (days <= end_date.toordinal())
+
+    def _select(
+        self,
+        code: int | None = None,
+        start: int | None = None,
+        end: int | None = None,
+    ) -> npt.NDArray[np.intp]:
+        """Return matching rows ordered by date."""
+        days = self._column("day")
+        mask = np.ones(self._size, dtype=bool)
+        if code is not None:
+            mask &= self._column("campaign") == code
+        if start is not None:
+            mask &= days >= start
+        if end is not None:
+            mask &= days <= end
+
+        rows = np.flatnonzero(mask)
+        return rows[np.argsort(days[rows], kind="stable")]
+
+    def _materialize(
+        self,
+        rows: npt.NDArray[np.intp],
+    ) -> builtins.list[CampaignAnalyticsSchema]:
+        return [self._materialize_row(int(row)) for row in rows]
+
+    def _materialize_row(self, row: int) -> CampaignAnalyticsSchema:
+        columns = self._columns
+        # Column values were validated on the way in, so skip validation here
+        return CampaignAnalyticsSchema.model_construct(
+            id=self._ids[row],
+            campaign_id=self._campaign_ids[columns["campaign"][row]],
+            date=date.fromordinal(int(columns["day"][row])),
+            metrics=MetricsSchema.model_construct(
+                impressions=int(columns["impressions"][row]),
+                clicks=int(columns["clicks"][row]),
+                ctr_pct=float(columns["ctr"][row]),
+                cost_usd=float(columns["cost"][row]),
+            ),
+        )
+
+
+def _empty_totals() -> MetricTotalsSchema:
+    return MetricTotalsSchema(impressions=0, clicks=0, cost_usd=0.0, days=0)
@@ -0,0 +1,148 @@
+from collections.abc import Iterable
+from typing import Any
+
+from dashboard.data.store.range_index import RangeIndex
+
+
+class CompositeIndex:
+    """Index over several fields: equality on the leading ones, range on the last.
+
+    Each distinct prefix (all fields but the last) owns a RangeIndex over the
+    last field, so a lookup is one dict probe plus a bisect. A unique index also
+    maps every full key to the single item that owns it.
+    """
+
+    __slots__ = ("_buckets", "_keys", "_owners", "fields", "unique")
+
+    def __init__(self, fields: tuple[str, ...], unique: bool = False) -> None:
+        if not fields:
+            raise ValueError("Composite index needs at least one field")
+
+        self.fields = fields
+        self.unique = unique
+        self._buckets: dict[tuple[Any, ...], RangeIndex] = {}
+        self._keys: dict[str, tuple[Any, ...]] = {}
+        self._owners: dict[tuple[Any, ...], str] = {}
+
+    def key_of(self, item: object) -> tuple[Any, ...] | None:
+        """Return the item's full key, or None if it lacks any indexed field."""
+        try:
+            return tuple(getattr(item, field_name) for field_name in self.fields)
+        except AttributeError:
+            return None
+
+    def key_for(self, item_id: str) -> tuple[Any, ...] | None:
+        return self._keys.get(item_id)
+
+    def find(self, key: tuple[Any, ...]) -> str | None:
+        """Return the ID owning a full key; only meaningful for unique indexes."""
+        return self._owners.get(key)
+
+    def add(self, item_id: str, key: tuple[Any, ...]) -> None:
+        if self._keys.get(item_id) == key:
+            return
+        self.discard(item_id)
+
+        if self.unique:
+            owner = self._owners.get(key)
+            if owner is not None:
+                raise ValueError(
+                    f"Duplicate key {key!r} for unique index {self.fields!r}",
+                )
+            self._owners[key] = item_id
+
+        prefix = key[:-1]
+        bucket = self._buckets.get(prefix)
+        if bucket is None:
+            bucket = self._buckets[prefix] = RangeIndex()
+        bucket.add(item_id, key[-1])
+        self._keys[item_id] = key
+
+    def add_many(self, pairs: Iterable[tuple[str, tuple[Any, ...]]]) -> None:
+        """Insert many (item_id, key) pairs, one bulk insert per prefix bucket."""
+        grouped: dict[tuple[Any, ...], list[tuple[str, Any]]] = {}
+        for item_id, key in pairs:
+            if self._keys.get(item_id) == key:
+                continue
+            self.discard(item_id)
+
+            if self.unique:
+                owner = self._owners.get(key)
+                if owner is not None:
+                    raise ValueError(
+                        f"Duplicate key {key!r} for unique index {self.fields!r}",
+                    )
+                self._owners[key] = item_id
+
+            grouped.setdefault(key[:-1], []).append((item_id, key[-1]))
+            self._keys[item_id] = key
+
+        for prefix, bucket_pairs in grouped.items():
+            bucket = self._buckets.get(prefix)
+            if bucket is None:
+                bucket = self._buckets[prefix] = RangeIndex()
+            bucket.add_many(bucket_pairs)
+
+    def discard(self, item_id: str) -> None:
+        key = self._keys.pop(item_id, None)
+        if key is None:
+            return
+
+        if self.unique:
+            self._owners.pop(key, None)
+
+        prefix = key[:-1]
+        bucket = self._buckets.get(prefix)
+        if bucket is None:
+            return
+        bucket.discard(item_id)
+        if not bucket:
+            del self._buckets[prefix]
+
+    def discard_many(self, item_ids: Iterable[str]) -> None:
+        grouped: dict[tuple[Any, ...], list[str]] = {}
+        for item_id in item_ids:
+            key = self._keys.pop(item_id, None)
+            if key is None:
+                continue
+            if self.unique:
+                self._owners.pop(key, None)
+            grouped.setdefault(key[:-1], []).append(item_id)
+
+        for prefix, bucket_ids in grouped.items():
+            bucket = self._buckets.get(prefix)
+            if bucket is None:
+                continue
+            bucket.discard_many(bucket_ids)
+            if not bucket:
+                del self._buckets[prefix]
+
+    def range(
+        self,
+        prefix: tuple[Any, ...],
+        lo: Any = None,
+        hi: Any = None,
+    ) -> list[str]:
+        """Return IDs matching prefix with lo <= last field <= hi, ascending."""
+        bucket = self._buckets.get(prefix)
+        return bucket.range(lo, hi) if bucket is not None else []
+
+    def count_range(
+        self,
+        prefix: tuple[Any, ...],
+        lo: Any = None,
+        hi: Any = None,
+    ) -> int:
+        bucket = self._buckets.get(prefix)
+        return bucket.count_range(lo, hi) if bucket is not None else 0
+
+    def clear(self) -> None:
+        self._buckets.clear()
+        self._keys.clear()
+        self._owners.clear()
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
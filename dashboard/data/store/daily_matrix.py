@@ -0,0 +1,89 @@
+from collections.abc import Iterable
+from datetime import date
+from itertools import chain
+from typing import Any, Self
+
+import numpy as np
+import numpy.typing as npt
+
+
+class DailyMetricMatrix:
+    """Daily metrics of many campaigns as campaign x day float arrays.
+
+    Row i holds campaign_ids[i] and column j the day start_date + j. Days
+    without a row are NaN, so a campaign that did not run stays distinct from
+    one that ran without traffic.
+    """
+
+    __slots__ = ("campaign_ids", "clicks", "cost_usd", "impressions", "start_date")
+
+    def __init__(self, campaign_ids: list[str], start_date: date, days: int) -> None:
+        self.campaign_ids = campaign_ids
+        self.start_date = start_date
+        shape = (len(campaign_ids), max(days, 0))
+        self.impressions = np.full(shape, np.nan)
+        self.clicks = np.full(shape, np.nan)
+        self.cost_usd = np.full(shape, np.nan)
+
+    @classmethod
+    def from_groups(
+        cls,
+        groups: dict[str, tuple[list[date], list[tuple[Any, ...]]]],
+        start_date: date,
+        end_date: date,
+    ) -> Self:
+        """Build from values_by output: per campaign, ascending days and values.
+
+        values are (impressions, clicks, cost). Most campaigns run on every
+        day of their span, so their columns are a range and only campaigns
+        with gaps pay for converting each day.
+        """
+        matrix = cls(list(groups), start_date, (end_date - start_date).days + 1)
+        origin = start_date.toordinal()
+        columns = []
+        for days, _ in groups.values():
+            first, last = days[0].toordinal(), days[-1].toordinal()
+            if last - first + 1 == len(days):
+                columns.append(np.arange(first - origin, last - origin + 1))
+            else:
+                columns.append(
+                    np.fromiter(map(date.toordinal, days), np.int64) - origin,
+                )
+
+        counts = [len(days) for days, _ in groups.values()]
+        values = np.fromiter(
+            chain.from_iterable(
+                chain.from_iterable(rows for _, rows in groups.values()),
+            ),
+            np.float64,
+            3 * sum(counts),
+        )
+        matrix.fill(
+            np.repeat(np.arange(len(counts)), counts),
+            np.concatenate(columns) if columns else np.zeros(0, np.int64),
+            values.reshape(-1, 3).T,
+        )
+        return matrix
+
+    def fill(
+        self,
+        rows: npt.NDArray[np.integer],
+        columns: npt.NDArray[np.integer],
+        metrics: Iterable[npt.ArrayLike],
+    ) -> None:
+        """Set cells from parallel arrays of impressions, clicks and cost."""
+        impressions, clicks, cost = metrics
+        self.impressions[rows, columns] = impressions
+        self.clicks[rows, columns] = clicks
+        self.cost_usd[rows, columns] = cost
+
+    @property
+    def days(self) -> int:
+        return int(self.impressions.shape[1])
+
+    def ctr_pct(self) -> npt.NDArray[np.float64]:
+        """Daily CTR; NaN on days without a row or without impressions."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ctr: npt.NDArray[np.float64] = self.clicks / self.impressions * 100
+        ctr[~(self.impressions > 0)] = np.nan
+        return ctr
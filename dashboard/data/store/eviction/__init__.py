@@ -0,0 +1,17 @@
+from dashboard.data.store.eviction.eviction_policy import (
+    EvictionPolicy,
+    EvictionStatsSchema,
+)
+from dashboard.data.store.eviction.fifo_policy import FIFOPolicy
+from dashboard.data.store.eviction.lfu_policy import LFUPolicy
+from dashboard.data.store.eviction.lru_policy import LRUPolicy
+from dashboard.data.store.eviction.ttl_policy import TTLPolicy
+
+__all__ = [
+    "EvictionPolicy",
+    "EvictionStatsSchema",
+    "FIFOPolicy",
+    "LFUPolicy",
+    "LRUPolicy",
+    "TTLPolicy",
+]
@@ -0,0 +1,78 @@
+import threading
+from abc import ABC, abstractmethod
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+
+class EvictionStatsSchema(BaseModel):
+    policy: Annotated[str, Field(description="Eviction policy name")]
+    evictions: Annotated[int, Field(ge=0, description="Items evicted or expired")]
+    hits: Annotated[int, Field(ge=0, description="Reads served from the store")]
+    misses: Annotated[int, Field(ge=0, description="Reads of absent/expired IDs")]
+
+
+class EvictionPolicy(ABC):
+    """Tracks item usage for one store and picks victims in O(1) amortized time.
+
+    The store reports inserts, reads and removals; the policy never touches the
+    store's data itself. evict() forgets the victim it returns, so the store must
+    not call on_remove for it again.
+    """
+
+    name = "base"
+    # Whether items can expire on their own; lets reads skip is_expired checks
+    expires = False
+
+    def __init__(self) -> None:
+        self.evictions = 0
+        self.hits = 0
+        self.misses = 0
+        self._mutex = threading.Lock()
+
+    @abstractmethod
+    def on_insert(self, item_id: str) -> None: ...
+
+    @abstractmethod
+    def on_remove(self, item_id: str) -> None: ...
+
+    @abstractmethod
+    def _pop_victim(self) -> str | None: ...
+
+    @abstractmethod
+    def _clear(self) -> None: ...
+
+    def on_access(self, item_id: str) -> None:
+        with self._mutex:
+            self.hits += 1
+            self._touch(item_id)
+
+    def on_miss(self) -> None:
+        with self._mutex:
+            self.misses += 1
+
+    def _touch(self, item_id: str) -> None:  # noqa: B027
+        """Record a read of item_id; called with the policy mutex held."""
+
+    def evict(self) -> str | None:
+        victim = self._pop_victim()
+        if victim is not None:
+            self.evictions += 1
+        return victim
+
+    def is_expired(self, item_id: str) -> bool:  # noqa: ARG002
+        return False
+
+    def pop_expired(self) -> list[str]:
+        return []
+
+    def clear(self) -> None:
+        self._clear()
+
+    def stats(self) -> EvictionStatsSchema:
+        return EvictionStatsSchema(
+            policy=self.name,
+            evictions=self.evictions,
+            hits=self.hits,
+            misses=self.misses,
+        )
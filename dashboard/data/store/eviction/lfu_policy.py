@@ -0,0 +1,69 @@
+from collections import OrderedDict
+
+from dashboard.data.store.eviction.eviction_policy import EvictionPolicy
+
+
+class LFUPolicy(EvictionPolicy):
+    """Evict the least frequently read item, oldest first among ties.
+
+    IDs live in one insertion-ordered bucket per use count, so moving an ID up
+    a count and popping from the lowest bucket are both O(1).
+    """
+
+    name = "lfu"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._counts: dict[str, int] = {}
+        self._buckets: dict[int, OrderedDict[str, None]] = {}
+        self._min_count = 0
+
+    def on_insert(self, item_id: str) -> None:
+        if item_id in self._counts:
+            return
+
+        self._counts[item_id] = 1
+        self._buckets.setdefault(1, OrderedDict())[item_id] = None
+        self._min_count = 1
+
+    def _touch(self, item_id: str) -> None:
+        count = self._counts.get(item_id)
+        if count is None:
+            return
+
+        self._discard_from_bucket(item_id, count)
+        self._counts[item_id] = count + 1
+        self._buckets.setdefault(count + 1, OrderedDict())[item_id] = None
+        if self._min_count == count and count not in self._buckets:
+            self._min_count = count + 1
+
+    def on_remove(self, item_id: str) -> None:
+        count = self._counts.pop(item_id, None)
+        if count is not None:
+            self._discard_from_bucket(item_id, count)
+
+    def _pop_victim(self) -> str | None:
+        if not self._counts:
+            return None
+
+        # Removals may empty the minimum bucket; re-derive it lazily
+        if self._min_count not in self._buckets:
+            self._min_count = min(self._buckets)
+
+        bucket = self._buckets[self._min_count]
+        item_id, _ = bucket.popitem(last=False)
+        if not bucket:
+            del self._buckets[self._min_count]
+        del self._counts[item_id]
+        return item_id
+
+    def _discard_from_bucket(self, item_id: str, count: int) -> None:
+        bucket = self._buckets[count]
+        del bucket[item_id]
+        if not bucket:
+            del self._buckets[count]
+
+    def _clear(self) -> None:
+        self._counts.clear()
+        self._buckets.clear()
+        self._min_count = 0
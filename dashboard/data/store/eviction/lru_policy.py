@@ -0,0 +1,33 @@
+from collections import OrderedDict
+
+from dashboard.data.store.eviction.eviction_policy import EvictionPolicy
+
+
+class LRUPolicy(EvictionPolicy):
+    """Evict the least recently inserted or read item."""
+
+    name = "lru"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._order: OrderedDict[str, None] = OrderedDict()
+
+    def on_insert(self, item_id: str) -> None:
+        self._order[item_id] = None
+        self._order.move_to_end(item_id)
+
+    def _touch(self, item_id: str) -> None:
+        if item_id in self._order:
+            self._order.move_to_end(item_id)
+
+    def on_remove(self, item_id: str) -> None:
+        self._order.pop(item_id, None)
+
+    def _pop_victim(self) -> str | None:
+        if not self._order:
+            return None
+        item_id, _ = self._order.popitem(last=False)
+        return item_id
+
+    def _clear(self) -> None:
+        self._order.clear()
@@ -0,0 +1,80 @@
+import heapq
+import time
+from collections.abc import Callable
+
+from dashboard.data.store.eviction.eviction_policy import EvictionPolicy
+
+# Rebuild the heap once stale entries outnumber live ones by this factor
+_HEAP_COMPACTION_RATIO = 2
+
+
+class TTLPolicy(EvictionPolicy):
+    """Expire items after a per-item time-to-live; evict the soonest to expire.
+
+    Deadlines sit in a heap with lazy deletion: re-inserts and removals only
+    update the deadline map, and stale heap entries are skipped when popped.
+    """
+
+    name = "ttl"
+    expires = True
+
+    def __init__(
+        self,
+        default_ttl_s: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__()
+        self._default_ttl_s = default_ttl_s
+        self._clock = clock
+        self._deadlines: dict[str, float] = {}
+        self._heap: list[tuple[float, str]] = []
+
+    def on_insert(self, item_id: str) -> None:
+        self.set_ttl(item_id, self._default_ttl_s)
+
+    def set_ttl(self, item_id: str, ttl_s: float) -> None:
+        """Set or refresh one item's time-to-live, starting now."""
+        deadline = self._clock() + ttl_s
+        self._deadlines[item_id] = deadline
+        heapq.heappush(self._heap, (deadline, item_id))
+        self._maybe_compact()
+
+    def on_remove(self, item_id: str) -> None:
+        self._deadlines.pop(item_id, None)
+
+    def is_expired(self, item_id: str) -> bool:
+        deadline = self._deadlines.get(item_id)
+        return deadline is not None and deadline <= self._clock()
+
+    def pop_expired(self) -> list[str]:
+        now = self._clock()
+        expired: list[str] = []
+        while self._heap and self._heap[0][0] <= now:
+            item_id = self._pop_live()
+            if item_id is not None:
+                expired.append(item_id)
+        self.evictions += len(expired)
+        return expired
+
+    def _pop_victim(self) -> str | None:
+        while self._heap:
+            item_id = self._pop_live()
+            if item_id is not None:
+                return item_id
+        return None
+
+    def _pop_live(self) -> str | None:
+        deadline, item_id = heapq.heappop(self._heap)
+        if self._deadlines.get(item_id) != deadline:
+            return None
+        del self._deadlines[item_id]
+        return item_id
+
+    def _maybe_compact(self) -> None:
+        if len(self._heap) > _HEAP_COMPACTION_RATIO * len(self._deadlines) + 64:
+            self._heap = [(d, item_id) for item_id, d in self._deadlines.items()]
+            heapq.heapify(self._heap)
+
+    def _clear(self) -> None:
+        self._deadlines.clear()
+        self._heap.clear()
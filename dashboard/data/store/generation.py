@@ -0,0 +1,10 @@
+from itertools import count
+
+# Shared by every store, so a generation never repeats even across store
+# instances, e.g. when a store is swapped for a fresh one
+_generations = count(1)
+
+
+def next_generation() -> int:
+    """Return a process-wide unique generation, larger than all earlier ones."""
+    return next(_generations)
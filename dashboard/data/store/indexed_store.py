@@ -0,0 +1,66 @@
+from collections.abc import Sequence
+from typing import Any, Protocol, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class IndexedStore(Protocol[T]):
+    """Index API shared by InMemoryStore and SQLiteStore, for backend-agnostic code."""
+
+    def get_by_index(self, index_name: str, value: Any) -> list[T]: ...
+
+    def get_by_range(
+        self,
+        field_name: str,
+        lo: Any = None,
+        hi: Any = None,
+    ) -> list[T]: ...
+
+    def get_by_composite(
+        self,
+        fields: tuple[str, ...],
+        prefix: tuple[Any, ...],
+        lo: Any = None,
+        hi: Any = None,
+    ) -> list[T]: ...
+
+    def sum_by(
+        self,
+        group_field: str,
+        sum_fields: tuple[str, ...],
+        range_field: str,
+        bounds: tuple[Any, Any] = (None, None),
+        filters: dict[str, Any] | None = None,
+    ) -> dict[Any, tuple[Any, ...]]: ...
+
+    def sum_by_windows(
+        self,
+        group_field: str,
+        sum_fields: tuple[str, ...],
+        range_field: str,
+        windows: Sequence[tuple[Any, Any]],
+        filters: dict[str, Any] | None = None,
+    ) -> dict[Any, list[tuple[Any, ...]]]: ...
+
+    def values_by(
+        self,
+        group_field: str,
+        value_fields: tuple[str, ...],
+        range_field: str,
+        bounds: tuple[Any, Any] = (None, None),
+    ) -> dict[Any, tuple[list[Any], list[tuple[Any, ...]]]]: ...
+
+    @property
+    def generation(self) -> int: ...
+
+    def add_index(self, field_name: str) -> None: ...
+
+    def add_range_index(self, field_name: str) -> None: ...
+
+    def add_composite_index(
+        self,
+        fields: tuple[str, ...],
+        unique: bool = False,
+    ) -> None: ...
@@ -0,0 +1,60 @@
+import threading
+from collections.abc import Iterable
+from typing import Protocol
+
+
+class BudgetedStore(Protocol):
+    def size_bytes(self) -> int: ...
+
+    def evict_bytes(self, target_bytes: int) -> int: ...
+
+    def attach_budget(self, budget: "MemoryBudget") -> None: ...
+
+
+class MemoryBudget:
+    """Process-wide byte budget shared by several stores.
+
+    When the stores together exceed the budget, the largest one gives up items
+    through its own eviction policy until the total fits again.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int | None,
+        stores: Iterable[BudgetedStore] = (),
+    ) -> None:
+        self._max_bytes = max_bytes
+        self._stores: list[BudgetedStore] = []
+        self._lock = threading.Lock()
+        for store in stores:
+            self.register(store)
+
+    @property
+    def max_bytes(self) -> int | None:
+        return self._max_bytes
+
+    def register(self, store: BudgetedStore) -> None:
+        if store not in self._stores:
+            self._stores.append(store)
+            store.attach_budget(self)
+
+    def total_bytes(self) -> int:
+        return sum(store.size_bytes() for store in self._stores)
+
+    def enforce(self) -> int:
+        """Evict from the largest stores until within budget; return bytes freed."""
+        if self._max_bytes is None:
+            return 0
+
+        freed = 0
+        with self._lock:
+            excess = self.total_bytes() - self._max_bytes
+            while excess > 0:
+                largest = max(self._stores, key=lambda store: store.size_bytes())
+                released = largest.evict_bytes(excess)
+                if released <= 0:
+                    break
+                freed += released
+                excess -= released
+
+        return freed
@@ -1,44 +1,196 @@
+import builtins
+import gc
+from collections.abc import Iterable, Sequence
+from itertools import chain, islice
 from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel
 
+from dashboard.data.store.composite_index import CompositeIndex
+from dashboard.data.store.eviction import (
+    EvictionPolicy,
+    EvictionStatsSchema,
+    FIFOPolicy,
+)
+from dashboard.data.store.generation import next_generation
+from dashboard.data.store.memory_budget import MemoryBudget
+from dashboard.data.store.persistence import LogOperationEnum, StorePersistence
+from dashboard.data.store.posting_list import PostingList
+from dashboard.data.store.prefix_sum_index import PrefixSumIndex
+from dashboard.data.store.quantile_index import QuantileIndex
+from dashboard.data.store.quantile_sketch import QuantileSketch
+from dashboard.data.store.query_planner import QueryPlanner, QueryPlanSchema
+from dashboard.data.store.range_index import RangeIndex
+from dashboard.data.store.rollup_index import RollupIndex
+from dashboard.data.store.rw_lock import ReadWriteLock, read_locked, write_locked
+from dashboard.data.store.sizing import estimate_size_bytes
+
 T = TypeVar("T", bound=BaseModel)
 
 
 class InMemoryStore(Generic[T]):
-    def __init__(self, id_field: str = "id", max_items: int = 10000) -> None:
+    """Dict-backed store with secondary indexes, safe to share across threads.
+
+    Each store has its own readers-writer lock: lookups run concurrently and
+    mutations (including index maintenance and eviction) are exclusive, so a
+    reader never observes an item half-way through an update.
+    """
+
+    def __init__(
+        self,
+        id_field: str = "id",
+        max_items: int | None = 10000,
+        eviction_policy: EvictionPolicy | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
         self._data: dict[str, T] = {}
         self._id_field = id_field
-        self._indices: dict[str, dict[Any, list[str]]] = {}
-        self._max_items = max_items  # Memory limit
+        self._indices: dict[str, dict[Any, PostingList]] = {}
+        self._range_indices: dict[str, RangeIndex] = {}
+        self._composite_indices: dict[tuple[str, ...], CompositeIndex] = {}
+        self._prefix_sum_indices: dict[
+            tuple[str, str, tuple[str, ...]],
+            PrefixSumIndex,
+        ] = {}
+        self._rollup_indices: dict[str, RollupIndex] = {}
+        self._quantile_indices: dict[str, QuantileIndex] = {}
+        self._max_items = max_items  # Memory limits; None disables either one
+        self._max_bytes = max_bytes
+        self._sizes: dict[str, int] = {}
+        self._size_bytes = 0
+        self._budget: MemoryBudget | None = None
+        self._policy = eviction_policy or FIFOPolicy()
+        self._lock = ReadWriteLock()
+        self._persistence: StorePersistence | None = None
+        self._generation = next_generation()
+        self._planner = QueryPlanner(
+            self._indices,
+            self._range_indices,
+            self._composite_indices,
+            self.count,
+        )
 
     def add(self, item: T) -> T:
+        with self._lock.write():
+            item = self._insert(item)
+            self._record(LogOperationEnum.ADD, [item])
+        self._enforce_budget()
+        return item
+
+    def _insert(self, item: T) -> T:
         item_id = getattr(item, self._id_field)
+
+        # Unique composite keys upsert: the new item takes over the owner's ID
+        owner_id = self._find_unique_owner(item)
+        if owner_id is not None and owner_id != item_id:
+            item = item.model_copy(update={self._id_field: owner_id})
+            item_id = owner_id
+
+        if item_id in self._data:
+            self._remove_from_indices(self._data[item_id])
+
         self._data[item_id] = item
         self._update_indices(item)
+        self._account(item_id, item)
+        self._policy.on_insert(item_id)
         self._check_memory_limit()
         return item
 
+    @read_locked
     def get(self, item_id: str) -> T | None:
-        return self._data.get(item_id)
+        item = self._data.get(item_id)
+        if item is None or self._is_expired(item_id):
+            self._policy.on_miss()
+            return None
+
+        self._policy.on_access(item_id)
+        return item
 
+    @read_locked
     def get_by_index(self, index_name: str, value: Any) -> list[T]:
         if index_name not in self._indices:
             return []
 
-        item_ids = self._indices[index_name].get(value, [])
-        return [self._data[item_id] for item_id in item_ids if item_id in self._data]
+        item_ids = self._indices[index_name].get(value, ())
+        return self._materialize(item_ids)
 
-    def list(self, filters: dict[str, Any] | None = None) -> list[T]:
-        items = list(self._data.values())
+    @read_locked
+    def get_by_range(
+        self,
+        field_name: str,
+        lo: Any = None,
+        hi: Any = None,
+    ) -> list[T]:
+        """Return items with lo <= field <= hi, ascending; None means unbounded."""
+        if field_name not in self._range_indices:
+            return []
+
+        item_ids = self._range_indices[field_name].range(lo, hi)
+        return self._materialize(item_ids)
+
+    @read_locked
+    def get_ordered(
+        self,
+        field_name: str,
+        descending: bool = False,
+        limit: int | None = None,
+    ) -> list[T]:
+        """Return items ordered by a range-indexed field, optionally truncated."""
+        if field_name not in self._range_indices:
+            return []
+
+        range_index = self._range_indices[field_name]
+        if not self._policy.expires:
+            return self._materialize(range_index.ordered(descending, limit))
+
+        # Expired items are skipped, so the limit applies after filtering
+        live_ids = (
+            item_id
+            for item_id in range_index.ordered(descending)
+            if not self._policy.is_expired(item_id)
+        )
+        return self._materialize(islice(live_ids, limit))
+
+    @read_locked
+    def get_by_composite(
+        self,
+        fields: tuple[str, ...],
+        prefix: tuple[Any, ...],
+        lo: Any = None,
+        hi: Any = None,
+    ) -> list[T]:
+        """Return items equal on the leading fields and in range on the last."""
+        if fields not in self._composite_indices:
+            return []
 
+        item_ids = self._composite_indices[fields].range(prefix, lo, hi)
+        return self._materialize(item_ids)
+
+    @read_locked
+    def list(self, filters: dict[str, Any] | None = None) -> list[T]:
         if not filters:
-            return items
+            if self._policy.expires:
+                # Expired items are dropped on the next write; hide them until then
+                return [
+                    item
+                    for item_id, item in self._data.items()
+                    if not self._policy.is_expired(item_id)
+                ]
+            return list(self._data.values())
+
+        plan, candidate_ids = self._planner.plan(filters)
+        items = (
+            self.list() if candidate_ids is None else self._materialize(candidate_ids)
+        )
+
+        residual = [(key, filters[key]) for key in plan.residual_fields]
+        if not residual:
+            return list(items)
 
         result = []
         for item in items:
             match = True
-            for key, value in filters.items():
+            for key, value in residual:
                 if not hasattr(item, key) or getattr(item, key) != value:
                     match = False
                     break
@@ -47,12 +199,203 @@ class InMemoryStore(Generic[T]):
 
         return result
 
+    @read_locked
+    def sum_by(
+        self,
+        group_field: str,
+        sum_fields: tuple[str, ...],
+        range_field: str,
+        bounds: tuple[Any, Any] = (None, None),
+        filters: dict[str, Any] | None = None,
+    ) -> dict[Any, tuple[Any, ...]]:
+        """Sum fields per group over an inclusive window on range_field.
+
+        Same contract as SQLiteStore.sum_by: bounds is (lo, hi) with None
+        unbounded, filters are equalities, and each tuple holds the sums
+        followed by the row count. A matching prefix sum index answers each
+        group with two bisects; anything else falls back to a scan.
+        """
+        lo, hi = bounds
+        index, filters = self._sums_index(group_field, sum_fields, range_field, filters)
+        try:
+            if filters:
+                group = filters[group_field]
+                totals = index.totals(group, lo, hi)
+                return {group: totals} if totals is not None else {}
+            return dict(index.all_totals(lo, hi))
+        except TypeError:
+            # Unhashable group or bounds not comparable with the stored values
+            return {}
+
+    @read_locked
+    def sum_by_windows(
+        self,
+        group_field: str,
+        sum_fields: tuple[str, ...],
+        range_field: str,
+        windows: Sequence[tuple[Any, Any]],
+        filters: dict[str, Any] | None = None,
+    ) -> dict[Any, builtins.list[tuple[Any, ...]]]:
+        """Sum fields per group over several windows in one pass.
+
+        Same contract as SQLiteStore.sum_by_windows: one sum_by tuple per
+        window, zeros where a group has no rows in it.
+        """
+        index, filters = self._sums_index(group_field, sum_fields, range_field, filters)
+        try:
+            if filters:
+                group = filters[group_field]
+                totals = index.window_totals(group, windows)
+                return {group: totals} if totals is not None else {}
+            return dict(index.all_window_totals(windows))
+        except TypeError:
+            return {}
+
+    def _sums_index(
+        self,
+        group_field: str,
+        sum_fields: tuple[str, ...],
+        range_field: str,
+        filters: dict[str, Any] | None,
+    ) -> tuple[PrefixSumIndex, dict[str, Any] | None]:
+        """Return a prefix sum index to answer from and the filters left for it.
+
+        A matching index answers directly; anything else is first scanned
+        into a temporary index, which then needs no filtering.
+        """
+        index = self._prefix_sum_indices.get((group_field, range_field, sum_fields))
+        only_group = not filters or filters.keys() == {group_field}
+        if index is None or not only_group or self._policy.expires:
+            index = PrefixSumIndex(group_field, range_field, sum_fields)
+            matches = {
+                getattr(item, self._id_field): item for item in self.list(filters)
+            }
+            self._index_aggregates(index, matches)
+            return index, None
+        return index, filters
+
+    @read_locked
+    def values_by(
+        self,
+        group_field: str,
+        value_fields: tuple[str, ...],
+        range_field: str,
+        bounds: tuple[Any, Any] = (None, None),
+    ) -> dict[Any, tuple[builtins.list[Any], builtins.list[tuple[Any, ...]]]]:
+        """Return each group's range values and field values in a window.
+
+        Same contract as SQLiteStore.values_by. A matching prefix sum index
+        lists the rows without reading any item; anything else falls back to
+        a scan.
+        """
+        lo, hi = bounds
+        index = self._prefix_sum_indices.get((group_field, range_field, value_fields))
+        if index is None or self._policy.expires:
+            index = PrefixSumIndex(group_field, range_field, value_fields)
+            matches = {getattr(item, self._id_field): item for item in self.list()}
+            self._index_aggregates(index, matches)
+        try:
+            return {
+                group: (orders, values) for group, orders, values in index.rows(lo, hi)
+            }
+        except TypeError:
+            # Bounds not comparable with the stored values
+            return {}
+
+    @read_locked
+    def get_rollups(
+        self,
+        name: str,
+        group: Any,
+        buckets: Iterable[Any],
+    ) -> dict[Any, tuple[Any, ...]]:
+        """Return the non-empty buckets' sums plus row counts from a rollup index."""
+        rollup_index = self._rollup_indices.get(name)
+        if rollup_index is None:
+            return {}
+
+        # Expired rows stay in the rollups until purged, so scan them instead
+        if self._policy.expires:
+            fresh = RollupIndex(
+                rollup_index.group_field,
+                rollup_index.order_field,
+                rollup_index.value_fields,
+                rollup_index.bucket_of,
+            )
+            matches = {
+                getattr(item, self._id_field): item
+                for item in self.list({rollup_index.group_field: group})
+            }
+            self._index_aggregates(fresh, matches)
+            rollup_index = fresh
+
+        found = {}
+        for bucket in buckets:
+            totals = rollup_index.totals(group, bucket)
+            if totals is not None:
+                found[bucket] = totals
+        return found
+
+    @read_locked
+    def merge_quantile_sketches(
+        self,
+        name: str,
+        group: Any,
+        buckets: Iterable[Any],
+    ) -> tuple[QuantileSketch, ...] | None:
+        """Merge a quantile index's sketches over buckets, for one or all groups.
+
+        group None merges every group. Returns None if no bucket has rows.
+        """
+        quantile_index = self._quantile_indices.get(name)
+        if quantile_index is None:
+            return None
+
+        # Expired rows stay in the sketches until purged, so scan them instead
+        if self._policy.expires:
+            fresh = quantile_index.empty_copy()
+            filters = None if group is None else {quantile_index.group_field: group}
+            matches = {
+                getattr(item, self._id_field): item for item in self.list(filters)
+            }
+            self._index_aggregates(fresh, matches)
+            quantile_index = fresh
+
+        merged: tuple[QuantileSketch, ...] | None = None
+        for bucket in buckets:
+            sketches = quantile_index.sketches(group, bucket)
+            if sketches is None:
+                continue
+            if merged is None:
+                merged = tuple(sketch.copy() for sketch in sketches)
+            else:
+                for total, sketch in zip(merged, sketches, strict=True):
+                    total.update(sketch)
+        return merged
+
+    @read_locked
+    def explain(self, filters: dict[str, Any]) -> QueryPlanSchema:
+        """Report which access path list(filters) would take."""
+        plan, _ = self._planner.plan(filters)
+        return plan
+
     def update(self, item_id: str, data: dict[str, Any]) -> T | None:
-        if item_id not in self._data:
+        with self._lock.write():
+            item = self._apply_update(item_id, data)
+            if item is not None:
+                self._record(LogOperationEnum.UPDATE, {item_id: data})
+        self._enforce_budget()
+        return item
+
+    def _apply_update(self, item_id: str, data: dict[str, Any]) -> T | None:
+        if item_id not in self._data or self._is_expired(item_id):
             return None
 
         item = self._data[item_id]
 
+        # Refuse updates that would collide on a unique composite key
+        self._check_unique_update(item_id, item, data)
+
         # Remove from indices before update
         self._remove_from_indices(item)
 
@@ -63,47 +406,429 @@ class InMemoryStore(Generic[T]):
 
         # Re-add to indices
         self._update_indices(item)
+        self._account(item_id, item)
+        self._policy.on_access(item_id)
+        self._check_memory_limit()
         return item
 
+    @write_locked
     def delete(self, item_id: str) -> bool:
         if item_id not in self._data:
             return False
 
-        item = self._data[item_id]
-        self._remove_from_indices(item)
-        del self._data[item_id]
+        self._policy.on_remove(item_id)
+        self._discard(item_id)
+        self._record(LogOperationEnum.DELETE, [item_id])
         return True
 
+    def add_many(self, items: Iterable[T]) -> builtins.list[T]:
+        """Add a batch with one grouped pass per index and one eviction check.
+
+        Items sharing an ID or a unique composite key collapse to the last one,
+        exactly as if they had been added one by one.
+        """
+        with self._lock.write():
+            stored = self._insert_many(items)
+            if stored:
+                self._record(LogOperationEnum.ADD, stored)
+        self._enforce_budget()
+        return stored
+
+    def update_many(
+        self,
+        updates: dict[str, dict[str, Any]],
+    ) -> builtins.list[T]:
+        """Apply field updates to many items; missing IDs are skipped.
+
+        Unique-key collisions are checked for the whole batch before anything
+        is mutated, so a rejected batch leaves the store untouched.
+        """
+        with self._lock.write():
+            updated = self._apply_updates(updates)
+            if updated:
+                self._record(LogOperationEnum.UPDATE, updates)
+        self._enforce_budget()
+        return updated
+
+    @write_locked
+    def delete_many(self, item_ids: Iterable[str]) -> int:
+        """Delete many items by ID and return how many existed."""
+        deleted = self._delete_many(item_ids)
+        if deleted:
+            self._record(LogOperationEnum.DELETE, deleted)
+        return len(deleted)
+
     def count(self) -> int:
         return len(self._data)
 
+    def size_bytes(self) -> int:
+        """Approximate resident size of the stored items."""
+        return self._size_bytes
+
+    @property
+    def generation(self) -> int:
+        """Number that grows on every change to the items, eviction included.
+
+        Results computed from the store stay valid while it is unchanged. With
+        a TTL policy items expire without a write, so every read gets a new
+        generation and nothing derived from the store is ever reused.
+        """
+        if self._policy.expires:
+            return next_generation()
+        return self._generation
+
+    @write_locked
     def clear(self) -> None:
+        self._clear()
+        self._record(LogOperationEnum.CLEAR, None)
+
+    @write_locked
+    def enable_persistence(self, persistence: StorePersistence) -> None:
+        """Restore the snapshot and log tail, then log every later mutation.
+
+        Eviction is not logged: items evicted before a restart come back on
+        replay and the size limits evict them again.
+        """
+        # Loading allocates millions of objects that all survive; pause the
+        # cyclic GC so it does not rescan them after every generation fills
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            snapshot = persistence.load_snapshot()
+            if snapshot is not None:
+                encoded, sizes = snapshot
+                decode = persistence.codec.decode
+                self._restore([decode(values) for values in encoded], sizes)
+
+            for operation, payload in persistence.replay():
+                self._replay(operation, payload, persistence)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+        self._persistence = persistence
+
+    @write_locked
+    def save_snapshot(self) -> None:
+        """Compact the log into a snapshot now instead of waiting for its size."""
+        if self._persistence is None:
+            raise RuntimeError("Persistence is not enabled for this store")
+        self._save_snapshot(self._persistence)
+
+    def _clear(self) -> None:
+        self._generation = next_generation()
         self._data.clear()
+        self._sizes.clear()
+        self._size_bytes = 0
+        self._policy.clear()
         for index in self._indices.values():
             index.clear()
+        for range_index in self._range_indices.values():
+            range_index.clear()
+        for composite_index in self._composite_indices.values():
+            composite_index.clear()
+        for aggregate_index in self._aggregate_indices():
+            aggregate_index.clear()
 
+    @write_locked
     def add_index(self, field_name: str) -> None:
         if field_name in self._indices:
             return
 
-        self._indices[field_name] = {}
+        index: dict[Any, PostingList] = {}
+        self._indices[field_name] = index
 
         # Populate the new index with existing data
-        for item in self._data.values():
+        for item_id, item in self._data.items():
             if hasattr(item, field_name):
                 value = getattr(item, field_name)
-                if value not in self._indices[field_name]:
-                    self._indices[field_name][value] = []
+                if value not in index:
+                    index[value] = PostingList()
+                index[value].add(item_id)
+
+    @write_locked
+    def add_range_index(self, field_name: str) -> None:
+        if field_name in self._range_indices:
+            return
+
+        range_index = RangeIndex()
+        self._range_indices[field_name] = range_index
+
+        # Populate the new index with existing data
+        for item_id, item in self._data.items():
+            if hasattr(item, field_name):
+                range_index.add(item_id, getattr(item, field_name))
+
+    @write_locked
+    def add_composite_index(
+        self,
+        fields: tuple[str, ...],
+        unique: bool = False,
+    ) -> None:
+        if fields in self._composite_indices:
+            return
+
+        composite_index = CompositeIndex(fields, unique=unique)
+
+        # Populate the new index with existing data; duplicates raise for unique
+        for item_id, item in self._data.items():
+            key = composite_index.key_of(item)
+            if key is not None:
+                composite_index.add(item_id, key)
+
+        self._composite_indices[fields] = composite_index
+
+    @write_locked
+    def add_prefix_sum_index(
+        self,
+        group_field: str,
+        order_field: str,
+        value_fields: tuple[str, ...],
+    ) -> None:
+        """Keep running totals of value_fields per group_field, by order_field."""
+        key = (group_field, order_field, value_fields)
+        if key in self._prefix_sum_indices:
+            return
+
+        prefix_sum_index = PrefixSumIndex(group_field, order_field, value_fields)
+        self._prefix_sum_indices[key] = prefix_sum_index
+
+        # Populate the new index with existing data
+        self._index_aggregates(prefix_sum_index, self._data)
+
+    @write_locked
+    def add_rollup_index(self, name: str, rollup_index: RollupIndex) -> None:
+        """Maintain bucketed totals under name, e.g. weekly sums per campaign."""
+        if name in self._rollup_indices:
+            return
+
+        self._rollup_indices[name] = rollup_index
+
+        # Populate the new index with existing data
+        self._index_aggregates(rollup_index, self._data)
+
+    @write_locked
+    def add_quantile_index(self, name: str, quantile_index: QuantileIndex) -> None:
+        """Maintain bucketed quantile sketches under name, e.g. monthly CPC."""
+        if name in self._quantile_indices:
+            return
+
+        self._quantile_indices[name] = quantile_index
 
-                item_id = getattr(item, self._id_field)
-                if item_id not in self._indices[field_name][value]:
-                    self._indices[field_name][value].append(item_id)
+        # Populate the new index with existing data
+        self._index_aggregates(quantile_index, self._data)
 
-    def set_max_items(self, max_items: int) -> None:
+    @write_locked
+    def set_max_items(self, max_items: int | None) -> None:
         self._max_items = max_items
         self._check_memory_limit()
 
+    @write_locked
+    def set_max_bytes(self, max_bytes: int | None) -> None:
+        self._max_bytes = max_bytes
+        self._check_memory_limit()
+
+    def attach_budget(self, budget: MemoryBudget) -> None:
+        """Share a global byte budget with other stores."""
+        self._budget = budget
+
+    @write_locked
+    def evict_bytes(self, target_bytes: int) -> int:
+        """Evict by policy until target_bytes are freed; return bytes freed."""
+        freed = 0
+        while freed < target_bytes:
+            victim_id = self._policy.evict()
+            if victim_id is None:
+                break
+            freed += self._sizes.get(victim_id, 0)
+            self._discard(victim_id)
+        return freed
+
+    @write_locked
+    def purge_expired(self) -> int:
+        """Drop items whose TTL has passed and return how many were removed."""
+        expired = self._policy.pop_expired()
+        for item_id in expired:
+            self._discard(item_id)
+        return len(expired)
+
+    @property
+    def eviction_policy(self) -> EvictionPolicy:
+        return self._policy
+
+    def eviction_stats(self) -> EvictionStatsSchema:
+        return self._policy.stats()
+
+    def _materialize(self, item_ids: Iterable[str]) -> builtins.list[T]:
+        """Resolve index hits to items, recording each read with the policy."""
+        policy = self._policy
+        items = []
+        for item_id in item_ids:
+            item = self._data.get(item_id)
+            if item is None or (policy.expires and policy.is_expired(item_id)):
+                continue
+            policy.on_access(item_id)
+            items.append(item)
+        return items
+
+    def _delete_many(self, item_ids: Iterable[str]) -> builtins.list[str]:
+        present = [
+            item_id for item_id in dict.fromkeys(item_ids) if item_id in self._data
+        ]
+        for item_id in present:
+            self._policy.on_remove(item_id)
+        self._discard_many(present)
+        return present
+
+    def _insert_many(self, items: Iterable[T]) -> builtins.list[T]:
+        unique_indices = [ci for ci in self._composite_indices.values() if ci.unique]
+        batch_owners: dict[tuple[Any, ...], str] = {}
+        batch: dict[str, T] = {}
+
+        # Resolve unique-key upserts against the store and earlier batch rows
+        for incoming in items:
+            item = incoming
+            item_id = getattr(item, self._id_field)
+            for composite_index in unique_indices:
+                key = composite_index.key_of(item)
+                if key is None:
+                    continue
+                owner_id = batch_owners.get((composite_index.fields, *key))
+                if owner_id is None:
+                    owner_id = composite_index.find(key)
+                if owner_id in batch and composite_index.key_of(batch[owner_id]) != key:
+                    # The owner was re-keyed earlier in this batch
+                    owner_id = None
+                if owner_id is not None and owner_id != item_id:
+                    item = item.model_copy(update={self._id_field: owner_id})
+                    item_id = owner_id
+                batch_owners[(composite_index.fields, *key)] = item_id
+            batch[item_id] = item
+
+        replaced = {
+            item_id: self._data[item_id] for item_id in batch if item_id in self._data
+        }
+        self._unindex_many(replaced)
+
+        self._data.update(batch)
+        self._index_many(batch)
+        for item_id, item in batch.items():
+            self._account(item_id, item)
+            self._policy.on_insert(item_id)
+
+        self._check_memory_limit()
+        return list(batch.values())
+
+    def _apply_updates(
+        self,
+        updates: dict[str, dict[str, Any]],
+    ) -> builtins.list[T]:
+        targets = {
+            item_id: self._data[item_id]
+            for item_id in updates
+            if item_id in self._data and not self._is_expired(item_id)
+        }
+        self._check_unique_updates(targets, updates)
+
+        self._unindex_many(targets)
+        for item_id, item in targets.items():
+            for key, value in updates[item_id].items():
+                if hasattr(item, key):
+                    setattr(item, key, value)
+        self._index_many(targets)
+
+        for item_id, item in targets.items():
+            self._account(item_id, item)
+            self._policy.on_access(item_id)
+
+        self._check_memory_limit()
+        return list(targets.values())
+
+    def _index_many(self, items: dict[str, T]) -> None:
+        self._generation = next_generation()
+        for field_name, index in self._indices.items():
+            groups: dict[Any, builtins.list[str]] = {}
+            for item_id, item in items.items():
+                if hasattr(item, field_name):
+                    groups.setdefault(getattr(item, field_name), []).append(item_id)
+
+            for value, item_ids in groups.items():
+                bucket = index.get(value)
+                if bucket is None:
+                    bucket = index[value] = PostingList()
+                bucket.update(item_ids)
+
+        for field_name, range_index in self._range_indices.items():
+            range_index.add_many(
+                (item_id, getattr(item, field_name))
+                for item_id, item in items.items()
+                if hasattr(item, field_name)
+            )
+
+        for composite_index in self._composite_indices.values():
+            keyed = (
+                (item_id, composite_index.key_of(item))
+                for item_id, item in items.items()
+            )
+            composite_index.add_many(
+                (item_id, key) for item_id, key in keyed if key is not None
+            )
+
+        for aggregate_index in self._aggregate_indices():
+            self._index_aggregates(aggregate_index, items)
+
+    def _unindex_many(self, items: dict[str, T]) -> None:
+        if not items:
+            return
+        self._generation = next_generation()
+
+        for range_index in self._range_indices.values():
+            range_index.discard_many(items)
+
+        for composite_index in self._composite_indices.values():
+            composite_index.discard_many(items)
+
+        for aggregate_index in self._aggregate_indices():
+            aggregate_index.discard_many(items)
+
+        for field_name, index in self._indices.items():
+            for item_id, item in items.items():
+                if not hasattr(item, field_name):
+                    continue
+                value = getattr(item, field_name)
+                bucket = index.get(value)
+                if bucket is not None:
+                    bucket.discard(item_id)
+                    if not bucket:
+                        del index[value]
+
+    def _discard_many(self, item_ids: Iterable[str]) -> None:
+        removed = {item_id: self._data.pop(item_id) for item_id in item_ids}
+        self._unindex_many(removed)
+        for item_id in removed:
+            self._size_bytes -= self._sizes.pop(item_id, 0)
+
+    def _is_expired(self, item_id: str) -> bool:
+        return self._policy.expires and self._policy.is_expired(item_id)
+
+    def _discard(self, item_id: str) -> T:
+        item = self._data.pop(item_id)
+        self._remove_from_indices(item)
+        self._size_bytes -= self._sizes.pop(item_id, 0)
+        return item
+
+    def _account(self, item_id: str, item: T) -> None:
+        size = estimate_size_bytes(item)
+        self._size_bytes += size - self._sizes.get(item_id, 0)
+        self._sizes[item_id] = size
+
+    def _over_limit(self) -> bool:
+        if self._max_items is not None and len(self._data) > self._max_items:
+            return True
+        return self._max_bytes is not None and self._size_bytes > self._max_bytes
+
     def _update_indices(self, item: T) -> None:
+        self._generation = next_generation()
         item_id = getattr(item, self._id_field)
 
         for field_name, index in self._indices.items():
@@ -111,28 +836,193 @@ class InMemoryStore(Generic[T]):
                 value = getattr(item, field_name)
 
                 if value not in index:
-                    index[value] = []
+                    index[value] = PostingList()
 
-                if item_id not in index[value]:
-                    index[value].append(item_id)
+                index[value].add(item_id)
+
+        for field_name, range_index in self._range_indices.items():
+            if hasattr(item, field_name):
+                range_index.add(item_id, getattr(item, field_name))
+
+        for composite_index in self._composite_indices.values():
+            key = composite_index.key_of(item)
+            if key is not None:
+                composite_index.add(item_id, key)
+
+        for aggregate_index in self._aggregate_indices():
+            entry = aggregate_index.entry_of(item)
+            if entry is not None:
+                aggregate_index.add(item_id, entry)
 
     def _remove_from_indices(self, item: T) -> None:
+        self._generation = next_generation()
         item_id = getattr(item, self._id_field)
 
+        for range_index in self._range_indices.values():
+            range_index.discard(item_id)
+
+        for composite_index in self._composite_indices.values():
+            composite_index.discard(item_id)
+
+        for aggregate_index in self._aggregate_indices():
+            aggregate_index.discard(item_id)
+
         for field_name, index in self._indices.items():
             if hasattr(item, field_name):
                 value = getattr(item, field_name)
 
-                if value in index and item_id in index[value]:
-                    index[value].remove(item_id)
+                bucket = index.get(value)
+                if bucket is not None and item_id in bucket:
+                    bucket.discard(item_id)
 
-                    # Clean up empty lists
-                    if not index[value]:
+                    # Clean up empty buckets
+                    if not bucket:
                         del index[value]
 
+    def _aggregate_indices(
+        self,
+    ) -> Iterable[PrefixSumIndex | RollupIndex | QuantileIndex]:
+        return chain(
+            self._prefix_sum_indices.values(),
+            self._rollup_indices.values(),
+            self._quantile_indices.values(),
+        )
+
+    @staticmethod
+    def _index_aggregates(
+        aggregate_index: PrefixSumIndex | RollupIndex | QuantileIndex,
+        items: dict[str, T],
+    ) -> None:
+        entries = (
+            (item_id, aggregate_index.entry_of(item)) for item_id, item in items.items()
+        )
+        aggregate_index.add_many(
+            (item_id, entry) for item_id, entry in entries if entry is not None
+        )
+
+    def _find_unique_owner(self, item: T) -> str | None:
+        for composite_index in self._composite_indices.values():
+            if not composite_index.unique:
+                continue
+
+            key = composite_index.key_of(item)
+            owner_id = composite_index.find(key) if key is not None else None
+            if owner_id is not None:
+                return owner_id
+
+        return None
+
+    def _check_unique_update(self, item_id: str, item: T, data: dict[str, Any]) -> None:
+        if not any(index.unique for index in self._composite_indices.values()):
+            return
+
+        changes = {key: value for key, value in data.items() if hasattr(item, key)}
+        owner_id = self._find_unique_owner(item.model_copy(update=changes))
+        if owner_id is not None and owner_id != item_id:
+            raise ValueError(f"Update of {item_id} collides with item {owner_id}")
+
+    def _check_unique_updates(
+        self,
+        targets: dict[str, T],
+        updates: dict[str, dict[str, Any]],
+    ) -> None:
+        unique_indices = [ci for ci in self._composite_indices.values() if ci.unique]
+        if not unique_indices:
+            return
+
+        claimed: dict[tuple[Any, ...], str] = {}
+        for item_id, item in targets.items():
+            changes = {
+                key: value
+                for key, value in updates[item_id].items()
+                if hasattr(item, key)
+            }
+            preview = item.model_copy(update=changes)
+            for composite_index in unique_indices:
+                key = composite_index.key_of(preview)
+                if key is None:
+                    continue
+                # Owners inside the batch are re-keyed too; only the final state counts
+                owner_id = claimed.get((composite_index.fields, *key))
+                if owner_id is None:
+                    owner_id = composite_index.find(key)
+                    if owner_id in targets:
+                        owner_id = None
+                if owner_id is not None and owner_id != item_id:
+                    raise ValueError(
+                        f"Update of {item_id} collides with item {owner_id}",
+                    )
+                claimed[(composite_index.fields, *key)] = item_id
+
     def _check_memory_limit(self) -> None:
-        if len(self._data) > self._max_items:
-            # Simple strategy: remove oldest items (assuming ordered insertion)
-            items_to_remove = len(self._data) - self._max_items
-            for item_id in list(self._data.keys())[:items_to_remove]:
-                self.delete(item_id)
+        if self._policy.expires:
+            self.purge_expired()
+
+        if not self._over_limit():
+            return
+
+        # Pick every victim first so the indexes are rewritten in one pass
+        excess_items = (
+            len(self._data) - self._max_items if self._max_items is not None else 0
+        )
+        excess_bytes = (
+            self._size_bytes - self._max_bytes if self._max_bytes is not None else 0
+        )
+        victims: builtins.list[str] = []
+        while excess_items > 0 or excess_bytes > 0:
+            victim_id = self._policy.evict()
+            if victim_id is None:
+                break
+            victims.append(victim_id)
+            excess_items -= 1
+            excess_bytes -= self._sizes.get(victim_id, 0)
+
+        self._discard_many(victims)
+
+    def _restore(self, items: builtins.list[T], sizes: builtins.list[int]) -> None:
+        # Snapshot items are consistent and already sized: skip upserts and sizing
+        batch = {getattr(item, self._id_field): item for item in items}
+        self._data.update(batch)
+        self._index_many(batch)
+        for item_id, size in zip(batch, sizes, strict=True):
+            self._size_bytes += size - self._sizes.get(item_id, 0)
+            self._sizes[item_id] = size
+            self._policy.on_insert(item_id)
+        self._check_memory_limit()
+
+    def _replay(
+        self,
+        operation: LogOperationEnum,
+        payload: Any,
+        persistence: StorePersistence,
+    ) -> None:
+        if operation is LogOperationEnum.ADD:
+            decode = persistence.codec.decode
+            self._insert_many(decode(values) for values in payload)
+        elif operation is LogOperationEnum.UPDATE:
+            self._apply_updates(payload)
+        elif operation is LogOperationEnum.DELETE:
+            self._delete_many(payload)
+        else:
+            self._clear()
+
+    def _record(self, operation: LogOperationEnum, payload: Any) -> None:
+        """Append a mutation to the log, compacting it into a snapshot when due."""
+        persistence = self._persistence
+        if persistence is None:
+            return
+
+        persistence.log(operation, payload)
+        if persistence.should_compact():
+            self._save_snapshot(persistence)
+
+    def _save_snapshot(self, persistence: StorePersistence) -> None:
+        persistence.compact(
+            list(self._data.values()),
+            [self._sizes[item_id] for item_id in self._data],
+        )
+
+    def _enforce_budget(self) -> None:
+        # Runs outside this store's lock: the budget may evict from other stores
+        if self._budget is not None:
+            self._budget.enforce()
@@ -0,0 +1,13 @@
+from dashboard.data.store.persistence.fsync_policy import FsyncPolicyEnum
+from dashboard.data.store.persistence.log_operation import LogOperationEnum
+from dashboard.data.store.persistence.model_codec import ModelCodec
+from dashboard.data.store.persistence.store_persistence import StorePersistence
+from dashboard.data.store.persistence.write_ahead_log import WriteAheadLog
+
+__all__ = [
+    "FsyncPolicyEnum",
+    "LogOperationEnum",
+    "ModelCodec",
+    "StorePersistence",
+    "WriteAheadLog",
+]
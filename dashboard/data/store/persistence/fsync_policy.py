@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class FsyncPolicyEnum(str, Enum):
+    """When appended log records are forced from the OS cache to disk."""
+
+    ALWAYS = "always"  # fsync every record; survives power loss, slowest
+    INTERVAL = "interval"  # fsync at most once per interval; may lose that window
+    NEVER = "never"  # leave it to the OS; survives process crashes only
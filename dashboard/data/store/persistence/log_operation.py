@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class LogOperationEnum(str, Enum):
+    """Mutation kinds recorded in a store's write-ahead log."""
+
+    ADD = "add"
+    UPDATE = "update"
+    DELETE = "delete"
+    CLEAR = "clear"
@@ -0,0 +1,81 @@
+import types
+from collections.abc import Callable
+from typing import Any, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+_Codec = tuple[Callable[[Any], Any], Callable[[Any], Any]]
+
+_new_object = object.__new__
+_set_attribute = object.__setattr__
+
+
+class ModelCodec:
+    """Flatten a pydantic model to a tuple of plain values and back.
+
+    Tuples pickle several times faster than models, and decoding skips
+    validation because only data this codec encoded is ever decoded. Nested
+    models (directly, in lists or optional) are flattened recursively; every
+    field is treated as explicitly set on decode.
+    """
+
+    def __init__(self, model: type[BaseModel]) -> None:
+        self.model = model
+        self._names = tuple(model.model_fields)
+        self._fields = [
+            (name, _field_codec(field.annotation))
+            for name, field in model.model_fields.items()
+        ]
+        self._nested = [(name, codec[1]) for name, codec in self._fields if codec]
+
+    def encode(self, item: BaseModel) -> tuple[Any, ...]:
+        values = item.__dict__
+        return tuple(
+            values[name] if codec is None else codec[0](values[name])
+            for name, codec in self._fields
+        )
+
+    def decode(self, values: tuple[Any, ...]) -> Any:
+        fields = dict(zip(self._names, values, strict=True))
+        for name, decode in self._nested:
+            fields[name] = decode(fields[name])
+
+        item = _new_object(self.model)
+        _set_attribute(item, "__dict__", fields)
+        _set_attribute(item, "__pydantic_fields_set__", set(self._names))
+        _set_attribute(item, "__pydantic_extra__", None)
+        _set_attribute(item, "__pydantic_private__", None)
+        return item
+
+
+def _field_codec(annotation: Any) -> _Codec | None:
+    """Return (encode, decode) for fields holding models, None for plain values."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        nested = ModelCodec(annotation)
+        return nested.encode, nested.decode
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if origin in (list, tuple, set, frozenset) and args:
+        element = _field_codec(args[0])
+        if element is None:
+            return None
+        encode_element, decode_element = element
+        return (
+            lambda values: [encode_element(value) for value in values],
+            lambda values: origin(decode_element(value) for value in values),
+        )
+
+    if origin in (Union, types.UnionType):
+        options = [arg for arg in args if arg is not type(None)]
+        inner = _field_codec(options[0]) if len(options) == 1 else None
+        if inner is None:
+            return None
+        encode_inner, decode_inner = inner
+        return (
+            lambda value: None if value is None else encode_inner(value),
+            lambda value: None if value is None else decode_inner(value),
+        )
+
+    return None
@@ -0,0 +1,45 @@
+import os
+import pickle
+import zlib
+from pathlib import Path
+from typing import Any
+
+_MAGIC = b"DSNAP1"
+
+
+def write_snapshot(path: Path, state: Any) -> None:
+    """Atomically replace the snapshot at path with state."""
+    payload = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+    checksum = zlib.crc32(payload).to_bytes(4, "little")
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+
+    with tmp_path.open("wb") as snapshot_file:
+        snapshot_file.write(_MAGIC + checksum)
+        snapshot_file.write(payload)
+        snapshot_file.flush()
+        os.fsync(snapshot_file.fileno())
+
+    # Readers see either the old snapshot or the complete new one
+    tmp_path.replace(path)
+    directory = os.open(path.parent, os.O_RDONLY)
+    try:
+        os.fsync(directory)
+    finally:
+        os.close(directory)
+
+
+def read_snapshot(path: Path) -> Any | None:
+    """Return the saved state, or None if no snapshot was written yet."""
+    if not path.exists():
+        return None
+
+    data = path.read_bytes()
+    header_size = len(_MAGIC) + 4
+    payload = data[header_size:]
+    checksum = int.from_bytes(data[len(_MAGIC) : header_size], "little")
+    if not data.startswith(_MAGIC) or zlib.crc32(payload) != checksum:
+        # Snapshots are replaced atomically, so this is disk damage, not a crash
+        raise ValueError(f"Snapshot {path} is corrupt")
+
+    # Only snapshots this process wrote to its own data directory are read
+    return pickle.loads(payload)  # noqa: S301
@@ -0,0 +1,72 @@
+import atexit
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from dashboard.data.store.persistence.fsync_policy import FsyncPolicyEnum
+from dashboard.data.store.persistence.log_operation import LogOperationEnum
+from dashboard.data.store.persistence.model_codec import ModelCodec
+from dashboard.data.store.persistence.snapshot import read_snapshot, write_snapshot
+from dashboard.data.store.persistence.write_ahead_log import WriteAheadLog
+from dashboard.settings import STORE_FSYNC_INTERVAL_S, STORE_WAL_COMPACT_BYTES
+
+
+class StorePersistence:
+    """Durability for one store: a snapshot plus the write-ahead log since then.
+
+    Startup loads the snapshot and replays the log tail. Once the log grows
+    past compact_bytes, the whole store is written as a new snapshot and the
+    log is emptied. Replaying a record twice is harmless (adds upsert, updates
+    set values, deletes ignore missing IDs), so a crash between writing the
+    snapshot and emptying the log cannot corrupt the store.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        name: str,
+        model: type[BaseModel],
+        fsync_policy: FsyncPolicyEnum = FsyncPolicyEnum.INTERVAL,
+        compact_bytes: int | None = STORE_WAL_COMPACT_BYTES,
+    ) -> None:
+        self.codec = ModelCodec(model)
+        self._snapshot_path = directory / f"{name}.snapshot"
+        self._compact_bytes = compact_bytes
+        self._log = WriteAheadLog(
+            directory / f"{name}.wal",
+            fsync_policy,
+            STORE_FSYNC_INTERVAL_S,
+        )
+        atexit.register(self.close)
+
+    def load_snapshot(self) -> tuple[list[Any], list[int]] | None:
+        """Return the encoded items and their sizes from the latest snapshot."""
+        return read_snapshot(self._snapshot_path)
+
+    def replay(self) -> Iterator[tuple[LogOperationEnum, Any]]:
+        for operation, payload in self._log.replay():
+            yield LogOperationEnum(operation), payload
+
+    def log(self, operation: LogOperationEnum, payload: Any) -> None:
+        """Append one mutation; ADD payloads are lists of models."""
+        if operation is LogOperationEnum.ADD:
+            payload = [self.codec.encode(item) for item in payload]
+        # Enum values, not members, so the log stays readable without this module
+        self._log.append((operation.value, payload))
+
+    def should_compact(self) -> bool:
+        return (
+            self._compact_bytes is not None
+            and self._log.size_bytes() >= self._compact_bytes
+        )
+
+    def compact(self, items: list[Any], sizes: list[int]) -> None:
+        """Write a snapshot of the whole store and start an empty log."""
+        encode = self.codec.encode
+        write_snapshot(self._snapshot_path, ([encode(item) for item in items], sizes))
+        self._log.reset()
+
+    def close(self) -> None:
+        self._log.close()
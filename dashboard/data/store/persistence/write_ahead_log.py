@@ -0,0 +1,95 @@
+import os
+import pickle
+import struct
+import time
+import zlib
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+from dashboard.data.store.persistence.fsync_policy import FsyncPolicyEnum
+
+# Every record is framed as payload length + CRC32, then the pickled payload
+_FRAME = struct.Struct("<II")
+
+
+class WriteAheadLog:
+    """Append-only binary log of mutation records.
+
+    A crash can leave a partially written record at the end of the file. Replay
+    stops at the first frame that is short or fails its checksum, and the file
+    is truncated there so later appends start from a clean boundary.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        fsync_policy: FsyncPolicyEnum = FsyncPolicyEnum.INTERVAL,
+        fsync_interval_s: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.path = path
+        self._fsync_policy = fsync_policy
+        self._fsync_interval_s = fsync_interval_s
+        self._clock = clock
+        self._last_sync = clock()
+        self._dirty = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("ab")
+
+    def append(self, record: Any) -> None:
+        payload = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+        self._file.write(_FRAME.pack(len(payload), zlib.crc32(payload)))
+        self._file.write(payload)
+        # Always hand the record to the OS so a process crash cannot lose it
+        self._file.flush()
+        self._dirty = True
+
+        if self._fsync_policy is FsyncPolicyEnum.ALWAYS or (
+            self._fsync_policy is FsyncPolicyEnum.INTERVAL
+            and self._clock() - self._last_sync >= self._fsync_interval_s
+        ):
+            self.sync()
+
+    def replay(self) -> Iterator[Any]:
+        """Yield every intact record in append order, dropping a torn tail."""
+        with self.path.open("rb") as log_file:
+            data = log_file.read()
+
+        offset = 0
+        while offset + _FRAME.size <= len(data):
+            length, checksum = _FRAME.unpack_from(data, offset)
+            start = offset + _FRAME.size
+            payload = data[start : start + length]
+            if len(payload) < length or zlib.crc32(payload) != checksum:
+                break
+            # Only records this process wrote to its own data directory are read
+            yield pickle.loads(payload)  # noqa: S301
+            offset = start + length
+
+        if offset < len(data):
+            self._file.truncate(offset)
+            self._file.seek(0, os.SEEK_END)
+
+    def size_bytes(self) -> int:
+        return self._file.tell()
+
+    def sync(self) -> None:
+        if self._dirty:
+            os.fsync(self._file.fileno())
+            self._dirty = False
+        self._last_sync = self._clock()
+
+    def reset(self) -> None:
+        """Drop every record, e.g. once a snapshot covers them."""
+        self._file.truncate(0)
+        self._file.seek(0)
+        self._dirty = True
+        self.sync()
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        if self._fsync_policy is not FsyncPolicyEnum.NEVER:
+            self.sync()
+        self._file.close()
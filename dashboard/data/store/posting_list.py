@@ -0,0 +1,35 @@
+from collections.abc import Iterable, Iterator
+
+
+class PostingList:
+    """Insertion-ordered set of item IDs with O(1) membership, add and discard."""
+
+    __slots__ = ("_ids",)
+
+    def __init__(self, item_ids: Iterable[str] = ()) -> None:
+        # Dict keys keep insertion order and give constant-time hashing
+        self._ids: dict[str, None] = dict.fromkeys(item_ids)
+
+    def add(self, item_id: str) -> None:
+        self._ids[item_id] = None
+
+    def update(self, item_ids: Iterable[str]) -> None:
+        self._ids.update(dict.fromkeys(item_ids))
+
+    def discard(self, item_id: str) -> None:
+        self._ids.pop(item_id, None)
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __bool__(self) -> bool:
+        return bool(self._ids)
+
+    def __repr__(self) -> str:
+        return f"PostingList({list(self._ids)!r})"
@@ -0,0 +1,300 @@
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable, Iterator, Sequence
+from operator import add, attrgetter, itemgetter, sub
+from typing import Any
+
+_order_key = itemgetter(0)
+
+# Batches larger than this fraction of a group are merged by re-sorting
+_BULK_FRACTION = 16
+
+
+class _GroupSums:
+    """One group's (order, item_id) keys with running totals beside them.
+
+    cumulative[k] holds the totals of keys[:k], so it is one entry longer than
+    keys. Entries from dirty_from + 1 on are stale until refresh().
+    """
+
+    __slots__ = ("cumulative", "dirty_from", "keys")
+
+    def __init__(self, zeros: tuple[Any, ...]) -> None:
+        self.keys: list[tuple[Any, str]] = []
+        self.cumulative: list[tuple[Any, ...]] = [zeros]
+        self.dirty_from = 0
+
+    def window(self, lo: Any, hi: Any) -> tuple[int, int]:
+        """Return the slice of keys with lo <= order <= hi."""
+        start = 0 if lo is None else bisect_left(self.keys, lo, key=_order_key)
+        stop = (
+            len(self.keys)
+            if hi is None
+            else bisect_right(self.keys, hi, key=_order_key)
+        )
+        return start, stop
+
+    def totals(self, lo: Any, hi: Any) -> tuple[Any, ...] | None:
+        start, stop = self.window(lo, hi)
+        if stop <= start:
+            return None
+        first, last = self.cumulative[start], self.cumulative[stop]
+        return (*map(sub, last, first), stop - start)
+
+    def window_totals(
+        self,
+        windows: Sequence[tuple[Any, Any]],
+    ) -> list[tuple[Any, ...]] | None:
+        """Return totals per window, zeros for empty ones, or None if all are."""
+        totals = [self.totals(lo, hi) for lo, hi in windows]
+        if all(window is None for window in totals):
+            return None
+        empty = (*self.cumulative[0], 0)
+        return [empty if window is None else window for window in totals]
+
+
+class PrefixSumIndex:
+    """Running totals of numeric fields per group, ordered by one field.
+
+    Each group keeps its keys sorted with cumulative sums, so the totals of any
+    [lo, hi] window are two bisects and a subtraction however long it is.
+    Appending past a group's last key extends the sums in O(1); a late insert,
+    update or delete recomputes only the suffix after it. Value fields may be
+    dotted paths into nested models, e.g. "metrics.clicks".
+    """
+
+    __slots__ = (
+        "_dirty",
+        "_entries",
+        "_groups",
+        "_values_of",
+        "group_field",
+        "order_field",
+        "value_fields",
+    )
+
+    def __init__(
+        self,
+        group_field: str,
+        order_field: str,
+        value_fields: tuple[str, ...],
+    ) -> None:
+        if not value_fields:
+            raise ValueError("Prefix sum index needs at least one value field")
+
+        self.group_field = group_field
+        self.order_field = order_field
+        self.value_fields = value_fields
+        self._values_of = attrgetter(*value_fields)
+        self._groups: dict[Any, _GroupSums] = {}
+        # item_id -> (group, order, values), so removal never reads the item
+        self._entries: dict[str, tuple[Any, Any, tuple[Any, ...]]] = {}
+        self._dirty: set[Any] = set()
+
+    def entry_of(self, item: object) -> tuple[Any, Any, tuple[Any, ...]] | None:
+        """Return (group, order, values), or None if a field is missing or None."""
+        try:
+            group = getattr(item, self.group_field)
+            order = getattr(item, self.order_field)
+            values = self._values_of(item)
+        except AttributeError:
+            return None
+        if len(self.value_fields) == 1:
+            values = (values,)
+        if order is None or None in values:
+            return None
+        return group, order, values
+
+    def add(self, item_id: str, entry: tuple[Any, Any, tuple[Any, ...]]) -> None:
+        if self._entries.get(item_id) == entry:
+            return
+        self._discard(item_id)
+        self._entries[item_id] = entry
+
+        group, order, values = entry
+        sums = self._group(group)
+        key = (order, item_id)
+        keys = sums.keys
+        if keys and key < keys[-1]:
+            position = bisect_left(keys, key)
+            keys.insert(position, key)
+            sums.dirty_from = min(sums.dirty_from, position)
+            self._dirty.add(group)
+        elif group in self._dirty:
+            keys.append(key)
+        else:
+            # The common case: a new latest day extends the running totals
+            keys.append(key)
+            sums.cumulative.append(tuple(map(add, sums.cumulative[-1], values)))
+            sums.dirty_from = len(keys)
+        self._refresh()
+
+    def add_many(
+        self,
+        pairs: Iterable[tuple[str, tuple[Any, Any, tuple[Any, ...]]]],
+    ) -> None:
+        """Insert many (item_id, entry) pairs, refreshing each group once."""
+        grouped: dict[Any, list[tuple[Any, str]]] = {}
+        for item_id, entry in pairs:
+            if self._entries.get(item_id) == entry:
+                continue
+            self._discard(item_id)
+            self._entries[item_id] = entry
+            grouped.setdefault(entry[0], []).append((entry[1], item_id))
+
+        for group, keys in grouped.items():
+            self._insert_keys(group, self._group(group), keys)
+        self._refresh()
+
+    def discard(self, item_id: str) -> None:
+        self._discard(item_id)
+        self._refresh()
+
+    def discard_many(self, item_ids: Iterable[str]) -> None:
+        for item_id in item_ids:
+            self._discard(item_id)
+        self._refresh()
+
+    def totals(
+        self,
+        group: Any,
+        lo: Any = None,
+        hi: Any = None,
+    ) -> tuple[Any, ...] | None:
+        """Return the value sums plus row count for lo <= order <= hi, or None."""
+        sums = self._groups.get(group)
+        return sums.totals(lo, hi) if sums is not None else None
+
+    def all_totals(
+        self,
+        lo: Any = None,
+        hi: Any = None,
+    ) -> Iterator[tuple[Any, tuple[Any, ...]]]:
+        """Yield (group, totals) for every group with rows in the window."""
+        for group, sums in self._groups.items():
+            totals = sums.totals(lo, hi)
+            if totals is not None:
+                yield group, totals
+
+    def window_totals(
+        self,
+        group: Any,
+        windows: Sequence[tuple[Any, Any]],
+    ) -> list[tuple[Any, ...]] | None:
+        """Return one group's totals for each (lo, hi) window, as totals() does.
+
+        Windows without rows get zero sums, and None means none had any.
+        """
+        sums = self._groups.get(group)
+        return sums.window_totals(windows) if sums is not None else None
+
+    def all_window_totals(
+        self,
+        windows: Sequence[tuple[Any, Any]],
+    ) -> Iterator[tuple[Any, list[tuple[Any, ...]]]]:
+        """Yield (group, totals per window) for groups with rows in any window."""
+        for group, sums in self._groups.items():
+            totals = sums.window_totals(windows)
+            if totals is not None:
+                yield group, totals
+
+    def rows(
+        self,
+        lo: Any = None,
+        hi: Any = None,
+    ) -> Iterator[tuple[Any, list[Any], list[tuple[Any, ...]]]]:
+        """Yield (group, orders, values) for each group's rows in the window.
+
+        Rows are ascending by order, and values[i] belongs to orders[i].
+        """
+        entries = self._entries
+        for group, sums in self._groups.items():
+            start, stop = sums.window(lo, hi)
+            if stop > start:
+                keys = sums.keys[start:stop]
+                yield (
+                    group,
+                    [order for order, _ in keys],
+                    [entries[item_id][2] for _, item_id in keys],
+                )
+
+    def clear(self) -> None:
+        self._groups.clear()
+        self._entries.clear()
+        self._dirty.clear()
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _group(self, group: Any) -> _GroupSums:
+        sums = self._groups.get(group)
+        if sums is None:
+            zeros = tuple(0 for _ in self.value_fields)
+            sums = self._groups[group] = _GroupSums(zeros)
+        return sums
+
+    def _insert_keys(
+        self,
+        group: Any,
+        sums: _GroupSums,
+        keys: list[tuple[Any, str]],
+    ) -> None:
+        if len(keys) * _BULK_FRACTION > len(sums.keys):
+            tail = sums.keys[-1] if sums.keys else None
+            keys.sort()
+            if tail is not None and keys[0] < tail:
+                sums.dirty_from = min(sums.dirty_from, bisect_left(sums.keys, keys[0]))
+                sums.keys.extend(keys)
+                sums.keys.sort()
+            else:
+                sums.keys.extend(keys)
+        else:
+            for key in keys:
+                position = bisect_left(sums.keys, key)
+                sums.dirty_from = min(sums.dirty_from, position)
+                insort(sums.keys, key)
+        self._dirty.add(group)
+
+    def _discard(self, item_id: str) -> None:
+        entry = self._entries.pop(item_id, None)
+        if entry is None:
+            return
+
+        group, order, _ = entry
+        sums = self._groups[group]
+        keys = sums.keys
+        position = bisect_left(keys, (order, item_id))
+        del keys[position]
+        if position == len(keys) and group not in self._dirty:
+            # Dropping the latest key only shortens the running totals
+            sums.cumulative.pop()
+            sums.dirty_from = position
+            if not keys:
+                del self._groups[group]
+            return
+        sums.dirty_from = min(sums.dirty_from, position)
+        self._dirty.add(group)
+
+    def _refresh(self) -> None:
+        """Recompute the stale suffix of every group touched since the last call."""
+        if not self._dirty:
+            return
+        entries = self._entries
+        for group in self._dirty:
+            sums = self._groups.get(group)
+            if sums is None:
+                continue
+            if not sums.keys:
+                del self._groups[group]
+                continue
+
+            start = sums.dirty_from
+            del sums.cumulative[start + 1 :]
+            running = sums.cumulative[start]
+            for _, item_id in sums.keys[start:]:
+                running = tuple(map(add, running, entries[item_id][2]))
+                sums.cumulative.append(running)
+            sums.dirty_from = len(sums.keys)
+        self._dirty.clear()
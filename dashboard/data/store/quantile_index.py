@@ -0,0 +1,152 @@
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any, Self
+
+from dashboard.data.store.quantile_sketch import QuantileSketch
+
+# Group key under which every group's values are also kept
+_ALL_GROUPS = object()
+
+type ValueOf = Callable[[Any], float | None]
+
+
+class QuantileIndex:
+    """Quantile sketches of derived values per group and coarse bucket.
+
+    Works like RollupIndex, but each (group, bucket) keeps one QuantileSketch
+    per value function instead of sums. A value function returning None skips
+    that row, e.g. cost per click on a day without clicks. Every bucket also
+    keeps the sketches of all groups together, so a distribution across groups
+    is one merge per bucket rather than one per group and bucket.
+    """
+
+    __slots__ = (
+        "_entries",
+        "_rows",
+        "_sketches",
+        "bucket_of",
+        "group_field",
+        "order_field",
+        "relative_accuracy",
+        "value_of",
+    )
+
+    def __init__(
+        self,
+        group_field: str,
+        order_field: str,
+        value_of: tuple[ValueOf, ...],
+        bucket_of: Callable[[Any], Hashable],
+        relative_accuracy: float = 0.01,
+    ) -> None:
+        if not value_of:
+            raise ValueError("Quantile index needs at least one value function")
+
+        self.group_field = group_field
+        self.order_field = order_field
+        self.value_of = value_of
+        self.bucket_of = bucket_of
+        self.relative_accuracy = relative_accuracy
+        self._sketches: dict[tuple[Any, Hashable], tuple[QuantileSketch, ...]] = {}
+        self._rows: dict[tuple[Any, Hashable], int] = {}
+        # item_id -> (group, bucket, values), so removal never reads the item
+        self._entries: dict[str, tuple[Any, Hashable, tuple[float | None, ...]]] = {}
+
+    def empty_copy(self) -> Self:
+        return type(self)(
+            self.group_field,
+            self.order_field,
+            self.value_of,
+            self.bucket_of,
+            self.relative_accuracy,
+        )
+
+    def entry_of(
+        self,
+        item: object,
+    ) -> tuple[Any, Hashable, tuple[float | None, ...]] | None:
+        """Return (group, bucket, values), or None if a field is missing or None."""
+        try:
+            group = getattr(item, self.group_field)
+            order = getattr(item, self.order_field)
+        except AttributeError:
+            return None
+        if order is None:
+            return None
+        return group, self.bucket_of(order), tuple(f(item) for f in self.value_of)
+
+    def add(
+        self,
+        item_id: str,
+        entry: tuple[Any, Hashable, tuple[float | None, ...]],
+    ) -> None:
+        if self._entries.get(item_id) == entry:
+            return
+        self.discard(item_id)
+
+        group, bucket, values = entry
+        for key in ((group, bucket), (_ALL_GROUPS, bucket)):
+            self._adjust(key, values, 1)
+        self._entries[item_id] = entry
+
+    def add_many(
+        self,
+        pairs: Iterable[tuple[str, tuple[Any, Hashable, tuple[float | None, ...]]]],
+    ) -> None:
+        for item_id, entry in pairs:
+            self.add(item_id, entry)
+
+    def discard(self, item_id: str) -> None:
+        entry = self._entries.pop(item_id, None)
+        if entry is None:
+            return
+
+        group, bucket, values = entry
+        for key in ((group, bucket), (_ALL_GROUPS, bucket)):
+            self._adjust(key, values, -1)
+
+    def discard_many(self, item_ids: Iterable[str]) -> None:
+        for item_id in item_ids:
+            self.discard(item_id)
+
+    def sketches(
+        self,
+        group: Any,
+        bucket: Hashable,
+    ) -> tuple[QuantileSketch, ...] | None:
+        """Return the bucket's sketches for group, or for all groups if None."""
+        return self._sketches.get((_ALL_GROUPS if group is None else group, bucket))
+
+    def clear(self) -> None:
+        self._sketches.clear()
+        self._rows.clear()
+        self._entries.clear()
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _adjust(
+        self,
+        key: tuple[Any, Hashable],
+        values: tuple[float | None, ...],
+        weight: int,
+    ) -> None:
+        sketches = self._sketches.get(key)
+        if sketches is None:
+            sketches = self._sketches[key] = tuple(
+                QuantileSketch(self.relative_accuracy) for _ in self.value_of
+            )
+
+        for sketch, value in zip(sketches, values, strict=True):
+            if value is not None:
+                sketch.add(value, weight)
+
+        # Drop the bucket with its last row so it cannot linger empty
+        rows = self._rows.get(key, 0) + weight
+        if rows:
+            self._rows[key] = rows
+        else:
+            del self._rows[key]
+            del self._sketches[key]
@@ -0,0 +1,110 @@
+import math
+from collections.abc import Iterable
+from typing import Self
+
+import numpy as np
+import numpy.typing as npt
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+# Values at or below this are counted as zero rather than given a bucket
+_MIN_POSITIVE = 1e-9
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch with logarithmic buckets, as in DDSketch.
+
+    A value v lands in bucket ceil(log(v) / log(gamma)) with
+    gamma = (1 + a) / (1 - a), so any quantile comes back within relative
+    accuracy a of a true value at that rank. Buckets are plain counts, which
+    makes merging a sum and, unlike t-digest or KLL, makes removing a value
+    exact. Size grows with the log of the value range, not the value count:
+    a 1% sketch spans a cent to $10k in under 700 buckets.
+    """
+
+    __slots__ = ("_log_gamma", "bins", "count", "relative_accuracy", "zero_count")
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("Relative accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self._log_gamma = math.log((1 + relative_accuracy) / (1 - relative_accuracy))
+        self.bins: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value: float, weight: int = 1) -> None:
+        """Add value weight times; a negative weight removes earlier adds."""
+        self.count += weight
+        if value <= _MIN_POSITIVE:
+            self.zero_count += weight
+            return
+
+        key = math.ceil(math.log(value) / self._log_gamma)
+        remaining = self.bins.get(key, 0) + weight
+        if remaining:
+            self.bins[key] = remaining
+        else:
+            del self.bins[key]
+
+    def add_many(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.add(value)
+
+    def add_array(self, values: npt.ArrayLike) -> None:
+        """Add an array of values with one vectorized bucketing pass."""
+        values = np.asarray(values, dtype=np.float64)
+        positive = values[values > _MIN_POSITIVE]
+        self.count += len(values)
+        self.zero_count += len(values) - len(positive)
+
+        keys, weights = np.unique(
+            np.ceil(np.log(positive) / self._log_gamma).astype(np.int64),
+            return_counts=True,
+        )
+        for key, weight in zip(keys.tolist(), weights.tolist(), strict=True):
+            self.bins[key] = self.bins.get(key, 0) + weight
+
+    def remove(self, value: float) -> None:
+        self.add(value, -1)
+
+    def update(self, other: "QuantileSketch") -> None:
+        """Merge other into this sketch in place."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches of different accuracy")
+        self.count += other.count
+        self.zero_count += other.zero_count
+        for key, weight in other.bins.items():
+            remaining = self.bins.get(key, 0) + weight
+            if remaining:
+                self.bins[key] = remaining
+            else:
+                del self.bins[key]
+
+    def quantile(self, q: float) -> float | None:
+        """Return the q-quantile (0 <= q <= 1), or None if the sketch is empty."""
+        if self.count <= 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        key = 0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if rank < seen:
+                break
+        if not self.bins:
+            return 0.0
+        # The bucket covers (gamma**(key-1), gamma**key]; this point is within
+        # the relative accuracy of both ends
+        gamma = math.exp(self._log_gamma)
+        return 2 * gamma**key / (1 + gamma)
+
+    def copy(self) -> Self:
+        clone = type(self)(self.relative_accuracy)
+        clone.update(self)
+        return clone
+
+    def __len__(self) -> int:
+        return len(self.bins)
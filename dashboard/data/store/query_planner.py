@@ -0,0 +1,198 @@
+from collections.abc import Callable, Iterable
+from enum import Enum
+from typing import Annotated, Any
+
+from pydantic import BaseModel, Field
+
+from dashboard.data.store.composite_index import CompositeIndex
+from dashboard.data.store.posting_list import PostingList
+from dashboard.data.store.range_index import RangeIndex
+
+
+class QueryStrategyEnum(str, Enum):
+    EMPTY = "empty"
+    INDEX = "index"
+    INTERSECT = "intersect"
+    SCAN = "scan"
+
+
+class QueryPlanSchema(BaseModel):
+    strategy: Annotated[QueryStrategyEnum, Field(description="Access path taken")]
+    index_fields: Annotated[
+        list[str],
+        Field(
+            default_factory=list,
+            description="Indexed predicates used, most selective first",
+        ),
+    ]
+    residual_fields: Annotated[
+        list[str],
+        Field(
+            default_factory=list,
+            description="Predicates checked item by item on the candidates",
+        ),
+    ]
+    candidate_count: Annotated[
+        int,
+        Field(ge=0, description="Rows visited after the index step"),
+    ]
+
+
+class _IndexedPredicate:
+    __slots__ = ("contains", "fields", "item_ids", "size")
+
+    def __init__(
+        self,
+        fields: tuple[str, ...],
+        item_ids: Callable[[], Iterable[str]],
+        contains: Callable[[str], bool],
+        size: int,
+    ) -> None:
+        self.fields = fields
+        self.item_ids = item_ids
+        self.contains = contains
+        self.size = size
+
+
+class QueryPlanner:
+    """Choose an access path for InMemoryStore.list equality filters.
+
+    Every filter that hits a hash, range or fully-bound composite index becomes
+    an indexed predicate with an exact size. The smallest one drives iteration,
+    the others are intersected by O(1) membership checks, and only filters with
+    no index are left for a residual per-item check.
+    """
+
+    def __init__(
+        self,
+        indices: dict[str, dict[Any, PostingList]],
+        range_indices: dict[str, RangeIndex],
+        composite_indices: dict[tuple[str, ...], CompositeIndex],
+        total_count: Callable[[], int],
+    ) -> None:
+        self._indices = indices
+        self._range_indices = range_indices
+        self._composite_indices = composite_indices
+        self._total_count = total_count
+
+    def plan(
+        self,
+        filters: dict[str, Any],
+    ) -> tuple[QueryPlanSchema, list[str] | None]:
+        """Return the plan and candidate IDs, or None when a full scan is needed."""
+        predicates = self._indexed_predicates(filters)
+
+        if not predicates:
+            plan = QueryPlanSchema(
+                strategy=QueryStrategyEnum.SCAN,
+                index_fields=[],
+                residual_fields=list(filters),
+                candidate_count=self._total_count(),
+            )
+            return plan, None
+
+        predicates.sort(key=lambda predicate: predicate.size)
+        driver, *others = predicates
+        covered = {field for p in predicates for field in p.fields}
+        index_fields = [field for p in predicates for field in p.fields]
+        residual_fields = [field for field in filters if field not in covered]
+
+        if driver.size == 0:
+            plan = QueryPlanSchema(
+                strategy=QueryStrategyEnum.EMPTY,
+                index_fields=list(driver.fields),
+                residual_fields=[],
+                candidate_count=0,
+            )
+            return plan, []
+
+        candidate_ids = [
+            item_id
+            for item_id in driver.item_ids()
+            if all(other.contains(item_id) for other in others)
+        ]
+        plan = QueryPlanSchema(
+            strategy=QueryStrategyEnum.INTERSECT if others else QueryStrategyEnum.INDEX,
+            index_fields=index_fields,
+            residual_fields=residual_fields,
+            candidate_count=driver.size,
+        )
+        return plan, candidate_ids
+
+    def _indexed_predicates(self, filters: dict[str, Any]) -> list[_IndexedPredicate]:
+        predicates: list[_IndexedPredicate] = []
+        claimed: set[str] = set()
+
+        # Fully bound composite keys are the most specific lookups available
+        for fields, composite_index in self._composite_indices.items():
+            if claimed.intersection(fields) or not all(f in filters for f in fields):
+                continue
+            key = tuple(filters[field] for field in fields)
+            if not _is_hashable(key):
+                continue
+            try:
+                predicates.append(_composite_predicate(composite_index, key))
+            except TypeError:
+                # Not comparable with the indexed values; leave it to the scan
+                continue
+            claimed.update(fields)
+
+        for field_name, value in filters.items():
+            if field_name in claimed or not _is_hashable(value):
+                continue
+
+            if field_name in self._indices:
+                bucket = self._indices[field_name].get(value, PostingList())
+                predicates.append(_hash_predicate(field_name, bucket))
+            elif field_name in self._range_indices and value is not None:
+                range_index = self._range_indices[field_name]
+                try:
+                    predicates.append(_range_predicate(field_name, range_index, value))
+                except TypeError:
+                    # Not comparable with the indexed values; leave it to the scan
+                    continue
+
+        return predicates
+
+
+def _hash_predicate(field_name: str, bucket: PostingList) -> _IndexedPredicate:
+    return _IndexedPredicate(
+        (field_name,),
+        lambda: bucket,
+        bucket.__contains__,
+        len(bucket),
+    )
+
+
+def _composite_predicate(
+    composite_index: CompositeIndex,
+    key: tuple[Any, ...],
+) -> _IndexedPredicate:
+    item_ids = composite_index.range(key[:-1], key[-1], key[-1])
+    return _IndexedPredicate(
+        composite_index.fields,
+        lambda: item_ids,
+        lambda item_id: composite_index.key_for(item_id) == key,
+        len(item_ids),
+    )
+
+
+def _range_predicate(
+    field_name: str,
+    range_index: RangeIndex,
+    value: Any,
+) -> _IndexedPredicate:
+    return _IndexedPredicate(
+        (field_name,),
+        lambda: range_index.range(value, value),
+        lambda item_id: range_index.value_of(item_id) == value,
+        range_index.count_range(value, value),
+    )
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
@@ -0,0 +1,122 @@
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from operator import itemgetter
+from typing import Any
+
+_value_key = itemgetter(0)
+
+# Batches larger than this fraction of the index are merged by re-sorting
+# instead of one insort per key, which would shift the list k times
+_BULK_FRACTION = 16
+
+
+class RangeIndex:
+    """Sorted (value, item_id) keys for O(log n + k) range and ordered scans."""
+
+    __slots__ = ("_keys", "_values")
+
+    def __init__(self) -> None:
+        self._keys: list[tuple[Any, str]] = []
+        self._values: dict[str, Any] = {}
+
+    def add(self, item_id: str, value: Any) -> None:
+        # None is not orderable against real values, so it is never indexed
+        if value is None:
+            self.discard(item_id)
+            return
+
+        if item_id in self._values:
+            if self._values[item_id] == value:
+                return
+            self.discard(item_id)
+
+        insort(self._keys, (value, item_id))
+        self._values[item_id] = value
+
+    def add_many(self, pairs: Iterable[tuple[str, Any]]) -> None:
+        """Insert many (item_id, value) pairs with at most one re-sort."""
+        fresh = dict(pairs)
+        self.discard_many(
+            [
+                item_id
+                for item_id, value in fresh.items()
+                if item_id in self._values and self._values[item_id] != value
+            ],
+        )
+        new_keys = [
+            (value, item_id)
+            for item_id, value in fresh.items()
+            if value is not None and item_id not in self._values
+        ]
+        if not new_keys:
+            return
+
+        if len(new_keys) * _BULK_FRACTION > len(self._keys):
+            self._keys.extend(new_keys)
+            self._keys.sort()
+        else:
+            for key in new_keys:
+                insort(self._keys, key)
+        self._values.update((item_id, value) for value, item_id in new_keys)
+
+    def discard(self, item_id: str) -> None:
+        if item_id not in self._values:
+            return
+
+        value = self._values.pop(item_id)
+        position = bisect_left(self._keys, (value, item_id))
+        del self._keys[position]
+
+    def discard_many(self, item_ids: Iterable[str]) -> None:
+        doomed = {item_id for item_id in item_ids if item_id in self._values}
+        if not doomed:
+            return
+
+        if len(doomed) * _BULK_FRACTION > len(self._keys):
+            self._keys = [key for key in self._keys if key[1] not in doomed]
+            for item_id in doomed:
+                del self._values[item_id]
+        else:
+            for item_id in doomed:
+                self.discard(item_id)
+
+    def value_of(self, item_id: str) -> Any:
+        return self._values.get(item_id)
+
+    def range(self, lo: Any = None, hi: Any = None) -> list[str]:
+        """Return IDs with lo <= value <= hi in ascending value order."""
+        start, stop = self._bounds(lo, hi)
+        return [item_id for _, item_id in self._keys[start:stop]]
+
+    def count_range(self, lo: Any = None, hi: Any = None) -> int:
+        start, stop = self._bounds(lo, hi)
+        return max(stop - start, 0)
+
+    def ordered(
+        self,
+        descending: bool = False,
+        limit: int | None = None,
+    ) -> Iterator[str]:
+        keys = reversed(self._keys) if descending else iter(self._keys)
+        item_ids = (item_id for _, item_id in keys)
+        return islice(item_ids, limit) if limit is not None else item_ids
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._values.clear()
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._values
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _bounds(self, lo: Any, hi: Any) -> tuple[int, int]:
+        start = 0 if lo is None else bisect_left(self._keys, lo, key=_value_key)
+        stop = (
+            len(self._keys)
+            if hi is None
+            else bisect_right(self._keys, hi, key=_value_key)
+        )
+        return start, stop
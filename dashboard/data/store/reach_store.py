@@ -0,0 +1,86 @@
+from datetime import date
+from uuid import uuid4
+
+import numpy as np
+import numpy.typing as npt
+
+from dashboard.data.models.analytics import ReachSketchSchema
+from dashboard.data.store.analytics_store import CAMPAIGN_DATE_INDEX
+from dashboard.data.store.hyperloglog import DEFAULT_PRECISION, HyperLogLog
+from dashboard.data.store.memory_store import InMemoryStore
+from dashboard.data.store.persistence import LogOperationEnum
+from dashboard.settings import REACH_STORE_MAX_BYTES
+
+
+class ReachStore(InMemoryStore[ReachSketchSchema]):
+    """One HyperLogLog sketch of the users reached per campaign per day.
+
+    Each sketch is 4 KiB however many users it has seen. Unions over any date
+    range and any set of campaigns are register-wise maxima of the daily
+    sketches, with a standard error of about 1.6%.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(
+            id_field="id",
+            max_items=None,
+            max_bytes=REACH_STORE_MAX_BYTES,
+        )
+        self.add_index("campaign_id")
+        self.add_range_index("date")
+        self.add_composite_index(CAMPAIGN_DATE_INDEX, unique=True)
+
+    def add_users(
+        self,
+        campaign_id: str,
+        day: date,
+        user_hashes: npt.NDArray[np.uint64],
+    ) -> ReachSketchSchema:
+        """Fold hashed user IDs into the campaign's sketch for that day."""
+        with self._lock.write():
+            existing = self.get_by_composite(
+                CAMPAIGN_DATE_INDEX,
+                (campaign_id,),
+                day,
+                day,
+            )
+            sketch = (
+                HyperLogLog.from_bytes(existing[0].registers)
+                if existing
+                else HyperLogLog(DEFAULT_PRECISION)
+            )
+            sketch.add_hashes(user_hashes)
+            item = self._insert(
+                ReachSketchSchema(
+                    id=existing[0].id if existing else str(uuid4()),
+                    campaign_id=campaign_id,
+                    date=day,
+                    registers=sketch.to_bytes(),
+                ),
+            )
+            self._record(LogOperationEnum.ADD, [item])
+        self._enforce_budget()
+        return item
+
+    def estimate_reach(
+        self,
+        start_date: date,
+        end_date: date,
+        campaign_ids: list[str] | None = None,
+    ) -> int:
+        """Estimate distinct users reached in a date range by some or all campaigns."""
+        if campaign_ids is None:
+            sketches = self.get_by_range("date", start_date, end_date)
+        else:
+            sketches = [
+                sketch
+                for campaign_id in campaign_ids
+                for sketch in self.get_by_composite(
+                    CAMPAIGN_DATE_INDEX,
+                    (campaign_id,),
+                    start_date,
+                    end_date,
+                )
+            ]
+        union = HyperLogLog.merged(sketch.registers for sketch in sketches)
+        return union.estimate()
@@ -0,0 +1,127 @@
+import math
+from collections.abc import Callable, Hashable, Iterable
+from operator import add, attrgetter
+from typing import Any
+
+
+class RollupIndex:
+    """Per-group sums of numeric fields in coarse buckets of one field.
+
+    bucket_of maps the field to its bucket, e.g. a date to its ISO week. An add
+    adjusts one bucket's totals in O(1). A delete re-sums the bucket's remaining
+    rows exactly rather than subtracting, since subtracting floats can leave a
+    residue, even a negative one, in a bucket whose remaining rows sum to zero.
+    """
+
+    __slots__ = (
+        "_buckets",
+        "_entries",
+        "_members",
+        "_values_of",
+        "bucket_of",
+        "group_field",
+        "order_field",
+        "value_fields",
+    )
+
+    def __init__(
+        self,
+        group_field: str,
+        order_field: str,
+        value_fields: tuple[str, ...],
+        bucket_of: Callable[[Any], Hashable],
+    ) -> None:
+        if not value_fields:
+            raise ValueError("Rollup index needs at least one value field")
+
+        self.group_field = group_field
+        self.order_field = order_field
+        self.value_fields = value_fields
+        self.bucket_of = bucket_of
+        self._values_of = attrgetter(*value_fields)
+        # (group, bucket) -> (*sums, row count)
+        self._buckets: dict[tuple[Any, Hashable], tuple[Any, ...]] = {}
+        # item_id -> (group, bucket, values), so removal never reads the item
+        self._entries: dict[str, tuple[Any, Hashable, tuple[Any, ...]]] = {}
+        # (group, bucket) -> IDs of the rows in it
+        self._members: dict[tuple[Any, Hashable], set[str]] = {}
+
+    def entry_of(self, item: object) -> tuple[Any, Hashable, tuple[Any, ...]] | None:
+        """Return (group, bucket, values), or None if a field is missing or None."""
+        try:
+            group = getattr(item, self.group_field)
+            order = getattr(item, self.order_field)
+            values = self._values_of(item)
+        except AttributeError:
+            return None
+        if len(self.value_fields) == 1:
+            values = (values,)
+        if order is None or None in values:
+            return None
+        return group, self.bucket_of(order), values
+
+    def add(self, item_id: str, entry: tuple[Any, Hashable, tuple[Any, ...]]) -> None:
+        if self._entries.get(item_id) == entry:
+            return
+        self.discard(item_id)
+
+        group, bucket, values = entry
+        key = (group, bucket)
+        totals = self._buckets.get(key)
+        self._buckets[key] = (
+            (*values, 1)
+            if totals is None
+            else (*map(add, totals[:-1], values), totals[-1] + 1)
+        )
+        self._entries[item_id] = entry
+        self._members.setdefault(key, set()).add(item_id)
+
+    def add_many(
+        self,
+        pairs: Iterable[tuple[str, tuple[Any, Hashable, tuple[Any, ...]]]],
+    ) -> None:
+        for item_id, entry in pairs:
+            self.add(item_id, entry)
+
+    def discard(self, item_id: str) -> None:
+        entry = self._entries.pop(item_id, None)
+        if entry is None:
+            return
+
+        group, bucket, _ = entry
+        key = (group, bucket)
+        members = self._members[key]
+        members.discard(item_id)
+        if not members:
+            del self._buckets[key]
+            del self._members[key]
+            return
+
+        columns = zip(*(self._entries[member][2] for member in members), strict=True)
+        self._buckets[key] = (*map(_exact_sum, columns), len(members))
+
+    def discard_many(self, item_ids: Iterable[str]) -> None:
+        for item_id in item_ids:
+            self.discard(item_id)
+
+    def totals(self, group: Any, bucket: Hashable) -> tuple[Any, ...] | None:
+        """Return the bucket's value sums plus row count, or None if it is empty."""
+        return self._buckets.get((group, bucket))
+
+    def clear(self) -> None:
+        self._buckets.clear()
+        self._entries.clear()
+        self._members.clear()
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+def _exact_sum(values: tuple[Any, ...]) -> Any:
+    """Sum ints exactly, and floats with a single rounding."""
+    if any(isinstance(value, float) for value in values):
+        return math.fsum(values)
+    return sum(values)
@@ -0,0 +1,29 @@
+import sys
+from typing import Any
+
+from pydantic import BaseModel
+
+
+def estimate_size_bytes(value: Any) -> int:
+    """Approximate the resident size of a stored value, including nested models.
+
+    Shared objects (interned strings, enum members, cached ints) are counted
+    every time they appear, so the estimate errs on the high side.
+    """
+    if isinstance(value, BaseModel):
+        return (
+            sys.getsizeof(value)
+            + sys.getsizeof(value.__dict__)
+            + sys.getsizeof(value.__pydantic_fields_set__)
+            + sum(estimate_size_bytes(v) for v in value.__dict__.values())
+        )
+
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_size_bytes(k) + estimate_size_bytes(v) for k, v in value.items()
+        )
+
+    if isinstance(value, list | tuple | set | frozenset):
+        return sys.getsizeof(value) + sum(estimate_size_bytes(v) for v in value)
+
+    return sys.getsizeof(value)
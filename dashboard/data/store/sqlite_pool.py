@@ -0,0 +1,97 @@
+import queue
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+# Seconds a connection waits on another writer before raising "database is locked"
+_BUSY_TIMEOUT_S = 30.0
+
+
+class SQLiteConnectionPool:
+    """Fixed-size pool of WAL-mode connections shared by Streamlit threads.
+
+    Connections are created lazily up to size and handed to one thread at a
+    time, so readers run concurrently (WAL allows it) without ever sharing a
+    connection. Every connection is in autocommit mode; callers open explicit
+    transactions for writes.
+    """
+
+    def __init__(self, path: Path, size: int = 4) -> None:
+        self.path = path
+        self._size = size
+        self._created = 0
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._mutex = threading.Lock()
+        self._watcher: sqlite3.Connection | None = None
+        self._watcher_mutex = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        connection = self._acquire()
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a write transaction; the write lock is taken up front."""
+        with self.connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def data_version(self) -> int:
+        """Return a number that changes after every commit, from any process.
+
+        It is read on a connection of its own that never writes, so commits
+        made through this pool change it too.
+        """
+        with self._watcher_mutex:
+            if self._watcher is None:
+                self._watcher = self._connect()
+            return int(self._watcher.execute("PRAGMA data_version").fetchone()[0])
+
+    def close(self) -> None:
+        with self._watcher_mutex:
+            if self._watcher is not None:
+                self._watcher.close()
+                self._watcher = None
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._mutex:
+            can_create = self._created < self._size
+            if can_create:
+                self._created += 1
+        if can_create:
+            return self._connect()
+        return self._idle.get()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.path,
+            timeout=_BUSY_TIMEOUT_S,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        # WAL makes NORMAL durable against crashes; only power loss can drop commits
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
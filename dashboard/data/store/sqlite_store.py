@@ -0,0 +1,548 @@
+import builtins
+import re
+import sqlite3
+import threading
+from collections.abc import Iterable, Sequence
+from functools import cache
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from dashboard.data.store.generation import next_generation
+from dashboard.data.store.sqlite_pool import SQLiteConnectionPool
+
+T = TypeVar("T", bound=BaseModel)
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+class _UnmatchableError(Exception):
+    """A filter value that no stored row can equal, e.g. of the wrong type."""
+
+
+class SQLiteStore(Generic[T]):
+    """SQLite-backed store with the same API as InMemoryStore.
+
+    Items are stored as JSON documents keyed by ID. Every declared index is a
+    real SQL index on json_extract of its field(s), and query values are
+    serialized exactly like the stored documents, so lookups hit the index.
+    Rows keep insertion order: re-adding or updating an item moves it to the
+    end, as in InMemoryStore. Memory limits and eviction do not apply.
+    """
+
+    def __init__(
+        self,
+        model: type[T],
+        table: str,
+        path: Path,
+        id_field: str = "id",
+        pool_size: int = 4,
+    ) -> None:
+        if not _IDENTIFIER.match(table):
+            raise ValueError(f"Invalid table name {table!r}")
+
+        self._model = model
+        self._table = table
+        self._id_field = id_field
+        self._pool = SQLiteConnectionPool(path, pool_size)
+        self._indices: set[str] = set()
+        self._range_indices: set[str] = set()
+        self._composite_indices: dict[tuple[str, ...], bool] = {}
+        self._data_version: int | None = None
+        self._generation = next_generation()
+        self._generation_mutex = threading.Lock()
+
+        with self._pool.connection() as connection:
+            connection.execute(
+                f'CREATE TABLE IF NOT EXISTS "{table}" '
+                "(id TEXT PRIMARY KEY, data TEXT NOT NULL)",
+            )
+
+    def add(self, item: T) -> T:
+        with self._pool.transaction() as connection:
+            return self._insert(connection, item)
+
+    def add_many(self, items: Iterable[T]) -> builtins.list[T]:
+        """Add a batch in a single transaction."""
+        with self._pool.transaction() as connection:
+            stored = {}
+            for item in items:
+                item = self._insert(connection, item)  # noqa: PLW2901
+                stored[getattr(item, self._id_field)] = item
+            return builtins.list(stored.values())
+
+    def get(self, item_id: str) -> T | None:
+        rows = self._select("id = ?", [item_id])
+        return rows[0] if rows else None
+
+    def get_by_index(self, index_name: str, value: Any) -> builtins.list[T]:
+        if index_name not in self._indices:
+            return []
+        return self.list({index_name: value})
+
+    def get_by_range(
+        self,
+        field_name: str,
+        lo: Any = None,
+        hi: Any = None,
+    ) -> builtins.list[T]:
+        """Return items with lo <= field <= hi, ascending; None means unbounded."""
+        if field_name not in self._range_indices:
+            return []
+        try:
+            where, params = self._range_clause(field_name, lo, hi)
+        except _UnmatchableError:
+            return []
+        column = _column(field_name)
+        return self._select(where, params, f"{column}, id")
+
+    def get_ordered(
+        self,
+        field_name: str,
+        descending: bool = False,
+        limit: int | None = None,
+    ) -> builtins.list[T]:
+        """Return items ordered by a range-indexed field, optionally truncated."""
+        if field_name not in self._range_indices:
+            return []
+
+        column = _column(field_name)
+        direction = "DESC" if descending else "ASC"
+        return self._select(
+            f"{column} IS NOT NULL",
+            [],
+            f"{column} {direction}, id {direction}",
+            limit,
+        )
+
+    def get_by_composite(
+        self,
+        fields: tuple[str, ...],
+        prefix: tuple[Any, ...],
+        lo: Any = None,
+        hi: Any = None,
+    ) -> builtins.list[T]:
+        """Return items equal on the leading fields and in range on the last."""
+        if fields not in self._composite_indices:
+            return []
+
+        try:
+            prefix_where, params = self._equality_clause(
+                dict(zip(fields[:-1], prefix, strict=True)),
+            )
+            range_where, range_params = self._range_clause(fields[-1], lo, hi)
+        except _UnmatchableError:
+            return []
+        return self._select(
+            f"{prefix_where} AND {range_where}",
+            params + range_params,
+            f"{_column(fields[-1])}, id",
+        )
+
+    def list(self, filters: dict[str, Any] | None = None) -> builtins.list[T]:
+        if not filters:
+            return self._select("1", [])
+
+        try:
+            where, params = self._equality_clause(filters)
+        except _UnmatchableError:
+            return []
+        return self._select(where, params)
+
+    def sum_by(
+        self,
+        group_field: str,
+        sum_fields: tuple[str, ...],
+        range_field: str,
+        bounds: tuple[Any, Any] = (None, None),
+        filters: dict[str, Any] | None = None,
+    ) -> dict[Any, tuple[Any, ...]]:
+        """Sum fields per group inside SQLite, without decoding any document.
+
+        bounds is an inclusive (lo, hi) window on range_field, None meaning
+        unbounded, and filters are equalities as in list(). Dotted names reach
+        into nested models, e.g. "metrics.clicks". Each result tuple holds the
+        sums in order followed by the row count.
+        """
+        for field_name in (group_field, *sum_fields):
+            self._check_field(field_name.split(".", 1)[0])
+        try:
+            where, params = self._equality_clause(filters or {})
+            range_where, range_params = self._range_clause(range_field, *bounds)
+        except _UnmatchableError:
+            return {}
+
+        group = _column(group_field)
+        sums = "".join(f"TOTAL({_column(field_name)}), " for field_name in sum_fields)
+        sql = (
+            f'SELECT {group}, {sums}COUNT(*) FROM "{self._table}" '  # noqa: S608
+            f"{self._grouping_hint(group_field)}"
+            f"WHERE {where} AND {range_where} GROUP BY {group}"
+        )
+        with self._pool.connection() as connection:
+            rows = connection.execute(sql, params + range_params).fetchall()
+        return {row[0]: tuple(row[1:]) for row in rows}
+
+    def sum_by_windows(
+        self,
+        group_field: str,
+        sum_fields: tuple[str, ...],
+        range_field: str,
+        windows: Sequence[tuple[Any, Any]],
+        filters: dict[str, Any] | None = None,
+    ) -> dict[Any, builtins.list[tuple[Any, ...]]]:
+        """Sum fields per group over several windows in a single query.
+
+        Each window is an inclusive (lo, hi) as in sum_by, and each group gets
+        one sum_by tuple per window, zeros where it has no rows in one. Rows
+        are read once over the span of all windows and grouped by window, so
+        windows must not overlap.
+        """
+        for field_name in (group_field, *sum_fields):
+            self._check_field(field_name.split(".", 1)[0])
+        if not windows:
+            return {}
+        try:
+            where, params = self._equality_clause(filters or {})
+            span_where, span_params = self._range_clause(range_field, *_span(windows))
+            conditions = [
+                self._range_clause(range_field, *bounds) for bounds in windows
+            ]
+        except _UnmatchableError:
+            return {}
+
+        # Each row is assigned to its first matching window and summed once
+        cases = "".join(
+            f"WHEN {condition} THEN {position} "
+            for position, (condition, _) in enumerate(conditions)
+        )
+        case_params = [
+            param for _, condition_params in conditions for param in condition_params
+        ]
+        group = _column(group_field)
+        sums = "".join(f"TOTAL({_column(field_name)}), " for field_name in sum_fields)
+        sql = (
+            f"SELECT {group}, CASE {cases}END AS position, {sums}COUNT(*) "  # noqa: S608
+            f'FROM "{self._table}" {self._grouping_hint(group_field)}'
+            f"WHERE {where} AND {span_where} GROUP BY {group}, position"
+        )
+        with self._pool.connection() as connection:
+            rows = connection.execute(
+                sql,
+                case_params + params + span_params,
+            ).fetchall()
+
+        empty = (*(0.0 for _ in sum_fields), 0)
+        grouped: dict[Any, builtins.list[tuple[Any, ...]]] = {}
+        for row in rows:
+            # Rows between two windows match the span but none of them
+            if row[1] is not None:
+                totals = grouped.setdefault(row[0], [empty] * len(windows))
+                totals[row[1]] = tuple(row[2:])
+        return grouped
+
+    def values_by(
+        self,
+        group_field: str,
+        value_fields: tuple[str, ...],
+        range_field: str,
+        bounds: tuple[Any, Any] = (None, None),
+    ) -> dict[Any, tuple[builtins.list[Any], builtins.list[tuple[Any, ...]]]]:
+        """Return each group's range values and field values in a window.
+
+        Rows are ascending by range value, values[i] belonging to orders[i].
+        Only the requested fields are extracted, so no document is decoded,
+        and range values are converted back to the field's type, e.g. dates.
+        """
+        for field_name in (group_field, *value_fields):
+            self._check_field(field_name.split(".", 1)[0])
+        try:
+            range_where, params = self._range_clause(range_field, *bounds)
+        except _UnmatchableError:
+            return {}
+
+        group, order = _column(group_field), _column(range_field)
+        values = ", ".join(_column(field_name) for field_name in value_fields)
+        sql = (
+            f'SELECT {group}, {order}, {values} FROM "{self._table}" '  # noqa: S608
+            f"{self._grouping_hint(group_field)}"
+            f"WHERE {range_where} ORDER BY {group}, {order}, id"
+        )
+        with self._pool.connection() as connection:
+            rows = connection.execute(sql, params).fetchall()
+
+        # Few distinct range values repeat across groups, e.g. days
+        decode = cache(_adapter(self._model, range_field).validate_python)
+        grouped: dict[Any, tuple[builtins.list[Any], builtins.list[Any]]] = {}
+        for row in rows:
+            orders, row_values = grouped.setdefault(row[0], ([], []))
+            orders.append(decode(row[1]))
+            row_values.append(row[2:])
+        return grouped
+
+    def update(self, item_id: str, data: dict[str, Any]) -> T | None:
+        updated = self.update_many({item_id: data})
+        return updated[0] if updated else None
+
+    def update_many(
+        self,
+        updates: dict[str, dict[str, Any]],
+    ) -> builtins.list[T]:
+        """Apply field updates in one transaction; missing IDs are skipped.
+
+        Rows are deleted and re-inserted, so unique keys are only checked
+        against the final state and keys may be swapped within a batch. Any
+        collision rolls the whole batch back.
+        """
+        with self._pool.transaction() as connection:
+            items = self._fetch(connection, builtins.list(updates))
+            for item_id, item in items.items():
+                for key, value in updates[item_id].items():
+                    if hasattr(item, key):
+                        setattr(item, key, value)
+
+            self._delete_ids(connection, builtins.list(items))
+            try:
+                connection.executemany(
+                    f'INSERT INTO "{self._table}" (id, data) VALUES (?, ?)',  # noqa: S608
+                    [
+                        (item_id, item.model_dump_json())
+                        for item_id, item in items.items()
+                    ],
+                )
+            except sqlite3.IntegrityError as e:
+                raise ValueError(
+                    f"Update of {builtins.list(items)} collides: {e}",
+                ) from e
+            return builtins.list(items.values())
+
+    def delete(self, item_id: str) -> bool:
+        return self.delete_many([item_id]) == 1
+
+    def delete_many(self, item_ids: Iterable[str]) -> int:
+        """Delete many items by ID and return how many existed."""
+        with self._pool.transaction() as connection:
+            return self._delete_ids(connection, builtins.list(dict.fromkeys(item_ids)))
+
+    def count(self) -> int:
+        with self._pool.connection() as connection:
+            row = connection.execute(
+                f'SELECT COUNT(*) FROM "{self._table}"',  # noqa: S608
+            ).fetchone()
+        return int(row[0])
+
+    def clear(self) -> None:
+        with self._pool.transaction() as connection:
+            connection.execute(f'DELETE FROM "{self._table}"')  # noqa: S608
+
+    @property
+    def generation(self) -> int:
+        """Number that grows after every commit to the database file.
+
+        Commits by other processes count too, as do writes to other tables in
+        the same file, so derived results are never reused after a change.
+        """
+        with self._generation_mutex:
+            data_version = self._pool.data_version()
+            if data_version != self._data_version:
+                self._data_version = data_version
+                self._generation = next_generation()
+            return self._generation
+
+    def add_index(self, field_name: str) -> None:
+        self._create_index((field_name,), unique=False)
+        self._indices.add(field_name)
+
+    def add_range_index(self, field_name: str) -> None:
+        # One expression index serves both equality and range scans
+        self._create_index((field_name,), unique=False)
+        self._range_indices.add(field_name)
+
+    def add_composite_index(
+        self,
+        fields: tuple[str, ...],
+        unique: bool = False,
+    ) -> None:
+        if not fields:
+            raise ValueError("Composite index needs at least one field")
+        self._create_index(fields, unique)
+        self._composite_indices[fields] = unique
+
+    def close(self) -> None:
+        self._pool.close()
+
+    def _insert(self, connection: sqlite3.Connection, item: T) -> T:
+        item_id = getattr(item, self._id_field)
+
+        # Unique composite keys upsert: the new item takes over the owner's ID
+        for fields, unique in self._composite_indices.items():
+            if not unique:
+                continue
+            try:
+                where, params = self._equality_clause(
+                    {field: getattr(item, field) for field in fields},
+                )
+            except _UnmatchableError:
+                continue
+            row = connection.execute(
+                f'SELECT id FROM "{self._table}" WHERE {where}',  # noqa: S608
+                params,
+            ).fetchone()
+            if row is not None and row[0] != item_id:
+                item = item.model_copy(update={self._id_field: row[0]})
+                item_id = row[0]
+
+        connection.execute(
+            f'INSERT OR REPLACE INTO "{self._table}" (id, data) VALUES (?, ?)',  # noqa: S608
+            (item_id, item.model_dump_json()),
+        )
+        return item
+
+    def _fetch(
+        self,
+        connection: sqlite3.Connection,
+        item_ids: builtins.list[str],
+    ) -> dict[str, T]:
+        rows = connection.execute(
+            f'SELECT id, data FROM "{self._table}" '  # noqa: S608
+            "WHERE id IN (SELECT value FROM json_each(?))",
+            (_json_list(item_ids),),
+        ).fetchall()
+        by_id = {
+            item_id: self._model.model_validate_json(data) for item_id, data in rows
+        }
+        return {item_id: by_id[item_id] for item_id in item_ids if item_id in by_id}
+
+    def _delete_ids(
+        self,
+        connection: sqlite3.Connection,
+        item_ids: builtins.list[str],
+    ) -> int:
+        cursor = connection.executemany(
+            f'DELETE FROM "{self._table}" WHERE id = ?',  # noqa: S608
+            [(item_id,) for item_id in item_ids],
+        )
+        return cursor.rowcount
+
+    def _select(
+        self,
+        where: str,
+        params: builtins.list[Any],
+        order_by: str = "rowid",
+        limit: int | None = None,
+    ) -> builtins.list[T]:
+        sql = f'SELECT data FROM "{self._table}" WHERE {where} ORDER BY {order_by}'  # noqa: S608
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = [*params, limit]
+
+        with self._pool.connection() as connection:
+            rows = connection.execute(sql, params).fetchall()
+        validate = self._model.model_validate_json
+        return [validate(data) for (data,) in rows]
+
+    def _grouping_hint(self, group_field: str) -> str:
+        # An index led by the group field hands rows over already grouped;
+        # otherwise the planner prefers the range index plus a temp B-tree
+        for fields in self._composite_indices:
+            if fields[0] == group_field:
+                return f'INDEXED BY "{self._index_name(fields)}" '
+        return ""
+
+    def _create_index(self, fields: tuple[str, ...], unique: bool) -> None:
+        for field_name in fields:
+            self._check_field(field_name)
+
+        name = self._index_name(fields)
+        columns = ", ".join(_column(field_name) for field_name in fields)
+        kind = "UNIQUE INDEX" if unique else "INDEX"
+        try:
+            with self._pool.transaction() as connection:
+                connection.execute(
+                    f'CREATE {kind} IF NOT EXISTS "{name}" '
+                    f'ON "{self._table}" ({columns})',
+                )
+        except sqlite3.IntegrityError as e:
+            raise ValueError(f"Duplicate keys for unique index {fields!r}") from e
+
+    def _index_name(self, fields: tuple[str, ...]) -> str:
+        return f"{self._table}__{'__'.join(fields)}"
+
+    def _equality_clause(
+        self,
+        filters: dict[str, Any],
+    ) -> tuple[str, builtins.list[Any]]:
+        clauses = []
+        params = []
+        for field_name, value in filters.items():
+            sql_value = self._sql_value(field_name, value)
+            if sql_value is None:
+                clauses.append(f"{_column(field_name)} IS NULL")
+            else:
+                clauses.append(f"{_column(field_name)} = ?")
+                params.append(sql_value)
+        return " AND ".join(clauses) or "1", params
+
+    def _range_clause(
+        self,
+        field_name: str,
+        lo: Any,
+        hi: Any,
+    ) -> tuple[str, builtins.list[Any]]:
+        column = _column(field_name)
+        clauses = [f"{column} IS NOT NULL"]
+        params = []
+        if lo is not None:
+            clauses.append(f"{column} >= ?")
+            params.append(self._sql_value(field_name, lo))
+        if hi is not None:
+            clauses.append(f"{column} <= ?")
+            params.append(self._sql_value(field_name, hi))
+        return " AND ".join(clauses), params
+
+    def _sql_value(self, field_name: str, value: Any) -> Any:
+        """Serialize a query value the way the field is stored in the document."""
+        if field_name not in self._model.model_fields:
+            raise _UnmatchableError(field_name)
+
+        adapter = _adapter(self._model, field_name)
+        try:
+            sql_value = adapter.dump_python(adapter.validate_python(value), mode="json")
+        except ValidationError as e:
+            raise _UnmatchableError(field_name) from e
+
+        if isinstance(sql_value, dict | list):
+            # Nested documents are not comparable with a scalar parameter
+            raise _UnmatchableError(field_name)
+        return sql_value
+
+    def _check_field(self, field_name: str) -> None:
+        if field_name not in self._model.model_fields:
+            raise ValueError(f"{self._model.__name__} has no field {field_name!r}")
+
+
+def _span(windows: Sequence[tuple[Any, Any]]) -> tuple[Any, Any]:
+    """Return the (lo, hi) window covering every window, None if unbounded."""
+    los = [lo for lo, _ in windows]
+    his = [hi for _, hi in windows]
+    return (
+        None if None in los else min(los),
+        None if None in his else max(his),
+    )
+
+
+def _column(field_name: str) -> str:
+    # Field names are checked against the model, so they are safe to inline;
+    # index lookups only work when queries repeat this exact expression
+    return f"json_extract(data, '$.{field_name}')"
+
+
+def _json_list(values: builtins.list[str]) -> str:
+    return TypeAdapter(builtins.list[str]).dump_json(values).decode()
+
+
+@cache
+def _adapter(model: type[BaseModel], field_name: str) -> TypeAdapter[Any]:
+    annotation = model.model_fields[field_name].annotation
+    return TypeAdapter(annotation if annotation is not None else Any)
@@ -1,15 +1,24 @@
 from dashboard.data.models.targeting import AudienceTargetingSchema, InterestSchema
 from dashboard.data.store.memory_store import InMemoryStore
+from dashboard.settings import INTEREST_STORE_MAX_BYTES, TARGETING_STORE_MAX_BYTES
 
 
 class TargetingStore(InMemoryStore[AudienceTargetingSchema]):
     def __init__(self) -> None:
-        super().__init__(id_field="id", max_items=5000)
+        super().__init__(
+            id_field="id",
+            max_items=None,
+            max_bytes=TARGETING_STORE_MAX_BYTES,
+        )
 
 
 class InterestStore(InMemoryStore[InterestSchema]):
     def __init__(self) -> None:
-        super().__init__(id_field="id", max_items=1000)
+        super().__init__(
+            id_field="id",
+            max_items=None,
+            max_bytes=INTEREST_STORE_MAX_BYTES,
+        )
         self.add_index("category")
 
     def get_by_category(self, category: str) -> list[InterestSchema]:
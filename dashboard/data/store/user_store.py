@@ -1,10 +1,15 @@
 from dashboard.data.models.user import UserSchema
 from dashboard.data.store.memory_store import InMemoryStore
+from dashboard.settings import USER_STORE_MAX_BYTES
 
 
 class UserStore(InMemoryStore[UserSchema]):
     def __init__(self) -> None:
-        super().__init__(id_field="id", max_items=1000)
+        super().__init__(
+            id_field="id",
+            max_items=None,
+            max_bytes=USER_STORE_MAX_BYTES,
+        )
         self.add_index("username")
         self.add_index("email")
 
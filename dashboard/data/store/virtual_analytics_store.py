@@ -0,0 +1,411 @@
+import builtins
+import threading
+from collections.abc import Iterable, Sequence
+from datetime import UTC, date, datetime
+from uuid import UUID
+
+import numpy as np
+import numpy.typing as npt
+
+from dashboard.data.models.analytics import (
+    CampaignAnalyticsSchema,
+    DateBucketSchema,
+    MetricsSchema,
+    MetricTotalsSchema,
+)
+from dashboard.data.models.campaign import CampaignSchema
+from dashboard.data.store.campaign_store import CampaignStore, SQLiteCampaignStore
+from dashboard.data.store.daily_matrix import DailyMetricMatrix
+from dashboard.data.store.generation import next_generation
+from dashboard.data.store.hyperloglog import hash_integers, hash_strings
+from dashboard.data.store.quantile_sketch import QuantileSketch
+
+# Days of history a campaign has before it was created; traffic grows 50%
+# across them and holds from then on, as in generate_synthetic_analytics
+VIRTUAL_HISTORY_DAYS = 31
+# Independent random draws per campaign and per campaign-day
+_BASE_IMPRESSIONS, _BASE_CTR, _BASE_COST = range(3)
+_IMPRESSIONS_NOISE, _CTR_NOISE, _COST_NOISE, _ID_HIGH, _ID_LOW = range(5)
+_STREAM_STEP = 0xD1B54A32D192ED03
+_DAY_STEP = np.uint64(0x9E3779B97F4A7C15)
+_NO_END = date.max.toordinal()
+_SATURDAY = 5
+_READ_ONLY = (
+    "The virtual analytics store is computed from the campaigns and cannot be "
+    "written to; pick another ANALYTICS_STORE_BACKEND to load analytics"
+)
+
+
+class _CampaignTable:
+    """Per-campaign inputs of the virtual rows, built from the campaign store."""
+
+    __slots__ = (
+        "base_cost",
+        "base_ctr",
+        "base_impressions",
+        "campaign_ids",
+        "codes",
+        "first_days",
+        "keys",
+        "last_days",
+    )
+
+    def __init__(self, campaigns: Sequence[CampaignSchema]) -> None:
+        self.campaign_ids = [campaign.id for campaign in campaigns]
+        self.codes = {
+            campaign_id: code for code, campaign_id in enumerate(self.campaign_ids)
+        }
+        self.keys = hash_strings(self.campaign_ids)
+        self.first_days = np.array(
+            [
+                campaign.created_at.date().toordinal() - VIRTUAL_HISTORY_DAYS + 1
+                for campaign in campaigns
+            ],
+            dtype=np.int64,
+        )
+        self.last_days = np.array(
+            [
+                campaign.end_date.date().toordinal() if campaign.end_date else _NO_END
+                for campaign in campaigns
+            ],
+            dtype=np.int64,
+        )
+        self.base_impressions = np.floor(
+            500 + 1501 * _uniform(self.keys, _BASE_IMPRESSIONS),
+        )
+        self.base_ctr = 1.5 + 3 * _uniform(self.keys, _BASE_CTR)
+        self.base_cost = 50 + 150 * _uniform(self.keys, _BASE_COST)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(
+            getattr(self, name).nbytes
+            for name in self.__slots__
+            if isinstance(getattr(self, name), np.ndarray)
+        )
+
+
+class _VirtualRows:
+    """Rows of a query as parallel arrays, ordered by campaign then date."""
+
+    __slots__ = ("clicks", "codes", "cost", "ctr", "days", "impressions", "keys")
+
+    def __init__(
+        self,
+        table: _CampaignTable,
+        codes: npt.NDArray[np.int64],
+        first: npt.NDArray[np.int64],
+        last: npt.NDArray[np.int64],
+    ) -> None:
+        counts = np.clip(last - first + 1, 0, None)
+        offsets = np.cumsum(counts) - counts
+        self.codes = np.repeat(codes, counts)
+        self.days = np.arange(counts.sum()) + np.repeat(first - offsets, counts)
+        self.keys = table.keys[self.codes] ^ (self.days.astype(np.uint64) * _DAY_STEP)
+
+        ramp = VIRTUAL_HISTORY_DAYS - 1
+        trend = (
+            1 + 0.5 * np.minimum(self.days - table.first_days[self.codes], ramp) / ramp
+        )
+        # Ordinal 1 is a Monday
+        weekend_boost = np.where((self.days - 1) % 7 >= _SATURDAY, 1.2, 1.0)
+
+        self.impressions = np.floor(
+            table.base_impressions[self.codes]
+            * trend
+            * weekend_boost
+            * (0.8 + 0.4 * _uniform(self.keys, _IMPRESSIONS_NOISE)),
+        ).astype(np.int64)
+        self.ctr = table.base_ctr[self.codes] * (
+            0.9 + 0.2 * _uniform(self.keys, _CTR_NOISE)
+        )
+        self.clicks = np.floor(self.impressions * self.ctr / 100).astype(np.int64)
+        self.cost = np.round(
+            table.base_cost[self.codes]
+            * trend
+            * (0.9 + 0.2 * _uniform(self.keys, _COST_NOISE)),
+            2,
+        )
+
+
+class VirtualAnalyticsStore:
+    """Mock daily analytics computed on demand from the campaigns, never stored.
+
+    A campaign's row for a day is a pure function of the campaign and the
+    date: base metrics and daily noise are hashes of the campaign ID and the
+    day, so any date range can be computed without the days around it, and
+    processes holding the same campaigns compute the same rows. Rows run from
+    VIRTUAL_HISTORY_DAYS before the campaign was created through today or its
+    end date, with the trend, weekend boost and noise of
+    generate_synthetic_analytics. Campaign IDs are random and stamped at
+    creation, so rows only survive a restart when the campaigns do, e.g. with
+    STORE_DATA_DIR or the SQLite campaign backend. Only a few numbers per
+    campaign stay in memory. It offers the read side of the AnalyticsStore
+    API and cannot be written to.
+    """
+
+    def __init__(self, campaign_store: CampaignStore | SQLiteCampaignStore) -> None:
+        self._campaign_store = campaign_store
+        self._mutex = threading.Lock()
+        self._generation = next_generation()
+        self._seen: tuple[int, int] | None = None
+        self._table: _CampaignTable | None = None
+        self._table_generation: int | None = None
+
+    def get_by_campaign(
+        self,
+        campaign_id: str,
+    ) -> builtins.list[CampaignAnalyticsSchema]:
+        return self._materialize(self._rows(date.min, _today(), campaign_id))
+
+    def get_by_date(self, target_date: date) -> builtins.list[CampaignAnalyticsSchema]:
+        return self.get_by_date_range(target_date, target_date)
+
+    def get_by_date_range(
+        self,
+        start_date: date,
+        end_date: date,
+    ) -> builtins.list[CampaignAnalyticsSchema]:
+        rows = self._rows(start_date, end_date)
+        return self._materialize(rows, np.argsort(rows.days, kind="stable"))
+
+    def get_by_campaign_and_date_range(
+        self,
+        campaign_id: str,
+        start_date: date,
+        end_date: date,
+    ) -> builtins.list[CampaignAnalyticsSchema]:
+        return self._materialize(self._rows(start_date, end_date, campaign_id))
+
+    def summarize(
+        self,
+        campaign_id: str,
+        start_date: date,
+        end_date: date,
+    ) -> MetricTotalsSchema:
+        """Sum one campaign's metrics over an inclusive date window."""
+        rows = self._rows(start_date, end_date, campaign_id)
+        return MetricTotalsSchema(
+            impressions=int(rows.impressions.sum()),
+            clicks=int(rows.clicks.sum()),
+            cost_usd=float(rows.cost.sum()),
+            days=len(rows.days),
+        )
+
+    def summarize_all(
+        self,
+        start_date: date,
+        end_date: date,
+    ) -> dict[str, MetricTotalsSchema]:
+        """Sum every campaign's metrics over a window in one grouped pass."""
+        return {
+            campaign_id: totals[0]
+            for campaign_id, totals in self.summarize_periods(
+                [(start_date, end_date)],
+            ).items()
+        }
+
+    def summarize_periods(
+        self,
+        periods: Sequence[tuple[date, date]],
+        campaign_id: str | None = None,
+    ) -> dict[str, builtins.list[MetricTotalsSchema]]:
+        """Sum metrics per campaign over several date windows in one pass.
+
+        The span of all windows is computed once and split per window.
+        """
+        if not periods:
+            return {}
+        table = self._campaigns()
+        rows = self._rows(
+            min(start for start, _ in periods),
+            max(end for _, end in periods),
+            campaign_id,
+        )
+        windows = [
+            [
+                np.bincount(
+                    rows.codes[inside],
+                    weights=weights,
+                    minlength=len(table.campaign_ids),
+                )
+                for weights in (
+                    None,
+                    rows.impressions[inside],
+                    rows.clicks[inside],
+                    rows.cost[inside],
+                )
+            ]
+            for inside in (
+                (rows.days >= start.toordinal()) & (rows.days <= end.toordinal())
+                for start, end in periods
+            )
+        ]
+        active = np.flatnonzero(sum(window[0] for window in windows))
+        return {
+            table.campaign_ids[code]: [
+                MetricTotalsSchema(
+                    impressions=int(impressions[code]),
+                    clicks=int(clicks[code]),
+                    cost_usd=float(cost[code]),
+                    days=int(row_counts[code]),
+                )
+                for row_counts, impressions, clicks, cost in windows
+            ]
+            for code in active.tolist()
+        }
+
+    def daily_matrix(self, start_date: date, end_date: date) -> DailyMetricMatrix:
+        """Lay out every campaign's daily metrics in a window as a matrix."""
+        table = self._campaigns()
+        rows = self._rows(start_date, end_date)
+        codes, matrix_rows = np.unique(rows.codes, return_inverse=True)
+        matrix = DailyMetricMatrix(
+            [table.campaign_ids[code] for code in codes.tolist()],
+            start_date,
+            (end_date - start_date).days + 1,
+        )
+        matrix.fill(
+            matrix_rows,
+            rows.days - start_date.toordinal(),
+            (rows.impressions, rows.clicks, rows.cost),
+        )
+        return matrix
+
+    def rollup_totals(
+        self,
+        campaign_id: str,
+        buckets: builtins.list[DateBucketSchema],
+    ) -> builtins.list[MetricTotalsSchema]:
+        """Sum one campaign's metrics per bucket, computing only its days."""
+        return [
+            self.summarize(campaign_id, bucket.start_date, bucket.end_date)
+            for bucket in buckets
+        ]
+
+    def distribution_sketches(
+        self,
+        buckets: builtins.list[DateBucketSchema],
+        campaign_id: str | None = None,
+    ) -> tuple[QuantileSketch, ...]:
+        """Sketch daily CPC and spend over buckets from their computed rows."""
+        cpc, spend = QuantileSketch(), QuantileSketch()
+        for bucket in buckets:
+            rows = self._rows(bucket.start_date, bucket.end_date, campaign_id)
+            clicked = rows.clicks > 0
+            cpc.add_array(rows.cost[clicked] / rows.clicks[clicked])
+            spend.add_array(rows.cost)
+        return cpc, spend
+
+    def add(self, item: CampaignAnalyticsSchema) -> CampaignAnalyticsSchema:  # noqa: ARG002
+        raise ValueError(_READ_ONLY)
+
+    def add_many(
+        self,
+        items: Iterable[CampaignAnalyticsSchema],  # noqa: ARG002
+    ) -> builtins.list[CampaignAnalyticsSchema]:
+        raise ValueError(_READ_ONLY)
+
+    def count(self) -> int:
+        """Number of rows up to today, counted without computing them."""
+        table = self._campaigns()
+        last = np.minimum(table.last_days, _today().toordinal())
+        return int(np.clip(last - table.first_days + 1, 0, None).sum())
+
+    def size_bytes(self) -> int:
+        """Bytes held per campaign; rows take none until they are queried."""
+        return self._campaigns().nbytes
+
+    @property
+    def generation(self) -> int:
+        """Number that grows when the campaigns change or a new day begins."""
+        with self._mutex:
+            seen = (self._campaign_store.generation, _today().toordinal())
+            if seen != self._seen:
+                self._seen = seen
+                self._generation = next_generation()
+            return self._generation
+
+    def _campaigns(self) -> _CampaignTable:
+        generation = self._campaign_store.generation
+        with self._mutex:
+            if self._table is None or self._table_generation != generation:
+                self._table = _CampaignTable(self._campaign_store.list())
+                self._table_generation = generation
+            return self._table
+
+    def _rows(
+        self,
+        start_date: date,
+        end_date: date,
+        campaign_id: str | None = None,
+    ) -> _VirtualRows:
+        """Compute the rows of one or every campaign between two dates."""
+        table = self._campaigns()
+        if campaign_id is None:
+            codes = np.arange(len(table.campaign_ids))
+        else:
+            code = table.codes.get(campaign_id)
+            codes = np.array([] if code is None else [code], dtype=np.int64)
+
+        last_day = min(end_date, _today()).toordinal()
+        return _VirtualRows(
+            table,
+            codes,
+            np.maximum(table.first_days[codes], start_date.toordinal()),
+            np.minimum(table.last_days[codes], last_day),
+        )
+
+    def _materialize(
+        self,
+        rows: _VirtualRows,
+        order: npt.NDArray[np.intp] | None = None,
+    ) -> builtins.list[CampaignAnalyticsSchema]:
+        """Build models of rows, in order if given; IDs are hashes too."""
+        table = self._campaigns()
+        if order is None:
+            order = np.arange(len(rows.days))
+        keys = rows.keys[order]
+        ids = (
+            np.column_stack([_hash(keys, _ID_HIGH), _hash(keys, _ID_LOW)])
+            .astype(">u8")
+            .tobytes()
+        )
+        # Values are valid by construction, so skip per-row validation
+        return [
+            CampaignAnalyticsSchema.model_construct(
+                id=str(UUID(bytes=ids[16 * row : 16 * row + 16], version=4)),
+                campaign_id=table.campaign_ids[code],
+                date=date.fromordinal(day),
+                metrics=MetricsSchema.model_construct(
+                    impressions=impressions,
+                    clicks=clicks,
+                    ctr_pct=ctr,
+                    cost_usd=cost,
+                ),
+            )
+            for row, (code, day, impressions, clicks, ctr, cost) in enumerate(
+                zip(
+                    rows.codes[order].tolist(),
+                    rows.days[order].tolist(),
+                    rows.impressions[order].tolist(),
+                    rows.clicks[order].tolist(),
+                    rows.ctr[order].tolist(),
+                    rows.cost[order].tolist(),
+                    strict=True,
+                ),
+            )
+        ]
+
+
+def _hash(keys: npt.NDArray[np.uint64], stream: int) -> npt.NDArray[np.uint64]:
+    return hash_integers(keys + np.uint64((stream + 1) * _STREAM_STEP % 2**64))
+
+
+def _uniform(keys: npt.NDArray[np.uint64], stream: int) -> npt.NDArray[np.float64]:
+    """Map keys to floats in [0, 1), independently for each stream."""
+    return (_hash(keys, stream) >> np.uint64(11)).astype(np.float64) * 2.0**-53
+
+
+def _today() -> date:
+    return datetime.now(UTC).date()
@@ -1,11 +1,35 @@
 from dashboard.services.analytics_service import (
     calculate_campaign_performance_summary,  # noqa: F401
+    clear_cache,  # noqa: F401
+    compare_all_campaigns_performance,  # noqa: F401
+    compare_campaign_performance,  # noqa: F401
+    estimate_unique_users,  # noqa: F401
+    generate_hourly_analytics,  # noqa: F401
     generate_mock_analytics_data,  # noqa: F401
+    generate_reach_sketches,  # noqa: F401
+    generate_synthetic_analytics,  # noqa: F401
     get_all_campaigns_performance,  # noqa: F401
+    get_cache_stats,  # noqa: F401
     get_campaign_analytics,  # noqa: F401
+    get_campaign_metric_series,  # noqa: F401
+    get_campaign_rollup_series,  # noqa: F401
+    get_metric_distribution,  # noqa: F401
+    load_synthetic_analytics,  # noqa: F401
+    plan_date_buckets,  # noqa: F401
+    previous_period,  # noqa: F401
+)
+from dashboard.services.anomaly_service import (
+    detect_anomalies,  # noqa: F401
+)
+from dashboard.services.forecast_service import (
+    forecast_all_campaigns,  # noqa: F401
+    get_campaign_forecast,  # noqa: F401
 )
 from dashboard.services.openrouter_service import (
     AdCopyRequestSchema,  # noqa: F401
     generate_ad_copy,  # noqa: F401
     generate_campaign_name,  # noqa: F401
 )
+from dashboard.services.pacing_service import (
+    calculate_budget_pacing,  # noqa: F401
+)
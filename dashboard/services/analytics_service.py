@@ -1,65 +1,279 @@
-import random
-from datetime import UTC, date, datetime, timedelta
+import math
+from datetime import UTC, date, datetime, time, timedelta
+from uuid import UUID, uuid4
 
-import streamlit as st
+import numpy as np
+import numpy.typing as npt
 
-from dashboard.data.models.analytics import CampaignAnalyticsSchema, MetricsSchema
-from dashboard.data.store import analytics_store, campaign_store
+from dashboard.data.models.analytics import (
+    CampaignAnalyticsSchema,
+    CampaignHourlyMetricsSchema,
+    DateBucketSchema,
+    MetricQuantilesSchema,
+    MetricSeriesPointSchema,
+    MetricsSchema,
+    MetricsSummarySchema,
+    MetricTotalsSchema,
+    PeriodComparisonSchema,
+    RollupGranularityEnum,
+    SeriesResolutionEnum,
+)
+from dashboard.data.store import (
+    analytics_store,
+    campaign_store,
+    hourly_analytics_store,
+    reach_store,
+)
+from dashboard.data.store.analytics_store import DISTRIBUTION_METRICS
+from dashboard.data.store.hyperloglog import hash_integers
+from dashboard.data.store.virtual_analytics_store import VirtualAnalyticsStore
+from dashboard.services.result_cache import CacheStatsSchema, result_cache
+from dashboard.settings import USE_MOCK_DATA
+
+MOCK_ANALYTICS_DAYS = 31
+MOCK_HOURLY_DAYS = 7
+_MOCK_USER_POOL = 1_000_000
+_MOCK_AUDIENCE_SIZE = 20_000
+# Most points a performance chart is given; longer windows are downsampled
+MAX_SERIES_POINTS = 100
+_SYNTHETIC_CHUNK_ROWS = 250_000
+_ROLLUPS_LARGEST_FIRST = [RollupGranularityEnum.MONTH, RollupGranularityEnum.WEEK]
+# Share of a day's traffic per UTC hour: quiet overnight, peaking in the evening
+_HOURLY_SHARE = 1.2 - np.cos((np.arange(24) - 2) / 24 * 2 * np.pi)
+_HOURLY_SHARE /= _HOURLY_SHARE.sum()
 
 
-@st.cache_data(ttl=3600)
 def generate_mock_analytics_data() -> None:
-    """Generate mock analytics data for all campaigns."""
-    # Only generate data if analytics store is empty
-    if analytics_store.count() > 0:
+    """Fill the analytics stores with mock data when USE_MOCK_DATA is on.
+
+    A virtual analytics store computes daily rows on demand, so only the
+    hourly and reach stores are filled, from its last MOCK_ANALYTICS_DAYS.
+    Any other store gets materialized rows for every campaign while empty.
+    """
+    if not USE_MOCK_DATA:
         return
 
     campaigns = campaign_store.list()
     if not campaigns:
         return
 
-    # Generate 30 days of data for each campaign
-    end_date = datetime.now(UTC).date()
-    start_date = end_date - timedelta(days=30)
+    if isinstance(analytics_store, VirtualAnalyticsStore):
+        if hourly_analytics_store.count() > 0:
+            return
+        today = datetime.now(UTC).date()
+        rows = analytics_store.get_by_date_range(
+            today - timedelta(days=MOCK_ANALYTICS_DAYS - 1),
+            today,
+        )
+    else:
+        if analytics_store.count() > 0:
+            return
+        # Generate the last 30 days of data, plus today, for each campaign
+        rows = generate_synthetic_analytics(
+            [campaign.id for campaign in campaigns],
+            days=MOCK_ANALYTICS_DAYS,
+        )
+        analytics_store.add_many(rows)
+    if not rows:
+        return
+
+    generate_reach_sketches(rows)
+
+    # Split the most recent days into hours for intraday charts
+    hourly_from = rows[-1].date - timedelta(days=MOCK_HOURLY_DAYS - 1)
+    hourly_analytics_store.add_many(
+        generate_hourly_analytics([row for row in rows if row.date >= hourly_from]),
+    )
+
+
+def generate_synthetic_analytics(
+    campaign_ids: list[str],
+    days: int,
+    seed: int | None = None,
+    end_date: date | None = None,
+) -> list[CampaignAnalyticsSchema]:
+    """Generate daily analytics rows for campaigns over the days up to end_date.
+
+    Each campaign gets a random base reach, CTR and daily cost. Days follow a
+    trend that grows 50% across the window, a 20% weekend boost and noise, all
+    drawn as (campaign, day) NumPy arrays in one go. The same seed and end date
+    reproduce the same rows, IDs included.
+    """
+    end_date = end_date or datetime.now(UTC).date()
+    start_date = end_date - timedelta(days=days - 1)
+    rng = np.random.default_rng(seed)
+    shape = (len(campaign_ids), days)
+
+    # Base metrics that will grow/fluctuate over time
+    base_impressions = rng.integers(500, 2001, size=(len(campaign_ids), 1))
+    base_ctr = rng.uniform(1.5, 4.5, size=(len(campaign_ids), 1))
+    base_cost = rng.uniform(50, 200, size=(len(campaign_ids), 1))
+
+    offsets = np.arange(days)
+    day_factor = 1 + offsets / max(days - 1, 1) * 0.5
+    weekend_boost = np.where((start_date.weekday() + offsets) % 7 >= 5, 1.2, 1.0)  # noqa: PLR2004
+
+    impressions = np.floor(
+        base_impressions * day_factor * weekend_boost * rng.uniform(0.8, 1.2, shape),
+    ).astype(np.int64)
+    ctr = base_ctr * rng.uniform(0.9, 1.1, shape)
+    clicks = np.floor(impressions * ctr / 100).astype(np.int64)
+    cost = np.round(base_cost * day_factor * rng.uniform(0.9, 1.1, shape), 2)
+    ids = rng.bytes(16 * impressions.size)
+
+    dates = [start_date + timedelta(days=offset) for offset in range(days)]
+    columns = zip(
+        impressions.ravel().tolist(),
+        clicks.ravel().tolist(),
+        ctr.ravel().tolist(),
+        cost.ravel().tolist(),
+        strict=True,
+    )
+    # Values are valid by construction, so skip per-row validation
+    return [
+        CampaignAnalyticsSchema.model_construct(
+            id=str(UUID(bytes=ids[16 * row : 16 * row + 16], version=4)),
+            campaign_id=campaign_ids[row // days],
+            date=dates[row % days],
+            metrics=MetricsSchema.model_construct(
+                impressions=row_impressions,
+                clicks=row_clicks,
+                ctr_pct=row_ctr,
+                cost_usd=row_cost,
+            ),
+        )
+        for row, (row_impressions, row_clicks, row_ctr, row_cost) in enumerate(
+            columns,
+        )
+    ]
+
+
+def generate_hourly_analytics(
+    daily_rows: list[CampaignAnalyticsSchema],
+    seed: int | None = None,
+) -> list[CampaignHourlyMetricsSchema]:
+    """Split daily rows into 24 hourly rows that add up to the day exactly.
+
+    Impressions follow a diurnal curve, clicks land on a random subset of each
+    hour's impressions and cost follows the impressions.
+    """
+    rng = np.random.default_rng(seed)
+    impressions = np.array([row.metrics.impressions for row in daily_rows])
+    clicks = [row.metrics.clicks for row in daily_rows]
+    cost = np.array([row.metrics.cost_usd for row in daily_rows])
 
-    for campaign in campaigns:
-        current_date = start_date
+    hourly_impressions = rng.multinomial(impressions, _HOURLY_SHARE)
+    hourly_clicks = np.array(
+        [
+            rng.multivariate_hypergeometric(hours, day_clicks)
+            for hours, day_clicks in zip(hourly_impressions, clicks, strict=True)
+        ],
+    ).reshape(hourly_impressions.shape)
+    share = np.divide(
+        hourly_impressions,
+        impressions[:, None],
+        out=np.full(hourly_impressions.shape, 1 / 24),
+        where=impressions[:, None] > 0,
+    )
+    hourly_cost = cost[:, None] * share
+    hourly_ctr = np.divide(
+        hourly_clicks * 100,
+        hourly_impressions,
+        out=np.zeros(hourly_impressions.shape),
+        where=hourly_impressions > 0,
+    )
+
+    return [
+        CampaignHourlyMetricsSchema.model_construct(
+            id=str(uuid4()),
+            campaign_id=row.campaign_id,
+            hour=datetime.combine(row.date, time(hour), tzinfo=UTC),
+            metrics=MetricsSchema.model_construct(
+                impressions=int(hourly_impressions[day, hour]),
+                clicks=int(hourly_clicks[day, hour]),
+                ctr_pct=float(hourly_ctr[day, hour]),
+                cost_usd=float(hourly_cost[day, hour]),
+            ),
+        )
+        for day, row in enumerate(daily_rows)
+        for hour in range(24)
+    ]
 
-        # Base metrics that will grow/fluctuate over time
-        base_impressions = random.randint(500, 2000)
-        base_ctr = random.uniform(1.5, 4.5)
-        base_cost = random.uniform(50, 200)
 
-        while current_date <= end_date:
-            # Add randomness and trends
-            day_factor = 1 + ((current_date - start_date).days / 30) * 0.5
-            weekend_boost = 1.2 if current_date.weekday() >= 5 else 1.0  # noqa: PLR2004
-            random_factor = random.uniform(0.8, 1.2)
+def generate_reach_sketches(
+    daily_rows: list[CampaignAnalyticsSchema],
+    seed: int | None = None,
+) -> None:
+    """Record mock users reached for daily rows in the reach store.
 
-            impressions = int(
-                base_impressions * day_factor * weekend_boost * random_factor,
-            )
-            ctr = base_ctr * random.uniform(0.9, 1.1)
-            clicks = int(impressions * (ctr / 100))
-            cost = base_cost * day_factor * random.uniform(0.9, 1.1)
+    Each campaign draws its audience from a shared pool of users, so audiences
+    overlap across campaigns, and reaches about 60% of a day's impressions as
+    distinct users, so the same users recur across days.
+    """
+    rng = np.random.default_rng(seed)
+    audiences: dict[str, npt.NDArray[np.int64]] = {}
+    for row in daily_rows:
+        audience = audiences.get(row.campaign_id)
+        if audience is None:
+            audience = rng.integers(0, _MOCK_USER_POOL, size=_MOCK_AUDIENCE_SIZE)
+            audiences[row.campaign_id] = audience
 
-            metrics = MetricsSchema(
-                impressions=impressions,
-                clicks=clicks,
-                ctr_pct=ctr,
-                cost_usd=round(cost, 2),
-            )
+        visitors = rng.choice(audience, size=int(row.metrics.impressions * 0.6))
+        reach_store.add_users(row.campaign_id, row.date, hash_integers(visitors))
 
-            analytics = CampaignAnalyticsSchema(
-                campaign_id=campaign.id,
-                date=current_date,
-                metrics=metrics,
-            )
 
-            analytics_store.add(analytics)
-            current_date += timedelta(days=1)
+@result_cache.memoize("reach_store", "campaign_store")
+def estimate_unique_users(
+    start_date: date,
+    end_date: date,
+    campaign_ids: list[str] | None = None,
+) -> int:
+    """Estimate distinct users reached by some or all campaigns in a date range.
+
+    All campaigns means those in campaign_store, as in the other overall views,
+    so sketches left by removed campaigns are not counted.
+    """
+    if campaign_ids is None:
+        campaign_ids = [campaign.id for campaign in campaign_store.list()]
+    return reach_store.estimate_reach(start_date, end_date, campaign_ids)
+
+
+def load_synthetic_analytics(
+    scale: int,
+    days: int,
+    seed: int = 0,
+    end_date: date | None = None,
+) -> int:
+    """Bulk-load synthetic analytics for scale campaigns and return the row count.
+
+    Campaigns are named synthetic-campaign-<n> and generated in chunks, so
+    years of data for tens of thousands of campaigns never sit in memory as
+    models all at once. Each chunk gets its own seed derived from seed.
+    """
+    end_date = end_date or datetime.now(UTC).date()
+    campaigns_per_chunk = max(_SYNTHETIC_CHUNK_ROWS // max(days, 1), 1)
+    chunk_seeds = np.random.SeedSequence(seed).spawn(
+        math.ceil(scale / campaigns_per_chunk),
+    )
+
+    loaded = 0
+    for chunk, chunk_seed in enumerate(chunk_seeds):
+        first = chunk * campaigns_per_chunk
+        campaign_ids = [
+            f"synthetic-campaign-{number}"
+            for number in range(first, min(first + campaigns_per_chunk, scale))
+        ]
+        rows = generate_synthetic_analytics(
+            campaign_ids,
+            days,
+            seed=int(chunk_seed.generate_state(1)[0]),
+            end_date=end_date,
+        )
+        loaded += len(analytics_store.add_many(rows))
+    return loaded
 
 
+@result_cache.memoize("analytics_store")
 def get_campaign_analytics(
     campaign_id: str,
     start_date: date,
@@ -73,51 +287,353 @@ def get_campaign_analytics(
     )
 
 
+@result_cache.memoize("analytics_store")
+def get_campaign_rollup_series(
+    campaign_id: str,
+    start_date: date,
+    end_date: date,
+    granularity: RollupGranularityEnum,
+) -> list[CampaignAnalyticsSchema]:
+    """Get one analytics point per day, week or month in a date range.
+
+    Whole weeks and months come from the rollup tables; partial periods at the
+    edges are summed from daily rows. Each point is dated at its period start.
+    """
+    if granularity is RollupGranularityEnum.DAY:
+        return get_campaign_analytics(campaign_id, start_date, end_date)
+
+    # Plan each period on its own so no week bucket straddles two months
+    buckets: list[DateBucketSchema] = []
+    periods: list[date] = []
+    period_start = granularity.period_start(start_date)
+    while period_start <= end_date:
+        period_end = granularity.period_end(period_start)
+        segment = plan_date_buckets(
+            max(period_start, start_date),
+            min(period_end, end_date),
+            granularity,
+        )
+        buckets.extend(segment)
+        periods.extend(period_start for _ in segment)
+        period_start = period_end + timedelta(days=1)
+
+    grouped: dict[date, list[MetricTotalsSchema]] = {}
+    totals = analytics_store.rollup_totals(campaign_id, buckets)
+    for period, bucket_totals in zip(periods, totals, strict=True):
+        if bucket_totals.days:
+            grouped.setdefault(period, []).append(bucket_totals)
+
+    return [
+        CampaignAnalyticsSchema(
+            campaign_id=campaign_id,
+            date=period,
+            metrics=_summary_metrics(_combine(parts)),
+        )
+        for period, parts in grouped.items()
+    ]
+
+
+@result_cache.memoize("analytics_store", "hourly_analytics_store")
+def get_campaign_metric_series(
+    campaign_id: str,
+    start_date: date,
+    end_date: date,
+    resolution: SeriesResolutionEnum | None = None,
+    max_points: int = MAX_SERIES_POINTS,
+) -> list[MetricSeriesPointSchema]:
+    """Get a campaign's metrics at a resolution that fits the date range.
+
+    Without a resolution the finest one that stays within max_points is used:
+    hourly for a few days, daily for a month or a quarter, weekly for a year.
+    A requested resolution that would exceed max_points is coarsened the same
+    way. Hours come from the hourly store; days fall back to daily rows when a
+    campaign has no hourly data in the range.
+    """
+    window_start = datetime.combine(start_date, time.min, tzinfo=UTC)
+    window_end = datetime.combine(end_date, time(23), tzinfo=UTC)
+    fitting = SeriesResolutionEnum.fitting(window_start, window_end, max_points)
+    resolution = fitting.coarsest(resolution or fitting)
+
+    if resolution is SeriesResolutionEnum.HOUR:
+        hourly = hourly_analytics_store.downsample(
+            campaign_id,
+            window_start,
+            window_end,
+            resolution,
+        )
+        if hourly:
+            return [
+                MetricSeriesPointSchema(
+                    campaign_id=campaign_id,
+                    start=hour,
+                    resolution=resolution,
+                    metrics=_summary_metrics(totals),
+                )
+                for hour, totals in hourly.items()
+            ]
+        resolution = SeriesResolutionEnum.DAY
+
+    series = get_campaign_rollup_series(
+        campaign_id,
+        start_date,
+        end_date,
+        RollupGranularityEnum(resolution.value),
+    )
+    return [
+        MetricSeriesPointSchema(
+            campaign_id=campaign_id,
+            start=datetime.combine(point.date, time.min, tzinfo=UTC),
+            resolution=resolution,
+            metrics=point.metrics,
+        )
+        for point in series
+    ]
+
+
+def plan_date_buckets(
+    start_date: date,
+    end_date: date,
+    largest: RollupGranularityEnum = RollupGranularityEnum.MONTH,
+) -> list[DateBucketSchema]:
+    """Cover a date range with the largest whole rollup buckets plus daily edges.
+
+    Whole months come first, then whole ISO weeks in the leftovers on either
+    side, then at most one daily range at each edge. A one-year range needs
+    about 20 buckets instead of 365 daily rows.
+    """
+    if largest not in _ROLLUPS_LARGEST_FIRST:
+        return _cover(start_date, end_date, [])
+    position = _ROLLUPS_LARGEST_FIRST.index(largest)
+    return _cover(start_date, end_date, _ROLLUPS_LARGEST_FIRST[position:])
+
+
+def _cover(
+    start_date: date,
+    end_date: date,
+    granularities: list[RollupGranularityEnum],
+) -> list[DateBucketSchema]:
+    if start_date > end_date:
+        return []
+    if not granularities:
+        return [
+            DateBucketSchema(
+                granularity=RollupGranularityEnum.DAY,
+                start_date=start_date,
+                end_date=end_date,
+            ),
+        ]
+
+    granularity, *smaller = granularities
+    first = start_date
+    if granularity.period_start(first) != first:
+        first = granularity.period_end(first) + timedelta(days=1)
+
+    whole = []
+    period_start = first
+    while period_start <= end_date:
+        period_end = granularity.period_end(period_start)
+        if period_end > end_date:
+            break
+        whole.append(
+            DateBucketSchema(
+                granularity=granularity,
+                start_date=period_start,
+                end_date=period_end,
+            ),
+        )
+        period_start = period_end + timedelta(days=1)
+
+    if not whole:
+        return _cover(start_date, end_date, smaller)
+    return [
+        *_cover(start_date, first - timedelta(days=1), smaller),
+        *whole,
+        *_cover(period_start, end_date, smaller),
+    ]
+
+
+@result_cache.memoize("analytics_store", "reach_store")
 def calculate_campaign_performance_summary(
     campaign_id: str,
     start_date: date,
     end_date: date,
-) -> MetricsSchema:
+) -> MetricsSummarySchema:
     """Calculate summary metrics for a campaign over a date range."""
-    analytics_list = get_campaign_analytics(campaign_id, start_date, end_date)
-
-    if not analytics_list:
-        return MetricsSchema(
-            impressions=0,
-            clicks=0,
-            ctr_pct=0,
-            cost_usd=0,
-        )
+    totals = analytics_store.summarize(campaign_id, start_date, end_date)
+    return _summary_with_reach(totals, start_date, end_date, [campaign_id])
 
-    total_impressions = sum(a.metrics.impressions for a in analytics_list)
-    total_clicks = sum(a.metrics.clicks for a in analytics_list)
-    total_cost = sum(a.metrics.cost_usd for a in analytics_list)
 
-    # Calculate overall CTR
-    overall_ctr = (
-        (total_clicks / total_impressions * 100) if total_impressions > 0 else 0
+def previous_period(start_date: date, end_date: date) -> tuple[date, date]:
+    """Return the equally long date range that ends the day before start_date."""
+    previous_end = start_date - timedelta(days=1)
+    return previous_end - (end_date - start_date), previous_end
+
+
+@result_cache.memoize("analytics_store", "reach_store")
+def compare_campaign_performance(
+    campaign_id: str,
+    start_date: date,
+    end_date: date,
+) -> PeriodComparisonSchema:
+    """Summarize a campaign over a date range and the period just before it.
+
+    Both periods are summed by the same store pass, so the comparison costs
+    about as much as the summary alone.
+    """
+    previous = previous_period(start_date, end_date)
+    totals = analytics_store.summarize_periods(
+        [(start_date, end_date), previous],
+        campaign_id,
+    )
+    current_totals, previous_totals = totals.get(campaign_id, _NO_PERIODS)
+    return PeriodComparisonSchema(
+        current=_summary_with_reach(
+            current_totals,
+            start_date,
+            end_date,
+            [campaign_id],
+        ),
+        previous=_summary_with_reach(previous_totals, *previous, [campaign_id]),
+        previous_start_date=previous[0],
+        previous_end_date=previous[1],
     )
 
-    return MetricsSchema(
-        impressions=total_impressions,
-        clicks=total_clicks,
-        ctr_pct=round(overall_ctr, 2),
-        cost_usd=round(total_cost, 2),
+
+@result_cache.memoize("analytics_store", "campaign_store", "reach_store")
+def compare_all_campaigns_performance(
+    start_date: date,
+    end_date: date,
+) -> PeriodComparisonSchema:
+    """Summarize all campaigns over a date range and the period just before it.
+
+    Reads the same pass as get_all_campaigns_performance for the range.
+    """
+    previous = previous_period(start_date, end_date)
+    periods = _campaign_period_totals(start_date, end_date).values()
+    return PeriodComparisonSchema(
+        current=_summary_with_reach(
+            _combine([current for current, _ in periods]),
+            start_date,
+            end_date,
+        ),
+        previous=_summary_with_reach(
+            _combine([totals for _, totals in periods]),
+            *previous,
+        ),
+        previous_start_date=previous[0],
+        previous_end_date=previous[1],
     )
 
 
+@result_cache.memoize("analytics_store")
+def get_metric_distribution(
+    start_date: date,
+    end_date: date,
+    campaign_id: str | None = None,
+) -> list[MetricQuantilesSchema]:
+    """Get p50/p90/p99 of daily CPC and spend for one or all campaigns.
+
+    Whole weeks and months are merged from per-bucket quantile sketches, so a
+    year costs about 20 merges; values are within 1% of the exact percentile.
+    Metrics without any qualifying day are left out. Without campaign_id every
+    stored day counts, including days of campaigns no longer in campaign_store,
+    since the store keeps one sketch of all campaigns per bucket.
+    """
+    buckets = plan_date_buckets(start_date, end_date)
+    sketches = analytics_store.distribution_sketches(buckets, campaign_id)
+
+    distributions = []
+    for metric, sketch in zip(DISTRIBUTION_METRICS, sketches, strict=True):
+        if sketch.count <= 0:
+            continue
+        p50, p90, p99 = (sketch.quantile(q) or 0.0 for q in (0.5, 0.9, 0.99))
+        distributions.append(
+            MetricQuantilesSchema(
+                metric=metric,
+                count=sketch.count,
+                p50=round(p50, 2),
+                p90=round(p90, 2),
+                p99=round(p99, 2),
+            ),
+        )
+    return distributions
+
+
+@result_cache.memoize("analytics_store", "campaign_store")
 def get_all_campaigns_performance(
     start_date: date,
     end_date: date,
 ) -> dict[str, MetricsSchema]:
     """Get performance metrics for all campaigns in the specified date range."""
-    campaigns = campaign_store.list()
-
     return {
-        campaign.id: calculate_campaign_performance_summary(
-            campaign.id,
+        campaign_id: _summary_metrics(current)
+        for campaign_id, (current, _) in _campaign_period_totals(
             start_date,
             end_date,
-        )
-        for campaign in campaigns
+        ).items()
     }
+
+
+@result_cache.memoize("analytics_store", "campaign_store")
+def _campaign_period_totals(
+    start_date: date,
+    end_date: date,
+) -> dict[str, list[MetricTotalsSchema]]:
+    """Sum each campaign over a range and the period before it in one pass.
+
+    Shared by the per-campaign and overall views, so a page showing both
+    reads the store once.
+    """
+    campaigns = campaign_store.list()
+    totals = analytics_store.summarize_periods(
+        [(start_date, end_date), previous_period(start_date, end_date)],
+    )
+    return {campaign.id: totals.get(campaign.id, _NO_PERIODS) for campaign in campaigns}
+
+
+def get_cache_stats() -> CacheStatsSchema:
+    """Return hit and miss counts of the services' query result cache."""
+    return result_cache.stats()
+
+
+def clear_cache() -> None:
+    result_cache.clear()
+
+
+_EMPTY_TOTALS = MetricTotalsSchema(impressions=0, clicks=0, cost_usd=0, days=0)
+_NO_PERIODS = [_EMPTY_TOTALS, _EMPTY_TOTALS]
+
+
+def _combine(parts: list[MetricTotalsSchema]) -> MetricTotalsSchema:
+    return MetricTotalsSchema(
+        impressions=sum(part.impressions for part in parts),
+        clicks=sum(part.clicks for part in parts),
+        cost_usd=sum(part.cost_usd for part in parts),
+        days=sum(part.days for part in parts),
+    )
+
+
+def _summary_with_reach(
+    totals: MetricTotalsSchema,
+    start_date: date,
+    end_date: date,
+    campaign_ids: list[str] | None = None,
+) -> MetricsSummarySchema:
+    return MetricsSummarySchema(
+        **_summary_metrics(totals).model_dump(),
+        unique_users=estimate_unique_users(start_date, end_date, campaign_ids),
+    )
+
+
+def _summary_metrics(totals: MetricTotalsSchema) -> MetricsSchema:
+    # Calculate overall CTR
+    overall_ctr = (
+        (totals.clicks / totals.impressions * 100) if totals.impressions > 0 else 0
+    )
+
+    return MetricsSchema(
+        impressions=totals.impressions,
+        clicks=totals.clicks,
+        ctr_pct=round(overall_ctr, 2),
+        cost_usd=round(totals.cost_usd, 2),
+    )
@@ -0,0 +1,139 @@
+"""Flag campaign-days whose CTR or spend breaks from the campaign's recent trend.
+
+Every campaign is scored at once: the store lays the window out as a
+campaign x day matrix and each day is compared with the days before it using
+array operations rather than per campaign in Python.
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import numpy.typing as npt
+from numpy.lib.stride_tricks import sliding_window_view
+
+from dashboard.data.models.analytics import (
+    AnomalyMethodEnum,
+    AnomalyMetricEnum,
+    CampaignAnomalySchema,
+)
+from dashboard.data.store import analytics_store
+from dashboard.services.result_cache import result_cache
+
+ANOMALY_WINDOW_DAYS = 14
+ANOMALY_THRESHOLD = 3.5
+# Days flagged on the dashboard, counting back from today
+ANOMALY_RECENT_DAYS = 7
+# Fewer usable days than this before a day and it is not scored
+_MIN_HISTORY_DAYS = 7
+# Scales the MAD so it estimates the standard deviation of normal data
+_MAD_TO_STD = 1.4826
+# A flat history still gets this fraction of its level as its scale, so a
+# campaign spending exactly the same every day isn't flagged for a cent
+_MIN_RELATIVE_SCALE = 0.01
+
+Matrix = npt.NDArray[np.float64]
+
+
+@result_cache.memoize("analytics_store")
+def detect_anomalies(
+    start_date: date,
+    end_date: date,
+    method: AnomalyMethodEnum = AnomalyMethodEnum.ZSCORE,
+    threshold: float = ANOMALY_THRESHOLD,
+    window: int = ANOMALY_WINDOW_DAYS,
+) -> list[CampaignAnomalySchema]:
+    """Find campaign-days in a date range whose CTR or spend breaks the trend.
+
+    Each day is scored against the window days before it, so history is read
+    from before start_date. Days without a row, and for CTR days without
+    impressions, neither get a score nor count as history. Anomalies come
+    back largest deviation first.
+    """
+    if window < _MIN_HISTORY_DAYS:
+        raise ValueError(f"Window must be at least {_MIN_HISTORY_DAYS} days")
+
+    matrix = analytics_store.daily_matrix(start_date - timedelta(days=window), end_date)
+    metrics = {
+        AnomalyMetricEnum.CTR: matrix.ctr_pct(),
+        AnomalyMetricEnum.SPEND: matrix.cost_usd,
+    }
+
+    anomalies: list[CampaignAnomalySchema] = []
+    for metric, values in metrics.items():
+        expected, scores = rolling_scores(values, window, method)
+        rows, days = np.nonzero(np.abs(scores) >= threshold)
+        anomalies.extend(
+            CampaignAnomalySchema(
+                campaign_id=matrix.campaign_ids[row],
+                date=start_date + timedelta(days=day),
+                metric=metric,
+                value=values[row, day + window],
+                expected=expected[row, day],
+                score=scores[row, day],
+            )
+            for row, day in zip(rows.tolist(), days.tolist(), strict=True)
+        )
+    return sorted(anomalies, key=lambda anomaly: -abs(anomaly.score))
+
+
+def rolling_scores(
+    values: Matrix,
+    window: int,
+    method: AnomalyMethodEnum,
+) -> tuple[Matrix, Matrix]:
+    """Score every column after the first window against the window before it.
+
+    values is a campaign x day matrix with NaN for missing days. Returns the
+    expected values and the scores, each one column per scored day; a day
+    with too little history, no value or a zero scale scores NaN.
+    """
+    if method is AnomalyMethodEnum.MAD:
+        expected, scale, counts = _rolling_median_mad(values, window)
+    else:
+        expected, scale, counts = _rolling_mean_std(values, window)
+
+    scale = np.maximum(scale, _MIN_RELATIVE_SCALE * np.abs(expected))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = (values[:, window:] - expected) / scale
+    scores[(counts < _MIN_HISTORY_DAYS) | ~(scale > 0)] = np.nan
+    return expected, scores
+
+
+def _rolling_mean_std(values: Matrix, window: int) -> tuple[Matrix, Matrix, Matrix]:
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0)
+    counts = _window_sums(valid.astype(np.float64), window)
+    sums = _window_sums(filled, window)
+    squares = _window_sums(filled * filled, window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = sums / counts
+        variance = (squares - sums * mean) / (counts - 1)
+    return mean, np.sqrt(np.maximum(variance, 0.0)), counts
+
+
+def _rolling_median_mad(values: Matrix, window: int) -> tuple[Matrix, Matrix, Matrix]:
+    # (campaign, day, window) views of the days before each scored day
+    windows = sliding_window_view(values, window, axis=1)[:, :-1]
+    counts = _window_sums((~np.isnan(values)).astype(np.float64), window)
+    positions = counts.astype(np.intp)
+    median = _nan_median(windows, positions)
+    deviations = np.abs(windows - median[..., np.newaxis])
+    return median, _MAD_TO_STD * _nan_median(deviations, positions), counts
+
+
+def _window_sums(values: Matrix, window: int) -> Matrix:
+    # Running sums make every window O(1) regardless of its length
+    running = np.zeros((len(values), values.shape[1] + 1))
+    np.cumsum(values, axis=1, out=running[:, 1:])
+    return running[:, window:-1] - running[:, : -window - 1]
+
+
+def _nan_median(windows: Matrix, counts: npt.NDArray[np.intp]) -> Matrix:
+    # Sorting puts NaNs last, so the median sits in the first counts entries;
+    # one sort along a short axis is much faster than np.nanmedian
+    ordered = np.sort(windows, axis=2)
+    lower = np.maximum(counts - 1, 0) // 2
+    upper = counts // 2
+    low = np.take_along_axis(ordered, lower[..., np.newaxis], axis=2)[..., 0]
+    high = np.take_along_axis(ordered, upper[..., np.newaxis], axis=2)[..., 0]
+    return (low + high) / 2
@@ -0,0 +1,233 @@
+"""Forecast every campaign's daily impressions, clicks and cost.
+
+All campaigns are fitted at once on the store's campaign x day matrix. Each
+metric is divided by per-campaign day-of-week factors, and what remains is
+exponentially smoothed or fitted with a line, stepping through days with one
+array operation across every campaign per step.
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import numpy.typing as npt
+
+from dashboard.data.models.analytics import (
+    CampaignForecastSchema,
+    ForecastMethodEnum,
+    ForecastPointSchema,
+)
+from dashboard.data.store import analytics_store
+from dashboard.services.result_cache import result_cache
+
+# Eight weeks, so every weekday factor averages eight days
+FORECAST_HISTORY_DAYS = 56
+FORECAST_MIN_DAYS = 7
+FORECAST_MAX_DAYS = 30
+# Campaigns with fewer days of data than this get no forecast
+_MIN_HISTORY_DAYS = 14
+# Weights tried for each campaign; the one with the least one-step error wins
+_SMOOTHING_WEIGHTS = np.linspace(0.05, 0.95, 19)
+# Bands cover 80% of outcomes if the errors are normal
+_BAND_Z = 1.2816
+_METRICS = ("impressions", "clicks", "cost_usd")
+
+Matrix = npt.NDArray[np.float64]
+
+
+class CampaignForecasts:
+    """Forecasts of many campaigns as campaign x day arrays.
+
+    Row i holds campaign_ids[i] and column j the day start_date + j. metrics
+    maps each metric to its (expected, lower, upper) arrays.
+    """
+
+    __slots__ = ("_rows", "campaign_ids", "method", "metrics", "start_date")
+
+    def __init__(
+        self,
+        campaign_ids: list[str],
+        start_date: date,
+        method: ForecastMethodEnum,
+        metrics: dict[str, tuple[Matrix, Matrix, Matrix]],
+    ) -> None:
+        self.campaign_ids = campaign_ids
+        self.start_date = start_date
+        self.method = method
+        self.metrics = metrics
+        self._rows = {campaign_id: row for row, campaign_id in enumerate(campaign_ids)}
+
+    def for_campaign(
+        self,
+        campaign_id: str,
+        days: int,
+    ) -> CampaignForecastSchema | None:
+        """Return one campaign's first days of forecast, or None if it has none."""
+        row = self._rows.get(campaign_id)
+        if row is None:
+            return None
+
+        dates = [self.start_date + timedelta(days=day) for day in range(days)]
+        return CampaignForecastSchema(
+            campaign_id=campaign_id,
+            method=self.method,
+            **{
+                metric: [
+                    ForecastPointSchema(date=day, expected=mid, lower=low, upper=high)
+                    for day, mid, low, high in zip(
+                        dates,
+                        expected[row, :days].tolist(),
+                        lower[row, :days].tolist(),
+                        upper[row, :days].tolist(),
+                        strict=True,
+                    )
+                ]
+                for metric, (expected, lower, upper) in self.metrics.items()
+            },
+        )
+
+
+@result_cache.memoize("analytics_store")
+def forecast_all_campaigns(
+    as_of: date,
+    method: ForecastMethodEnum = ForecastMethodEnum.SMOOTHING,
+) -> CampaignForecasts:
+    """Forecast every campaign FORECAST_MAX_DAYS past as_of from the weeks before.
+
+    The result is cached until the analytics store changes, so shorter
+    forecasts are slices of it rather than new fits.
+    """
+    history_start = as_of - timedelta(days=FORECAST_HISTORY_DAYS - 1)
+    matrix = analytics_store.daily_matrix(history_start, as_of)
+    history = np.count_nonzero(~np.isnan(matrix.cost_usd), axis=1)
+    rows = np.flatnonzero(history >= _MIN_HISTORY_DAYS)
+
+    past_weekdays = (history_start.weekday() + np.arange(matrix.days)) % 7
+    future_weekdays = (as_of.weekday() + 1 + np.arange(FORECAST_MAX_DAYS)) % 7
+    metrics = {}
+    for metric in _METRICS:
+        values = getattr(matrix, metric)[rows]
+        factors = _weekday_factors(values, past_weekdays)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            level = values / factors[:, past_weekdays]
+        if method is ForecastMethodEnum.TREND:
+            expected, spread = _linear_trend(level, FORECAST_MAX_DAYS)
+        else:
+            expected, spread = _exponential_smoothing(level, FORECAST_MAX_DAYS)
+
+        # A metric too sparse to fit, e.g. zero on all but a day, forecasts zero
+        season = factors[:, future_weekdays]
+        expected, spread = np.nan_to_num(expected), np.nan_to_num(spread)
+        metrics[metric] = (
+            np.maximum(expected * season, 0.0),
+            np.maximum((expected - _BAND_Z * spread) * season, 0.0),
+            np.maximum((expected + _BAND_Z * spread) * season, 0.0),
+        )
+
+    return CampaignForecasts(
+        [matrix.campaign_ids[row] for row in rows.tolist()],
+        as_of + timedelta(days=1),
+        method,
+        metrics,
+    )
+
+
+@result_cache.memoize("analytics_store")
+def get_campaign_forecast(
+    campaign_id: str,
+    as_of: date,
+    days: int = FORECAST_MIN_DAYS,
+    method: ForecastMethodEnum = ForecastMethodEnum.SMOOTHING,
+) -> CampaignForecastSchema | None:
+    """Forecast a campaign's next days after as_of, or None without enough data."""
+    if not FORECAST_MIN_DAYS <= days <= FORECAST_MAX_DAYS:
+        raise ValueError(
+            f"Forecasts cover {FORECAST_MIN_DAYS} to {FORECAST_MAX_DAYS} days",
+        )
+    return forecast_all_campaigns(as_of, method).for_campaign(campaign_id, days)
+
+
+def _weekday_factors(values: Matrix, weekdays: npt.NDArray[np.int_]) -> Matrix:
+    """Return each campaign's weekday factors, averaging 1; 1 where unknown.
+
+    Days are first divided by the centered week around them, so a trend does
+    not leak into the factors of the weekdays that come later in each week.
+    """
+    valid = ~np.isnan(values)
+    running = np.zeros((len(values), values.shape[1] + 1))
+    counts = np.zeros_like(running)
+    np.cumsum(np.where(valid, values, 0.0), axis=1, out=running[:, 1:])
+    np.cumsum(valid, axis=1, out=counts[:, 1:])
+    week = np.full_like(values, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        week[:, 3:-3] = (running[:, 7:] - running[:, :-7]) / (
+            counts[:, 7:] - counts[:, :-7]
+        )
+        ratios = values / week
+
+    usable = np.isfinite(ratios)
+    one_hot = (weekdays[:, np.newaxis] == np.arange(7)).astype(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        factors = (np.where(usable, ratios, 0.0) @ one_hot) / (
+            usable.astype(np.float64) @ one_hot
+        )
+    factors[~np.isfinite(factors)] = 1.0
+    normalized: Matrix = factors / factors.mean(axis=1, keepdims=True)
+    return normalized
+
+
+def _exponential_smoothing(level: Matrix, horizon: int) -> tuple[Matrix, Matrix]:
+    # Every weight is run side by side as one (weights, campaigns) array
+    weights = _SMOOTHING_WEIGHTS[:, np.newaxis]
+    smoothed = np.full((len(weights), len(level)), np.nan)
+    squared = np.zeros_like(smoothed)
+    errors = np.zeros(len(level))
+    for column in level.T:
+        error = column - smoothed
+        seen = ~np.isnan(error)
+        squared += np.where(seen, error * error, 0.0)
+        errors += seen[0]
+        smoothed = np.where(
+            np.isnan(column),
+            smoothed,
+            np.where(np.isnan(smoothed), column, smoothed + weights * error),
+        )
+
+    best = np.argmin(squared, axis=0)
+    campaigns = np.arange(len(level))
+    weight = _SMOOTHING_WEIGHTS[best][:, np.newaxis]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sigma = np.sqrt(squared[best, campaigns] / errors)[:, np.newaxis]
+    steps = np.arange(horizon)
+    expected = np.repeat(smoothed[best, campaigns][:, np.newaxis], horizon, axis=1)
+    return expected, sigma * np.sqrt(1 + steps * weight * weight)
+
+
+def _linear_trend(level: Matrix, horizon: int) -> tuple[Matrix, Matrix]:
+    valid = ~np.isnan(level)
+    days = np.arange(level.shape[1], dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        count = valid.sum(axis=1)
+        filled = np.where(valid, level, 0.0)
+        day_mean = (valid * days).sum(axis=1) / count
+        value_mean = filled.sum(axis=1) / count
+        offsets = np.where(valid, days - day_mean[:, np.newaxis], 0.0)
+        spread_days = (offsets * offsets).sum(axis=1)
+        deviations = filled - value_mean[:, np.newaxis]
+        slope = (offsets * deviations).sum(axis=1) / spread_days
+        intercept = value_mean - slope * day_mean
+        residuals = np.where(
+            valid,
+            filled - intercept[:, np.newaxis] - slope[:, np.newaxis] * days,
+            0.0,
+        )
+        sigma = np.sqrt((residuals * residuals).sum(axis=1) / (count - 2))
+
+        # Prediction interval of a least-squares line, widening away from the data
+        future = level.shape[1] + np.arange(horizon, dtype=np.float64)
+        expected = intercept[:, np.newaxis] + slope[:, np.newaxis] * future
+        spread = sigma[:, np.newaxis] * np.sqrt(
+            1
+            + 1 / count[:, np.newaxis]
+            + (future - day_mean[:, np.newaxis]) ** 2 / spread_days[:, np.newaxis],
+        )
+    return expected, spread
@@ -0,0 +1,224 @@
+"""Stream daily metric files from the ad server into the analytics store.
+
+Run with: python -m dashboard.services.ingestion_service metrics.jsonl
+
+Rows only outlive the process with a SQLite analytics backend or with
+STORE_DATA_DIR persistence enabled.
+"""
+
+import argparse
+import csv
+import json
+import time
+from collections.abc import Iterator
+from datetime import date
+from enum import Enum
+from itertools import batched
+from pathlib import Path
+from typing import Annotated, Any, Self
+from uuid import uuid4
+
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, model_validator
+
+from dashboard.data.models.analytics import CampaignAnalyticsSchema, MetricsSchema
+from dashboard.data.store import analytics_store
+
+DEFAULT_BATCH_SIZE = 10_000
+MAX_REPORTED_ERRORS = 20
+
+
+class MetricFileFormatEnum(str, Enum):
+    JSONL = "jsonl"
+    CSV = "csv"
+
+    @classmethod
+    def from_path(cls, path: Path) -> "MetricFileFormatEnum":
+        suffix = path.suffix.lower().lstrip(".")
+        if suffix in {"json", "ndjson"}:
+            return cls.JSONL
+        return cls(suffix)
+
+
+class MetricRecordSchema(BaseModel):
+    """One campaign-day as the ad server exports it, before it becomes a row."""
+
+    campaign_id: Annotated[str, Field(min_length=1)]
+    date: date
+    impressions: Annotated[int, Field(ge=0)]
+    clicks: Annotated[int, Field(ge=0)]
+    cost_usd: Annotated[float, Field(ge=0)]
+
+    @model_validator(mode="after")
+    def clicks_within_impressions(self) -> Self:
+        if self.clicks > self.impressions:
+            raise ValueError("clicks cannot exceed impressions")
+        return self
+
+    def to_analytics(self) -> CampaignAnalyticsSchema:
+        ctr = self.clicks / self.impressions * 100 if self.impressions else 0.0
+        # Already validated, and clicks <= impressions keeps the CTR within 100.
+        # The ID is passed in since model_construct inspects default factories.
+        return CampaignAnalyticsSchema.model_construct(
+            id=str(uuid4()),
+            campaign_id=self.campaign_id,
+            date=self.date,
+            metrics=MetricsSchema.model_construct(
+                impressions=self.impressions,
+                clicks=self.clicks,
+                ctr_pct=ctr,
+                cost_usd=self.cost_usd,
+            ),
+        )
+
+
+class IngestionReportSchema(BaseModel):
+    # Defaults are assigned so the pydantic mypy plugin sees them
+    rows_read: int = Field(default=0, ge=0)
+    rows_loaded: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Rows written, including upserts and rows the memory budget may "
+            "evict afterwards"
+        ),
+    )
+    rows_rejected: int = Field(default=0, ge=0)
+    duplicates: int = Field(
+        default=0,
+        ge=0,
+        description="Rows replaced by a later one in a batch",
+    )
+    elapsed_s: float = Field(default=0.0, ge=0)
+    errors: list[str] = Field(
+        default_factory=list,
+        description="First rejected rows, by line",
+    )
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_read / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+
+_records_adapter = TypeAdapter(list[MetricRecordSchema])
+
+
+def iter_metric_records(
+    path: Path,
+    file_format: MetricFileFormatEnum | None = None,
+) -> Iterator[tuple[int, Any]]:
+    """Yield (line number, raw record) pairs from a JSONL or CSV file.
+
+    The file is read lazily, one line at a time. JSONL records may nest their
+    counts under "metrics" like exported analytics rows. A line that is not
+    valid JSON is yielded as its text so validation rejects it with the rest.
+    """
+    file_format = file_format or MetricFileFormatEnum.from_path(path)
+    with path.open(newline="", encoding="utf-8") as file:
+        if file_format is MetricFileFormatEnum.CSV:
+            reader = csv.DictReader(file)
+            for record in reader:
+                yield reader.line_num, record
+            return
+
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                yield line_number, line.strip()
+                continue
+            if isinstance(record, dict) and isinstance(record.get("metrics"), dict):
+                record.update(record.pop("metrics"))
+            yield line_number, record
+
+
+def ingest_metrics_file(
+    path: Path,
+    file_format: MetricFileFormatEnum | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> IngestionReportSchema:
+    """Validate and upsert a metric file into the analytics store in batches.
+
+    Only one batch is held in memory at a time. Within a batch the last row
+    for a (campaign_id, date) wins; across batches the store's unique index
+    upserts, so a later row for the same day still replaces the earlier one.
+    """
+    report = IngestionReportSchema()
+    started = time.perf_counter()
+
+    for batch in batched(
+        iter_metric_records(path, file_format),
+        batch_size,
+        strict=False,
+    ):
+        report.rows_read += len(batch)
+        records = _validate_batch(batch, report)
+
+        latest = {(record.campaign_id, record.date): record for record in records}
+        report.duplicates += len(records) - len(latest)
+        stored = analytics_store.add_many(
+            record.to_analytics() for record in latest.values()
+        )
+        report.rows_loaded += len(stored)
+
+    report.elapsed_s = time.perf_counter() - started
+    return report
+
+
+def _validate_batch(
+    batch: tuple[tuple[int, Any], ...],
+    report: IngestionReportSchema,
+) -> list[MetricRecordSchema]:
+    try:
+        return _records_adapter.validate_python([record for _, record in batch])
+    except ValidationError:
+        pass
+
+    # Only a failing batch pays for row-by-row validation
+    records = []
+    for line_number, record in batch:
+        try:
+            records.append(MetricRecordSchema.model_validate(record))
+        except ValidationError as e:
+            report.rows_rejected += 1
+            if len(report.errors) < MAX_REPORTED_ERRORS:
+                reason = e.errors()[0]
+                location = ".".join(str(part) for part in reason["loc"])
+                report.errors.append(
+                    f"line {line_number}: {location or 'row'}: {reason['msg']}",
+                )
+    return records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", type=Path)
+    parser.add_argument(
+        "--format",
+        type=MetricFileFormatEnum,
+        choices=list(MetricFileFormatEnum),
+        default=None,
+    )
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    file_format = args.format
+    if file_format is None:
+        try:
+            file_format = MetricFileFormatEnum.from_path(args.path)
+        except ValueError:
+            parser.error(f"cannot tell the format of {args.path}, pass --format")
+
+    report = ingest_metrics_file(args.path, file_format, args.batch_size)
+    print(  # noqa: T201
+        f"read {report.rows_read:,} rows, loaded {report.rows_loaded:,}, "
+        f"rejected {report.rows_rejected:,}, duplicates {report.duplicates:,} "
+        f"in {report.elapsed_s:.2f}s ({report.rows_per_second:,.0f} rows/s)",
+    )
+    for error in report.errors:
+        print(f"  {error}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
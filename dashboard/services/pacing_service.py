@@ -0,0 +1,163 @@
+"""Pace every active campaign's spend against its budget and schedule.
+
+Spend is summed by the analytics store over each campaign's own schedule up
+to the pacing day, one store pass per distinct schedule, and the pacing itself
+is array arithmetic over all active campaigns at once.
+"""
+
+from collections import defaultdict
+from datetime import date, timedelta
+
+import numpy as np
+import numpy.typing as npt
+
+from dashboard.data.models.analytics import CampaignPacingSchema, PacingStatusEnum
+from dashboard.data.models.campaign import CampaignSchema, CampaignStatusEnum
+from dashboard.data.store import analytics_store, campaign_store
+from dashboard.services.result_cache import result_cache
+
+# Days averaged into a campaign's current daily spend
+PACING_RUN_RATE_DAYS = 7
+# Projected spend at the end date within this fraction of the budget is on pace
+PACING_TOLERANCE = 0.1
+
+# Most urgent first when listing campaigns
+_STATUS_ORDER = [
+    PacingStatusEnum.EXHAUSTED,
+    PacingStatusEnum.OVERPACING,
+    PacingStatusEnum.UNDERPACING,
+    PacingStatusEnum.ON_PACE,
+]
+
+
+@result_cache.memoize("analytics_store", "campaign_store")
+def calculate_budget_pacing(as_of: date) -> list[CampaignPacingSchema]:
+    """Pace every active campaign at the end of a day, at-risk campaigns first.
+
+    Campaigns with an end date are expected to spend their budget evenly per
+    day, and are flagged when spending at their run rate until the end would
+    miss the budget by more than PACING_TOLERANCE. Open-ended campaigns are
+    only flagged once their budget is spent.
+    """
+    campaigns = campaign_store.get_by_status(CampaignStatusEnum.ACTIVE)
+    if not campaigns:
+        return []
+
+    today = as_of.toordinal()
+    starts = np.array(
+        [campaign.start_date.date().toordinal() for campaign in campaigns],
+    )
+    ends = np.array(
+        [
+            campaign.end_date.date().toordinal() if campaign.end_date else np.nan
+            for campaign in campaigns
+        ],
+    )
+    budgets = np.array([campaign.budget_usd for campaign in campaigns])
+
+    # Only days between a campaign's start and its end, or as_of, count
+    recent_start = as_of - timedelta(days=PACING_RUN_RATE_DAYS - 1)
+    spend, recent = _spend(campaigns, as_of, recent_start)
+
+    # Days the campaign ran inside the run rate window
+    running_days = np.clip(
+        np.fmin(ends, today) - np.maximum(starts, recent_start.toordinal()) + 1,
+        0,
+        PACING_RUN_RATE_DAYS,
+    )
+    run_rate = np.divide(
+        recent,
+        running_days,
+        out=np.zeros_like(recent),
+        where=running_days > 0,
+    )
+
+    # NaN for open-ended campaigns, which no comparison below flags
+    duration = ends - starts + 1
+    daily_budget = budgets / duration
+    expected = daily_budget * np.clip(today - starts + 1, 0, duration)
+    projected = spend + run_rate * np.clip(ends - today, 0, None)
+
+    left = budgets - spend
+    with np.errstate(divide="ignore", invalid="ignore"):
+        exhaustion = today + np.ceil(left / run_rate)
+    exhaustion[~(run_rate > 0) | (exhaustion > ends)] = np.nan
+    exhaustion[left <= 0] = today
+
+    status = np.select(
+        [
+            left <= 0,
+            projected > budgets * (1 + PACING_TOLERANCE),
+            (projected < budgets * (1 - PACING_TOLERANCE)) & (starts <= today),
+        ],
+        [
+            _STATUS_ORDER.index(PacingStatusEnum.EXHAUSTED),
+            _STATUS_ORDER.index(PacingStatusEnum.OVERPACING),
+            _STATUS_ORDER.index(PacingStatusEnum.UNDERPACING),
+        ],
+        _STATUS_ORDER.index(PacingStatusEnum.ON_PACE),
+    )
+
+    pacing = [
+        CampaignPacingSchema(
+            campaign_id=campaign.id,
+            budget_usd=campaign.budget_usd,
+            spend_to_date_usd=round(spent, 2),
+            daily_budget_usd=_optional(round(per_day, 2)),
+            expected_spend_usd=_optional(round(expected_spend, 2)),
+            daily_run_rate_usd=round(rate, 2),
+            projected_exhaustion_date=(
+                None if np.isnan(ordinal) else date.fromordinal(int(ordinal))
+            ),
+            status=_STATUS_ORDER[code],
+        )
+        for campaign, spent, per_day, expected_spend, rate, ordinal, code in zip(
+            campaigns,
+            spend.tolist(),
+            daily_budget.tolist(),
+            expected.tolist(),
+            run_rate.tolist(),
+            exhaustion.tolist(),
+            status.tolist(),
+            strict=True,
+        )
+    ]
+    return sorted(pacing, key=lambda campaign: _STATUS_ORDER.index(campaign.status))
+
+
+def _spend(
+    campaigns: list[CampaignSchema],
+    as_of: date,
+    recent_start: date,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Sum each campaign's cost over its own days, and over those from recent_start.
+
+    A campaign's days run from its start to its end or as_of. They are split
+    at recent_start into two windows that do not overlap, and campaigns with
+    the same days share one summarize_periods call.
+    """
+    schedules: dict[tuple[date, date], list[int]] = defaultdict(list)
+    for position, campaign in enumerate(campaigns):
+        start = campaign.start_date.date()
+        end = min(campaign.end_date.date(), as_of) if campaign.end_date else as_of
+        if start <= end:
+            schedules[start, end].append(position)
+
+    spend = np.zeros(len(campaigns))
+    recent = np.zeros(len(campaigns))
+    for (start, end), positions in schedules.items():
+        split = max(start, recent_start)
+        # Either window may be empty, with its start after its end
+        windows = [(start, split - timedelta(days=1)), (split, end)]
+        only = campaigns[positions[0]].id if len(positions) == 1 else None
+        totals = analytics_store.summarize_periods(windows, only)
+        for position in positions:
+            if campaigns[position].id in totals:
+                before, last = totals[campaigns[position].id]
+                spend[position] = before.cost_usd + last.cost_usd
+                recent[position] = last.cost_usd
+    return spend, recent
+
+
+def _optional(value: float) -> float | None:
+    return None if np.isnan(value) else value
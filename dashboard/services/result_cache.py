@@ -0,0 +1,129 @@
+import functools
+import inspect
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Annotated, Any, ParamSpec, TypeVar
+
+from pydantic import BaseModel, Field
+
+from dashboard.settings import SERVICE_CACHE_MAX_ENTRIES
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class CacheStatsSchema(BaseModel):
+    hits: Annotated[int, Field(ge=0, description="Calls answered from the cache")]
+    misses: Annotated[int, Field(ge=0, description="Calls that ran the query")]
+    evictions: Annotated[int, Field(ge=0, description="Entries dropped for room")]
+    size: Annotated[int, Field(ge=0, description="Entries currently held")]
+    max_entries: Annotated[int, Field(ge=0, description="Capacity; 0 disables")]
+
+    @property
+    def hit_rate(self) -> float:
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+class ResultCache:
+    """LRU cache of query results keyed on (function, arguments, generations).
+
+    Each memoized function names the stores it reads. Their generations are
+    part of the key, so any write to one of them makes the old entries
+    unreachable at once and they age out of the LRU order; a hit is always
+    what the query would return now. Results are shared between callers, like
+    the items stores return, and must not be mutated.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._mutex = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def memoize(self, *store_names: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+        """Cache a function on the generations of the module-level stores named.
+
+        Stores are looked up in the function's module on every call, so a
+        store swapped in later (e.g. by a test) is the one that is checked.
+        """
+
+        def decorator(func: Callable[P, R]) -> Callable[P, R]:
+            signature = inspect.signature(func)
+            namespace = func.__globals__
+
+            @functools.wraps(func)
+            def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+                if not self.max_entries:
+                    return func(*args, **kwargs)
+
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                key = (
+                    func.__qualname__,
+                    _freeze(tuple(bound.arguments.values())),
+                    tuple(namespace[name].generation for name in store_names),
+                )
+                try:
+                    hash(key)
+                except TypeError:
+                    return func(*args, **kwargs)
+
+                with self._mutex:
+                    if key in self._entries:
+                        self._entries.move_to_end(key)
+                        self.hits += 1
+                        cached: R = self._entries[key]
+                        return cached
+                    self.misses += 1
+
+                # Computed outside the mutex so slow queries don't serialize
+                result = func(*args, **kwargs)
+                self._put(key, result)
+                return result
+
+            return wrapper
+
+        return decorator
+
+    def stats(self) -> CacheStatsSchema:
+        with self._mutex:
+            return CacheStatsSchema(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                size=len(self._entries),
+                max_entries=self.max_entries,
+            )
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._mutex:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def _put(self, key: Hashable, result: Any) -> None:
+        with self._mutex:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+
+# Shared by the services, so one bound covers all of their cached results
+result_cache = ResultCache(SERVICE_CACHE_MAX_ENTRIES)
+
+
+def _freeze(value: Any) -> Any:
+    """Turn list, set and dict arguments into hashable equivalents."""
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set | frozenset):
+        return frozenset(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
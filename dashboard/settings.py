@@ -29,3 +29,68 @@ USE_MOCK_DATA = os.getenv("USE_MOCK_DATA", "True").lower() == "true"
 # Memory store settings
 MAX_CAMPAIGNS_PER_USER = 100
 MAX_USERS = 1000
+
+MB = 1024 * 1024
+
+
+def _bytes_setting(name: str, default: int) -> int | None:
+    """Read a byte limit from the environment; 0 disables the limit."""
+    value = int(os.getenv(name, str(default)))
+    return value if value > 0 else None
+
+
+# Store memory budgets in bytes. The global budget spans all stores and, when
+# exceeded, evicts from whichever store is currently largest.
+STORE_MEMORY_BUDGET_BYTES = _bytes_setting("STORE_MEMORY_BUDGET_BYTES", 0)
+ANALYTICS_STORE_MAX_BYTES = _bytes_setting("ANALYTICS_STORE_MAX_BYTES", 128 * MB)
+HOURLY_ANALYTICS_STORE_MAX_BYTES = _bytes_setting(
+    "HOURLY_ANALYTICS_STORE_MAX_BYTES",
+    64 * MB,
+)
+CAMPAIGN_STORE_MAX_BYTES = _bytes_setting("CAMPAIGN_STORE_MAX_BYTES", 16 * MB)
+BANNER_STORE_MAX_BYTES = _bytes_setting("BANNER_STORE_MAX_BYTES", 16 * MB)
+REACH_STORE_MAX_BYTES = _bytes_setting("REACH_STORE_MAX_BYTES", 64 * MB)
+AD_COPY_STORE_MAX_BYTES = _bytes_setting("AD_COPY_STORE_MAX_BYTES", 32 * MB)
+TARGETING_STORE_MAX_BYTES = _bytes_setting("TARGETING_STORE_MAX_BYTES", 16 * MB)
+INTEREST_STORE_MAX_BYTES = _bytes_setting("INTEREST_STORE_MAX_BYTES", 1 * MB)
+USER_STORE_MAX_BYTES = _bytes_setting("USER_STORE_MAX_BYTES", 4 * MB)
+
+
+def _fsync_setting(name: str) -> str:
+    """Read a per-store fsync policy, falling back to STORE_FSYNC_POLICY."""
+    return os.getenv(name, STORE_FSYNC_POLICY)
+
+
+# Optional durability: each store keeps a write-ahead log and periodic snapshot
+# under STORE_DATA_DIR. Leave it unset to keep the stores purely in memory.
+STORE_DATA_DIR = (
+    Path(os.environ["STORE_DATA_DIR"]) if os.getenv("STORE_DATA_DIR") else None
+)
+STORE_FSYNC_POLICY = os.getenv("STORE_FSYNC_POLICY", "interval")
+STORE_FSYNC_INTERVAL_S = float(os.getenv("STORE_FSYNC_INTERVAL_S", "1.0"))
+STORE_WAL_COMPACT_BYTES = _bytes_setting("STORE_WAL_COMPACT_BYTES", 64 * MB)
+ANALYTICS_STORE_FSYNC = _fsync_setting("ANALYTICS_STORE_FSYNC")
+HOURLY_ANALYTICS_STORE_FSYNC = _fsync_setting("HOURLY_ANALYTICS_STORE_FSYNC")
+CAMPAIGN_STORE_FSYNC = _fsync_setting("CAMPAIGN_STORE_FSYNC")
+BANNER_STORE_FSYNC = _fsync_setting("BANNER_STORE_FSYNC")
+REACH_STORE_FSYNC = _fsync_setting("REACH_STORE_FSYNC")
+AD_COPY_STORE_FSYNC = _fsync_setting("AD_COPY_STORE_FSYNC")
+TARGETING_STORE_FSYNC = _fsync_setting("TARGETING_STORE_FSYNC")
+INTEREST_STORE_FSYNC = _fsync_setting("INTEREST_STORE_FSYNC")
+USER_STORE_FSYNC = _fsync_setting("USER_STORE_FSYNC")
+
+# Storage backend per store: "memory" (default) or "sqlite" for datasets that
+# outgrow RAM. SQLite stores share one database file and need no persistence.
+# Analytics can also use "columnar" NumPy arrays, which are neither persisted
+# nor counted in the memory budget, or read-only "virtual" mock rows computed
+# on demand from the campaigns.
+STORE_BACKEND = os.getenv("STORE_BACKEND", "memory")
+CAMPAIGN_STORE_BACKEND = os.getenv("CAMPAIGN_STORE_BACKEND", STORE_BACKEND)
+ANALYTICS_STORE_BACKEND = os.getenv("ANALYTICS_STORE_BACKEND", STORE_BACKEND)
+SQLITE_STORE_PATH = Path(
+    os.getenv("SQLITE_STORE_PATH", str(BASE_DIR.parent / "data" / "stores.sqlite3")),
+)
+
+# Service query results kept for reuse until a store they read changes; 0
+# turns the cache off
+SERVICE_CACHE_MAX_ENTRIES = int(os.getenv("SERVICE_CACHE_MAX_ENTRIES", "1024"))
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -9,7 +9,7 @@ from dashboard.app.components.analytics_charts import (
     display_campaign_performance_chart,
     display_metrics_summary,
 )
-from dashboard.data.models.analytics import MetricsSchema
+from dashboard.data.models.analytics import ForecastPointSchema, MetricsSchema
 from dashboard.data.models.campaign import CampaignSchema
 
 
@@ -78,6 +78,31 @@ def test_display_campaign_performance_chart(sample_analytics_data):
         mock_info.assert_called_once()
 
 
+@pytest.mark.unit
+def test_display_campaign_performance_chart_with_forecast(sample_analytics_data):
+    """Test a forecast is layered onto the performance chart."""
+    today = datetime.now(UTC).date()
+    forecast = [
+        ForecastPointSchema(
+            date=today + timedelta(days=day),
+            expected=1200,
+            lower=1000,
+            upper=1400,
+        )
+        for day in range(1, 8)
+    ]
+    with patch("streamlit.altair_chart") as mock_chart:
+        display_campaign_performance_chart(
+            sample_analytics_data,
+            "impressions",
+            forecast,
+        )
+
+        mock_chart.assert_called_once()
+        chart = mock_chart.call_args.args[0]
+        assert len(chart.layer) == 3
+
+
 @pytest.mark.unit
 def test_display_campaign_comparison_chart():
     """Test campaign comparison chart display."""
@@ -1,9 +1,10 @@
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime, timedelta
 from unittest.mock import Mock
 
 import pytest
 
 from dashboard.data.models.analytics import CampaignAnalyticsSchema, MetricsSchema
+from dashboard.data.models.campaign import CampaignSchema
 
 
 @pytest.fixture
@@ -53,3 +54,48 @@ def sample_analytics_data():
             ),
         ),
     ]
+
+
+@pytest.fixture
+def make_analytics_row():
+    """Create a factory for daily analytics rows starting on 2025-01-01."""
+
+    def factory(
+        campaign_id: str,
+        day: int,
+        impressions: int = 100,
+    ) -> CampaignAnalyticsSchema:
+        return CampaignAnalyticsSchema.model_validate(
+            {
+                "campaign_id": campaign_id,
+                "date": date(2025, 1, 1) + timedelta(days=day),
+                "metrics": MetricsSchema(
+                    impressions=impressions,
+                    clicks=impressions // 10,
+                    ctr_pct=10.0,
+                    cost_usd=impressions / 100,
+                ),
+            },
+        )
+
+    return factory
+
+
+@pytest.fixture
+def make_campaign():
+    """Create a factory for campaigns starting on 2025-01-01."""
+
+    def factory(campaign_id: str, budget_usd: float = 1000.0) -> CampaignSchema:
+        return CampaignSchema.model_validate(
+            {
+                "id": campaign_id,
+                "name": f"Campaign {campaign_id}",
+                "banner_id": "banner-id",
+                "targeting_id": "targeting-id",
+                "budget_usd": budget_usd,
+                "start_date": datetime(2025, 1, 1, tzinfo=UTC),
+                "created_by": "user-id",
+            },
+        )
+
+    return factory
@@ -0,0 +1,108 @@
+from datetime import date
+
+import pytest
+
+from dashboard.data.models.analytics import CampaignAnalyticsSchema
+from dashboard.data.store.analytics_store import AnalyticsStore
+from dashboard.data.store.memory_store import InMemoryStore
+
+
+@pytest.mark.unit
+def test_add_many_matches_single_adds(make_analytics_row):
+    """Test that a batch leaves every index as sequential adds would."""
+    rows = [
+        make_analytics_row(f"campaign-{c}", day) for c in range(3) for day in range(10)
+    ]
+    single, batched = AnalyticsStore(), AnalyticsStore()
+    for row in rows:
+        single.add(row)
+
+    batched.add_many(rows)
+
+    for campaign_id in ("campaign-0", "campaign-2"):
+        expected = [r.id for r in single.get_by_campaign(campaign_id)]
+        assert [r.id for r in batched.get_by_campaign(campaign_id)] == expected
+    window = (date(2025, 1, 3), date(2025, 1, 5))
+    assert {r.id for r in batched.get_by_date_range(*window)} == {
+        r.id for r in single.get_by_date_range(*window)
+    }
+    assert batched.count() == single.count() == 30
+    assert batched.size_bytes() == single.size_bytes()
+
+
+@pytest.mark.unit
+def test_add_many_upserts_on_unique_key(make_analytics_row):
+    """Test that repeated (campaign_id, date) keys collapse to the last row."""
+    store = AnalyticsStore()
+    original = store.add(make_analytics_row("campaign-1", 0, impressions=100))
+
+    stored = store.add_many(
+        [
+            make_analytics_row("campaign-1", 0, impressions=200),
+            make_analytics_row("campaign-1", 1),
+            make_analytics_row("campaign-1", 0, impressions=300),
+        ],
+    )
+
+    assert len(stored) == 2
+    rows = store.get_by_campaign("campaign-1")
+    assert rows[0].id == original.id
+    assert rows[0].metrics.impressions == 300
+    assert store.count() == 2
+
+
+@pytest.mark.unit
+def test_update_many_rejects_whole_batch_on_collision(make_analytics_row):
+    """Test that one colliding update leaves the store untouched."""
+    store = AnalyticsStore()
+    rows = store.add_many([make_analytics_row("campaign-1", day) for day in range(3)])
+
+    with pytest.raises(ValueError, match="collides"):
+        store.update_many(
+            {
+                rows[0].id: {"date": date(2025, 2, 1)},
+                rows[1].id: {"date": rows[2].date},
+            },
+        )
+
+    assert rows[0].date == date(2025, 1, 1)
+    assert (
+        store.get_by_campaign_and_date_range(
+            "campaign-1",
+            date(2025, 2, 1),
+            date(2025, 2, 1),
+        )
+        == []
+    )
+
+
+@pytest.mark.unit
+def test_update_many_allows_keys_to_swap_within_batch(make_analytics_row):
+    """Test that keys freed by the same batch can be claimed by it."""
+    store = AnalyticsStore()
+    first, second = store.add_many(
+        [make_analytics_row("campaign-1", day) for day in range(2)],
+    )
+
+    day_one, day_two = first.date, second.date
+
+    store.update_many({first.id: {"date": day_two}, second.id: {"date": day_one}})
+
+    ordered = store.get_by_campaign_and_date_range("campaign-1", day_one, day_two)
+    assert [r.id for r in ordered] == [second.id, first.id]
+
+
+@pytest.mark.unit
+def test_delete_many_and_batched_eviction(make_analytics_row):
+    """Test bulk deletes and that a batch over max_items evicts the oldest once."""
+    store = InMemoryStore[CampaignAnalyticsSchema](max_items=4)
+    store.add_index("campaign_id")
+    rows = [make_analytics_row("campaign-1", day) for day in range(6)]
+
+    store.add_many(rows)
+
+    assert [r.id for r in store.list()] == [r.id for r in rows[2:]]
+    assert store.delete_many([rows[0].id, rows[2].id, rows[3].id, rows[3].id]) == 2
+    assert [r.id for r in store.get_by_index("campaign_id", "campaign-1")] == [
+        r.id for r in rows[4:]
+    ]
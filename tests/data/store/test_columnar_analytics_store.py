@@ -0,0 +1,194 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from dashboard.data.store.analytics_store import AnalyticsStore, SQLiteAnalyticsStore
+from dashboard.data.store.columnar_analytics_store import ColumnarAnalyticsStore
+
+
+@pytest.fixture
+def rows(make_analytics_row):
+    """Create five days of rows for three campaigns."""
+    return [
+        make_analytics_row(f"campaign-{c}", day, impressions=100 * (c + day))
+        for c in (1, 2, 3)
+        for day in range(5)
+    ]
+
+
+@pytest.fixture
+def store(rows):
+    """Create a columnar store holding the rows."""
+    columnar_store = ColumnarAnalyticsStore()
+    columnar_store.add_many(rows)
+    return columnar_store
+
+
+@pytest.mark.unit
+def test_lookups_match_row_store(store, rows):
+    """Test the columnar lookups return the same rows as AnalyticsStore."""
+    row_store = AnalyticsStore()
+    row_store.add_many(rows)
+    window = (date(2025, 1, 2), date(2025, 1, 4))
+
+    assert store.get_by_campaign("campaign-2") == row_store.get_by_campaign(
+        "campaign-2",
+    )
+    assert store.get_by_campaign_and_date_range(
+        "campaign-3",
+        *window,
+    ) == row_store.get_by_campaign_and_date_range("campaign-3", *window)
+    assert sorted(row.id for row in store.get_by_date_range(*window)) == sorted(
+        row.id for row in row_store.get_by_date_range(*window)
+    )
+    assert store.summarize("campaign-1", *window) == row_store.summarize(
+        "campaign-1",
+        *window,
+    )
+    assert store.summarize_all(*window) == row_store.summarize_all(*window)
+    assert store.get_by_campaign("missing") == []
+    assert store.list({"campaign_id": "campaign-1", "date": date(2025, 1, 1)})[
+        0
+    ] == row_store.get(rows[0].id)
+
+
+@pytest.mark.unit
+def test_summaries(store):
+    """Test totals come from vectorized sums over the window."""
+    totals = store.summarize("campaign-2", date(2025, 1, 2), date(2025, 1, 3))
+
+    assert totals.impressions == 300 + 400
+    assert totals.clicks == 30 + 40
+    assert totals.cost_usd == pytest.approx(7.0)
+    assert totals.days == 2
+    assert store.summarize("missing", date(2025, 1, 1), date(2025, 1, 5)).days == 0
+    assert set(store.summarize_all(date(2025, 1, 5), date(2025, 1, 5))) == {
+        "campaign-1",
+        "campaign-2",
+        "campaign-3",
+    }
+    assert store.summarize_all(date(2024, 1, 1), date(2024, 12, 31)) == {}
+
+
+@pytest.mark.unit
+def test_upsert_update_and_delete(store, rows, make_analytics_row):
+    """Test (campaign_id, date) upserts, collisions and swap-with-last deletes."""
+    replacement = store.add(make_analytics_row("campaign-1", 0, impressions=7))
+
+    assert replacement.id == rows[0].id
+    assert store.count() == 15
+    assert store.get(rows[0].id).metrics.impressions == 7
+
+    with pytest.raises(ValueError, match="collides"):
+        store.update(rows[0].id, {"date": date(2025, 1, 2)})
+    moved = store.update(rows[0].id, {"date": date(2025, 2, 1)})
+    assert moved.date == date(2025, 2, 1)
+    assert store.get_by_date(date(2025, 1, 1))[0].campaign_id == "campaign-2"
+
+    assert store.delete(rows[1].id)
+    assert not store.delete(rows[1].id)
+    assert store.delete_many([rows[5].id, rows[6].id, "missing"]) == 2
+    assert store.count() == 12
+    assert [row.date.day for row in store.get_by_campaign("campaign-1")] == [3, 4, 5, 1]
+    # The row moved into a freed slot is still reachable by its key
+    assert store.add(make_analytics_row("campaign-3", 4)).id == rows[14].id
+
+    store.clear()
+    assert store.count() == 0
+    assert store.get(rows[2].id) is None
+
+
+@pytest.mark.unit
+def test_columns_grow_past_initial_capacity(make_analytics_row):
+    """Test the arrays double when full and keep earlier rows intact."""
+    store = ColumnarAnalyticsStore()
+    store.add_many(make_analytics_row("campaign-1", day) for day in range(3000))
+
+    assert store.count() == 3000
+    totals = store.summarize("campaign-1", date(2025, 1, 1), date(2040, 1, 1))
+    assert totals.impressions == 300_000
+    assert store.size_bytes() == 4096 * 40
+
+
+@pytest.mark.unit
+def test_generation_grows_on_every_write(store, rows):
+    """Test that upserts, updates, deletes and clear move the generation."""
+    generations = [store.generation]
+    store.summarize_all(date(2025, 1, 1), date(2025, 1, 5))
+    assert store.generation == generations[-1], "Reads must not bump it"
+
+    store.add(rows[0])
+    generations.append(store.generation)
+    store.update(rows[1].id, {"campaign_id": "campaign-9"})
+    generations.append(store.generation)
+    store.delete(rows[2].id)
+    generations.append(store.generation)
+    store.clear()
+    generations.append(store.generation)
+
+    assert generations == sorted(set(generations))
+
+
+@pytest.mark.unit
+def test_daily_matrix_matches_every_backend(store, rows, tmp_path):
+    """Test all backends lay out the same campaign x day matrix, gaps as NaN."""
+    row_store = AnalyticsStore()
+    row_store.add_many(rows)
+    sqlite_store = SQLiteAnalyticsStore(tmp_path / "stores.sqlite3")
+    sqlite_store.add_many(rows)
+    for backend in (store, row_store, sqlite_store):
+        backend.delete(rows[6].id)  # campaign-2 misses 2025-01-02
+
+    matrices = [
+        backend.daily_matrix(date(2024, 12, 31), date(2025, 1, 4))
+        for backend in (store, row_store, sqlite_store)
+    ]
+    sqlite_store.close()
+
+    for matrix in matrices:
+        order = np.argsort(matrix.campaign_ids)
+        assert sorted(matrix.campaign_ids) == ["campaign-1", "campaign-2", "campaign-3"]
+        assert matrix.days == 5
+        impressions = matrix.impressions[order]
+        assert np.isnan(impressions[:, 0]).all()
+        np.testing.assert_array_equal(impressions[0, 1:], [100, 200, 300, 400])
+        np.testing.assert_array_equal(impressions[1, 1:], [200, np.nan, 400, 500])
+        np.testing.assert_allclose(matrix.ctr_pct()[order][2, 1:], 10.0)
+        assert np.isnan(matrix.ctr_pct()[order][1, 2])
+
+
+@pytest.mark.unit
+def test_summarize_periods_matches_every_backend(
+    store,
+    rows,
+    make_analytics_row,
+    tmp_path,
+):
+    """Test every backend sums each period in one call, skipping the gap."""
+    gap_only = make_analytics_row("campaign-4", 2, impressions=700)
+    row_store = AnalyticsStore()
+    sqlite_store = SQLiteAnalyticsStore(tmp_path / "stores.sqlite3")
+    backends = (store, row_store, sqlite_store)
+    for backend in backends:
+        backend.add_many([*rows, gap_only])
+    periods = [
+        (date(2025, 1, 4), date(2025, 1, 5)),
+        (date(2025, 1, 1), date(2025, 1, 2)),
+    ]
+
+    results = [backend.summarize_periods(periods) for backend in backends]
+    single = [backend.summarize_periods(periods, "campaign-2") for backend in backends]
+    expected = {
+        campaign_id: [row_store.summarize(campaign_id, *period) for period in periods]
+        for campaign_id in ("campaign-1", "campaign-2", "campaign-3")
+    }
+    sqlite_store.close()
+
+    assert expected["campaign-1"][0].impressions == 900
+    assert expected["campaign-1"][1].impressions == 300
+    for result in results:
+        assert result == expected
+    for result in single:
+        assert result == {"campaign-2": expected["campaign-2"]}
+    assert store.summarize_periods(periods, "missing") == {}
@@ -0,0 +1,82 @@
+import pytest
+
+from dashboard.data.store.analytics_store import AnalyticsStore
+from dashboard.data.store.composite_index import CompositeIndex
+
+
+@pytest.mark.unit
+def test_composite_range_matches_prefix_only():
+    """Test that range lookups are restricted to the equality prefix."""
+    index = CompositeIndex(("campaign_id", "day"))
+    index.add("a1", ("a", 1))
+    index.add("a3", ("a", 3))
+    index.add("b2", ("b", 2))
+
+    assert index.range(("a",), 1, 2) == ["a1"]
+    assert index.range(("a",)) == ["a1", "a3"]
+    assert index.range(("missing",)) == []
+    assert index.count_range(("b",), 0, 5) == 1
+
+
+@pytest.mark.unit
+def test_unique_composite_rejects_duplicates():
+    """Test that a unique index refuses a second owner for the same key."""
+    index = CompositeIndex(("campaign_id", "day"), unique=True)
+    index.add("first", ("a", 1))
+
+    with pytest.raises(ValueError, match="Duplicate key"):
+        index.add("second", ("a", 1))
+
+    index.discard("first")
+    index.add("second", ("a", 1))
+    assert index.find(("a", 1)) == "second"
+
+
+@pytest.mark.unit
+def test_reingesting_a_day_upserts(make_analytics_row):
+    """Test that adding the same (campaign, date) replaces the existing row."""
+    store = AnalyticsStore()
+    original = store.add(make_analytics_row("campaign-1", 0, impressions=100))
+
+    replacement = store.add(make_analytics_row("campaign-1", 0, impressions=250))
+
+    assert store.count() == 1
+    assert replacement.id == original.id
+    assert store.get(original.id).metrics.impressions == 250
+    assert len(store.get_by_date(original.date)) == 1
+
+
+@pytest.mark.unit
+def test_update_cannot_collide_on_unique_key(make_analytics_row):
+    """Test that moving a row onto an occupied (campaign, date) is refused."""
+    store = AnalyticsStore()
+    first = store.add(make_analytics_row("campaign-1", 0))
+    second = store.add(make_analytics_row("campaign-2", 0))
+
+    with pytest.raises(ValueError, match="collides"):
+        store.update(second.id, {"campaign_id": "campaign-1"})
+
+    assert store.get(second.id).campaign_id == "campaign-2"
+    window = store.get_by_campaign_and_date_range("campaign-1", first.date, first.date)
+    assert [r.id for r in window] == [first.id]
+
+
+@pytest.mark.unit
+def test_summarize_all_groups_campaigns(make_analytics_row):
+    """Test the grouped totals match per-campaign summaries."""
+    store = AnalyticsStore()
+    store.add_many(
+        [
+            make_analytics_row(f"campaign-{c}", day)
+            for c in range(3)
+            for day in range(4)
+        ],
+    )
+    first, last = store.get_ordered("date")[0].date, store.get_ordered("date")[-1].date
+
+    totals = store.summarize_all(first, last)
+
+    assert totals == {
+        f"campaign-{c}": store.summarize(f"campaign-{c}", first, last) for c in range(3)
+    }
+    assert totals["campaign-0"].days == 4
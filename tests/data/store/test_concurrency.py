@@ -0,0 +1,95 @@
+import random
+import sys
+import threading
+from contextlib import suppress
+
+import pytest
+
+from dashboard.data.store.analytics_store import AnalyticsStore
+from dashboard.data.store.eviction import LRUPolicy
+
+CAMPAIGNS = [f"campaign-{i}" for i in range(4)]
+WRITERS = 4
+READERS = 4
+OPS_PER_THREAD = 1500
+MAX_ITEMS = 300
+
+
+@pytest.fixture
+def fast_thread_switching():
+    """Switch threads as often as possible to provoke interleavings."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def write_session(store, make_row, rng):
+    for _ in range(OPS_PER_THREAD):
+        row = store.add(make_row(rng.choice(CAMPAIGNS), rng.randrange(120)))
+        if rng.random() < 0.3:
+            # Collisions with an existing (campaign, date) row are expected
+            with suppress(ValueError):
+                store.update(row.id, {"campaign_id": rng.choice(CAMPAIGNS)})
+        if rng.random() < 0.2:
+            store.delete(row.id)
+
+
+def read_session(store, make_row, rng):
+    for _ in range(OPS_PER_THREAD):
+        campaign_id = rng.choice(CAMPAIGNS)
+        # Rows are updated in place, so check them before writers can resume
+        with store._lock.read():
+            rows = store.get_by_campaign(campaign_id)
+            rows += store.get_by_campaign_and_date_range(
+                campaign_id,
+                make_row(campaign_id, 10).date,
+                make_row(campaign_id, 40).date,
+            )
+            rows += store.list({"campaign_id": campaign_id})
+            assert all(row.campaign_id == campaign_id for row in rows)
+
+
+@pytest.mark.slow
+def test_store_survives_concurrent_sessions(
+    fast_thread_switching,
+    make_analytics_row,
+):
+    """Stress an evicting store with concurrent writers and readers."""
+    store = AnalyticsStore()
+    store._policy = LRUPolicy()
+    store.set_max_bytes(None)
+    store.set_max_items(MAX_ITEMS)
+    errors: list[BaseException] = []
+    start = threading.Barrier(WRITERS + READERS, timeout=10)
+
+    def run(session, seed):
+        start.wait()
+        try:
+            session(store, make_analytics_row, random.Random(seed))
+        except BaseException as e:  # noqa: BLE001
+            errors.append(e)
+
+    sessions = [write_session] * WRITERS + [read_session] * READERS
+    threads = [
+        threading.Thread(target=run, args=(session, seed))
+        for seed, session in enumerate(sessions)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=120)
+
+    assert not errors, f"Concurrent access failed: {errors[:3]!r}"
+    assert store.count() <= MAX_ITEMS
+
+    # Every index must agree exactly with the primary data
+    indexed = sum(len(store.get_by_campaign(c)) for c in CAMPAIGNS)
+    assert indexed == store.count()
+    for row in store.list():
+        window = store.get_by_campaign_and_date_range(
+            row.campaign_id,
+            row.date,
+            row.date,
+        )
+        assert window == [row]
@@ -0,0 +1,95 @@
+import pytest
+
+from dashboard.data.models.analytics import CampaignAnalyticsSchema
+from dashboard.data.store.eviction import (
+    FIFOPolicy,
+    LFUPolicy,
+    LRUPolicy,
+    TTLPolicy,
+)
+from dashboard.data.store.memory_store import InMemoryStore
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_store(policy, max_items=3):
+    store = InMemoryStore[CampaignAnalyticsSchema](
+        max_items=max_items,
+        eviction_policy=policy,
+    )
+    store.add_index("campaign_id")
+    return store
+
+
+@pytest.mark.unit
+def test_fifo_ignores_reads(make_analytics_row):
+    """Test that FIFO evicts the oldest insert even if it was just read."""
+    store = make_store(FIFOPolicy())
+    rows = [store.add(make_analytics_row("c", day)) for day in range(3)]
+
+    store.get(rows[0].id)
+    store.add(make_analytics_row("c", 3))
+
+    assert store.get(rows[0].id) is None
+    stats = store.eviction_stats()
+    assert (stats.evictions, stats.hits, stats.misses) == (1, 1, 1)
+
+
+@pytest.mark.unit
+def test_lru_counts_reads_as_touches(make_analytics_row):
+    """Test that a read protects an item from LRU eviction."""
+    store = make_store(LRUPolicy())
+    rows = [store.add(make_analytics_row("c", day)) for day in range(3)]
+
+    store.get(rows[0].id)
+    store.get_by_index("campaign_id", "missing")
+    store.add(make_analytics_row("c", 3))
+
+    assert store.get(rows[0].id) is not None
+    assert store.get(rows[1].id) is None, "Least recently used row should go"
+
+
+@pytest.mark.unit
+def test_lfu_evicts_least_frequent_then_oldest(make_analytics_row):
+    """Test LFU ordering, breaking ties by insertion age."""
+    store = make_store(LFUPolicy())
+    rows = [store.add(make_analytics_row("c", day)) for day in range(3)]
+
+    for _ in range(3):
+        store.get(rows[0].id)
+    store.get(rows[2].id)
+    store.add(make_analytics_row("c", 3))
+    store.add(make_analytics_row("c", 4))
+
+    remaining = {r.id for r in store.list()}
+    assert rows[0].id in remaining
+    assert rows[2].id in remaining
+    assert rows[1].id not in remaining
+    assert store.eviction_stats().evictions == 2
+
+
+@pytest.mark.unit
+def test_ttl_expires_items_per_item(make_analytics_row):
+    """Test default and per-item TTLs, including hiding expired reads."""
+    clock = FakeClock()
+    policy = TTLPolicy(default_ttl_s=10, clock=clock)
+    store = make_store(policy, max_items=100)
+    short = store.add(make_analytics_row("c", 0))
+    long = store.add(make_analytics_row("c", 1))
+    policy.set_ttl(long.id, 60)
+
+    clock.now = 30
+    assert store.get(short.id) is None
+    assert [r.id for r in store.get_by_index("campaign_id", "c")] == [long.id]
+    assert store.count() == 2, "Expired rows stay until the next write"
+
+    assert store.purge_expired() == 1
+    assert store.count() == 1
+    assert store.eviction_stats().evictions == 1
+    assert store.eviction_stats().misses == 1
@@ -0,0 +1,92 @@
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+
+from dashboard.data.models.analytics import (
+    CampaignHourlyMetricsSchema,
+    MetricsSchema,
+    SeriesResolutionEnum,
+)
+from dashboard.data.store.analytics_store import HourlyAnalyticsStore
+
+START = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def make_hour(hour: int, impressions: int = 10) -> CampaignHourlyMetricsSchema:
+    return CampaignHourlyMetricsSchema.model_validate(
+        {
+            "campaign_id": "campaign-1",
+            "hour": START + timedelta(hours=hour),
+            "metrics": MetricsSchema(
+                impressions=impressions,
+                clicks=1,
+                ctr_pct=100 / impressions,
+                cost_usd=0.5,
+            ),
+        },
+    )
+
+
+@pytest.mark.unit
+def test_hours_are_floored_to_utc():
+    """Test hour stamps are normalized to the start of a UTC hour."""
+    row = CampaignHourlyMetricsSchema(
+        campaign_id="campaign-1",
+        hour=datetime(2025, 1, 1, 3, 45, tzinfo=timezone(timedelta(hours=2))),
+        metrics=MetricsSchema(impressions=1, clicks=0, ctr_pct=0, cost_usd=0),
+    )
+
+    assert row.hour == datetime(2025, 1, 1, 1, tzinfo=UTC)
+
+
+@pytest.mark.unit
+def test_downsample_sums_each_period_within_the_window():
+    """Test daily points sum their hours and edge days only count the window."""
+    store = HourlyAnalyticsStore()
+    store.add_many([make_hour(hour, 10 + hour) for hour in range(72)])
+
+    days = store.downsample(
+        "campaign-1",
+        START + timedelta(hours=12),
+        START + timedelta(hours=71),
+        SeriesResolutionEnum.DAY,
+    )
+
+    assert list(days) == [START + timedelta(days=day) for day in range(3)]
+    assert [totals.days for totals in days.values()] == [12, 24, 24]
+    assert days[START].impressions == sum(10 + hour for hour in range(12, 24))
+    assert days[START].cost_usd == pytest.approx(6.0)
+
+
+@pytest.mark.unit
+def test_downsample_skips_empty_periods():
+    """Test hours without rows produce no points."""
+    store = HourlyAnalyticsStore()
+    store.add_many([make_hour(0), make_hour(5)])
+
+    hours = store.downsample(
+        "campaign-1",
+        START,
+        START + timedelta(hours=23),
+        SeriesResolutionEnum.HOUR,
+    )
+
+    assert list(hours) == [START, START + timedelta(hours=5)]
+    assert store.downsample("other", START, START, SeriesResolutionEnum.HOUR) == {}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("days", "expected"),
+    [
+        (1, SeriesResolutionEnum.HOUR),
+        (31, SeriesResolutionEnum.DAY),
+        (365, SeriesResolutionEnum.WEEK),
+        (3 * 365, SeriesResolutionEnum.MONTH),
+    ],
+)
+def test_fitting_resolution(days, expected):
+    """Test the finest resolution within 100 points is chosen for a window."""
+    end = START + timedelta(days=days) - timedelta(hours=1)
+
+    assert SeriesResolutionEnum.fitting(START, end, 100) is expected
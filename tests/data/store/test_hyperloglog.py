@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from dashboard.data.store.hyperloglog import HyperLogLog, hash_integers, hash_strings
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("count", [0, 1, 100, 5_000, 200_000])
+def test_estimate_within_error_bound(count):
+    """Test estimates stay within four standard errors at every scale."""
+    sketch = HyperLogLog()
+    sketch.add_hashes(hash_integers(np.arange(count)))
+
+    assert sketch.estimate() == pytest.approx(count, rel=4 * 0.0163, abs=1)
+    assert len(sketch.to_bytes()) == 4096
+
+
+@pytest.mark.unit
+def test_merge_counts_the_union():
+    """Test merged sketches equal one sketch fed both sets."""
+    left, right, both = HyperLogLog(), HyperLogLog(), HyperLogLog()
+    left.add_hashes(hash_strings(f"user-{i}" for i in range(3000)))
+    right.add_hashes(hash_strings(f"user-{i}" for i in range(2000, 5000)))
+    both.add_hashes(hash_strings(f"user-{i}" for i in range(5000)))
+
+    merged = HyperLogLog.merged([left.to_bytes(), right.to_bytes()])
+
+    assert merged.to_bytes() == both.to_bytes()
+    assert merged.estimate() == pytest.approx(5000, rel=0.05)
+
+
+@pytest.mark.unit
+def test_repeated_values_do_not_grow_the_estimate():
+    """Test adding the same users again leaves the sketch unchanged."""
+    sketch = HyperLogLog(precision=10)
+    hashes = hash_integers(np.arange(1000))
+    sketch.add_hashes(hashes)
+    before = sketch.to_bytes()
+
+    sketch.add_hashes(hashes)
+
+    assert sketch.to_bytes() == before
+    with pytest.raises(ValueError, match="different precision"):
+        sketch.update(HyperLogLog())
@@ -0,0 +1,51 @@
+import pytest
+
+from dashboard.data.models.analytics import CampaignAnalyticsSchema
+from dashboard.data.store.memory_budget import MemoryBudget
+from dashboard.data.store.memory_store import InMemoryStore
+from dashboard.data.store.sizing import estimate_size_bytes
+
+
+def make_store(max_bytes=None):
+    return InMemoryStore[CampaignAnalyticsSchema](max_items=None, max_bytes=max_bytes)
+
+
+@pytest.mark.unit
+def test_size_tracks_add_update_delete(make_analytics_row):
+    """Test that the byte footprint follows every mutation."""
+    store = make_store()
+    row = store.add(make_analytics_row("campaign-1", 0))
+    assert store.size_bytes() == estimate_size_bytes(row)
+
+    store.update(row.id, {"campaign_id": "a-much-longer-campaign-identifier" * 4})
+    assert store.size_bytes() == estimate_size_bytes(row)
+
+    store.delete(row.id)
+    assert store.size_bytes() == 0
+
+
+@pytest.mark.unit
+def test_store_byte_limit_evicts_oldest(make_analytics_row):
+    """Test that exceeding max_bytes evicts until the store fits."""
+    row_bytes = estimate_size_bytes(make_analytics_row("campaign-1", 0))
+    store = make_store(max_bytes=row_bytes * 3)
+    rows = [store.add(make_analytics_row("campaign-1", day)) for day in range(5)]
+
+    assert store.size_bytes() <= row_bytes * 3
+    assert [r.id for r in store.list()] == [r.id for r in rows[2:]]
+
+
+@pytest.mark.unit
+def test_global_budget_evicts_from_largest_store(make_analytics_row):
+    """Test that the shared budget takes bytes from the biggest store."""
+    row_bytes = estimate_size_bytes(make_analytics_row("campaign-1", 0))
+    small, large = make_store(), make_store()
+    budget = MemoryBudget(row_bytes * 4, [small, large])
+
+    small.add(make_analytics_row("small", 0))
+    for day in range(4):
+        large.add(make_analytics_row("large", day))
+
+    assert budget.total_bytes() <= row_bytes * 4
+    assert small.count() == 1, "Small store should be left alone"
+    assert large.count() == 3
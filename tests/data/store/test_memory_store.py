@@ -0,0 +1,95 @@
+import pytest
+
+from dashboard.data.models.analytics import CampaignAnalyticsSchema
+from dashboard.data.store.analytics_store import AnalyticsStore
+from dashboard.data.store.eviction import TTLPolicy
+from dashboard.data.store.memory_store import InMemoryStore
+
+
+@pytest.fixture
+def store(make_analytics_row):
+    """Create an analytics store with a few rows."""
+    analytics_store = AnalyticsStore()
+    for day in range(5):
+        analytics_store.add(make_analytics_row("campaign-1", day))
+        analytics_store.add(make_analytics_row("campaign-2", day))
+    return analytics_store
+
+
+@pytest.mark.unit
+def test_get_by_index_preserves_insertion_order(store):
+    """Test that index lookups return items in insertion order."""
+    rows = store.get_by_campaign("campaign-1")
+
+    days = [row.date.day for row in rows]
+    assert days == [1, 2, 3, 4, 5], f"Expected ordered days, got {days}"
+
+
+@pytest.mark.unit
+def test_update_moves_item_between_buckets(store):
+    """Test that updating an indexed field moves the item to the new bucket."""
+    row = store.get_by_campaign("campaign-1")[0]
+
+    store.update(row.id, {"campaign_id": "campaign-3"})
+
+    assert row.id not in {r.id for r in store.get_by_campaign("campaign-1")}
+    assert [r.id for r in store.get_by_campaign("campaign-3")] == [row.id]
+
+
+@pytest.mark.unit
+def test_delete_cleans_up_empty_buckets(store):
+    """Test that deleting the last item of a bucket removes the bucket."""
+    for row in store.get_by_campaign("campaign-2"):
+        assert store.delete(row.id)
+
+    assert store.get_by_campaign("campaign-2") == []
+    assert "campaign-2" not in store._indices["campaign_id"]
+    assert store.count() == 5
+
+
+@pytest.mark.unit
+def test_memory_limit_evicts_oldest_items(make_analytics_row):
+    """Test that exceeding max_items evicts in insertion order."""
+    limited = InMemoryStore[CampaignAnalyticsSchema](max_items=3)
+    limited.add_index("campaign_id")
+    rows = [make_analytics_row("campaign-1", day) for day in range(5)]
+    for row in rows:
+        limited.add(row)
+
+    remaining = [r.id for r in limited.get_by_index("campaign_id", "campaign-1")]
+    assert remaining == [r.id for r in rows[2:]], f"Unexpected rows {remaining}"
+    assert limited.count() == 3
+
+
+@pytest.mark.unit
+def test_generation_grows_on_every_write(store, make_analytics_row):
+    """Test that each kind of mutation moves the generation forward."""
+    row = store.get_by_campaign("campaign-1")[0]
+    generations = [store.generation]
+
+    store.get(row.id)
+    store.list({"campaign_id": "campaign-1"})
+    assert store.generation == generations[-1], "Reads must not bump it"
+
+    store.add(make_analytics_row("campaign-3", 0))
+    generations.append(store.generation)
+    store.update(row.id, {"campaign_id": "campaign-4"})
+    generations.append(store.generation)
+    store.delete_many([row.id])
+    generations.append(store.generation)
+    store.set_max_items(5)
+    generations.append(store.generation)
+    store.clear()
+    generations.append(store.generation)
+
+    assert generations == sorted(set(generations))
+    # Generations are unique across stores, so a fresh store never matches
+    assert AnalyticsStore().generation > generations[-1]
+
+
+@pytest.mark.unit
+def test_generation_never_repeats_when_items_expire():
+    """Test that a TTL store hands out a new generation on every read."""
+    expiring = InMemoryStore[CampaignAnalyticsSchema](eviction_policy=TTLPolicy(60))
+
+    assert expiring.generation != expiring.generation
@@ -0,0 +1,127 @@
+import os
+
+import pytest
+
+from dashboard.data.models.analytics import CampaignAnalyticsSchema
+from dashboard.data.models.targeting import (
+    AgeRangeSchema,
+    AudienceTargetingSchema,
+    LocationSchema,
+)
+from dashboard.data.store.analytics_store import AnalyticsStore
+from dashboard.data.store.persistence import (
+    FsyncPolicyEnum,
+    ModelCodec,
+    StorePersistence,
+    WriteAheadLog,
+)
+
+
+def open_store(directory, compact_bytes=None):
+    store = AnalyticsStore()
+    persistence = StorePersistence(
+        directory,
+        "analytics",
+        CampaignAnalyticsSchema,
+        FsyncPolicyEnum.NEVER,
+        compact_bytes=compact_bytes,
+    )
+    store.enable_persistence(persistence)
+    return store, persistence
+
+
+def snapshot_of(store):
+    return sorted(row.model_dump_json() for row in store.list())
+
+
+@pytest.mark.unit
+def test_codec_round_trips_nested_models():
+    """Test that nested models, lists of models and optionals survive encoding."""
+    targeting = AudienceTargetingSchema(
+        age_range=AgeRangeSchema(min_age=18, max_age=35),
+        locations=[LocationSchema(country="US", region="CA", city="SF")],
+        interests=["tech"],
+    )
+    codec = ModelCodec(AudienceTargetingSchema)
+
+    decoded = codec.decode(codec.encode(targeting))
+
+    assert decoded == targeting
+    assert isinstance(decoded.locations[0], LocationSchema)
+
+
+@pytest.mark.unit
+def test_restart_replays_log(tmp_path, make_analytics_row):
+    """Test that every logged mutation kind is replayed after a restart."""
+    store, persistence = open_store(tmp_path)
+    rows = store.add_many([make_analytics_row("campaign-1", day) for day in range(5)])
+    store.add(make_analytics_row("campaign-1", 0, impressions=500))
+    store.update(rows[1].id, {"campaign_id": "campaign-2"})
+    store.delete_many([rows[2].id, rows[3].id])
+    expected = snapshot_of(store)
+    persistence.close()
+
+    restored, _ = open_store(tmp_path)
+
+    assert snapshot_of(restored) == expected
+    assert [r.id for r in restored.get_by_campaign("campaign-2")] == [rows[1].id]
+    assert restored.size_bytes() == store.size_bytes()
+
+
+@pytest.mark.unit
+def test_compaction_writes_snapshot_and_empties_log(tmp_path, make_analytics_row):
+    """Test that an oversized log is folded into a snapshot that reloads."""
+    store, persistence = open_store(tmp_path, compact_bytes=1)
+    store.add_many([make_analytics_row("campaign-1", day) for day in range(3)])
+    store.clear()
+    store.add(make_analytics_row("campaign-2", 7))
+    expected = snapshot_of(store)
+    persistence.close()
+
+    assert (tmp_path / "analytics.snapshot").exists()
+    assert (tmp_path / "analytics.wal").stat().st_size == 0
+
+    restored, _ = open_store(tmp_path)
+    assert snapshot_of(restored) == expected
+
+
+@pytest.mark.unit
+def test_torn_tail_is_dropped(tmp_path):
+    """Test that a half-written last record is ignored and truncated."""
+    path = tmp_path / "store.wal"
+    log = WriteAheadLog(path, FsyncPolicyEnum.NEVER)
+    log.append(("add", [1]))
+    log.append(("add", [2]))
+    log.close()
+    intact_size = path.stat().st_size
+    with path.open("ab") as log_file:
+        log_file.write(b"\x40\x00\x00\x00garbage")
+
+    reopened = WriteAheadLog(path, FsyncPolicyEnum.NEVER)
+
+    assert list(reopened.replay()) == [("add", [1]), ("add", [2])]
+    assert path.stat().st_size == intact_size
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("policy", "expected_syncs"),
+    [
+        (FsyncPolicyEnum.ALWAYS, 3),
+        (FsyncPolicyEnum.INTERVAL, 1),
+        (FsyncPolicyEnum.NEVER, 0),
+    ],
+)
+def test_fsync_policy(tmp_path, monkeypatch, policy, expected_syncs):
+    """Test how often each fsync policy forces appends to disk."""
+    syncs = []
+    monkeypatch.setattr(os, "fsync", syncs.append)
+    now = [0.0]
+    log = WriteAheadLog(tmp_path / "store.wal", policy, 10.0, clock=lambda: now[0])
+
+    log.append(("delete", ["a"]))
+    log.append(("delete", ["b"]))
+    now[0] = 11.0
+    log.append(("delete", ["c"]))
+
+    assert len(syncs) == expected_syncs
@@ -0,0 +1,30 @@
+import pytest
+
+from dashboard.data.store.posting_list import PostingList
+
+
+@pytest.mark.unit
+def test_posting_list_keeps_insertion_order():
+    """Test that IDs iterate in the order they were first added."""
+    posting = PostingList(["b", "a"])
+    posting.add("c")
+    posting.add("a")
+
+    assert list(posting) == ["b", "a", "c"], f"Unexpected order {list(posting)}"
+    assert len(posting) == 3
+
+
+@pytest.mark.unit
+def test_posting_list_discard():
+    """Test membership and removal, including missing IDs."""
+    posting = PostingList(["a", "b"])
+
+    posting.discard("a")
+    posting.discard("missing")
+
+    assert "a" not in posting
+    assert "b" in posting
+    assert bool(posting)
+
+    posting.discard("b")
+    assert not posting
@@ -0,0 +1,141 @@
+import random
+from datetime import date
+
+import pytest
+
+from dashboard.data.store.analytics_store import AnalyticsStore
+from dashboard.data.store.eviction import TTLPolicy
+from dashboard.data.store.memory_store import InMemoryStore
+from dashboard.data.store.prefix_sum_index import PrefixSumIndex
+
+
+def brute_force(entries, group, lo, hi):
+    matches = [
+        values
+        for entry_group, order, values in entries.values()
+        if entry_group == group and lo <= order <= hi
+    ]
+    if not matches:
+        return None
+    return (*map(sum, zip(*matches, strict=True)), len(matches))
+
+
+@pytest.mark.unit
+def test_window_totals_are_two_lookups():
+    """Test totals over windows, appends and single-field indexes."""
+    index = PrefixSumIndex("group", "day", ("value",))
+    for day in range(10):
+        index.add(f"a{day}", ("a", day, (day,)))
+
+    assert index.totals("a", 2, 4) == (2 + 3 + 4, 3)
+    assert index.totals("a") == (45, 10)
+    assert index.totals("a", 20, 30) is None
+    assert index.totals("missing") is None
+    assert dict(index.all_totals(9, 9)) == {"a": (9, 1)}
+
+
+@pytest.mark.unit
+def test_several_windows_share_one_lookup_per_group():
+    """Test per-window totals, with zeros for windows a group has no rows in."""
+    index = PrefixSumIndex("group", "day", ("value",))
+    for day in range(10):
+        index.add(f"a{day}", ("a", day, (day,)))
+    index.add("b5", ("b", 5, (50,)))
+
+    assert index.window_totals("a", [(7, 9), (4, 6)]) == [(24, 3), (15, 3)]
+    assert dict(index.all_window_totals([(7, 9), (4, 6)])) == {
+        "a": [(24, 3), (15, 3)],
+        "b": [(0, 0), (50, 1)],
+    }
+    assert index.window_totals("b", [(0, 2)]) is None
+
+
+@pytest.mark.unit
+def test_late_updates_and_deletes_match_brute_force():
+    """Test random late inserts, replacements and deletes against full sums."""
+    rng = random.Random(7)
+    index = PrefixSumIndex("group", "day", ("clicks", "cost"))
+    entries = {}
+
+    for step in range(2000):
+        item_id = f"row-{rng.randrange(300)}"
+        if rng.random() < 0.25:
+            index.discard(item_id)
+            entries.pop(item_id, None)
+        elif rng.random() < 0.1:
+            batch = {
+                f"row-{rng.randrange(300)}": (
+                    rng.choice("ab"),
+                    rng.randrange(60),
+                    (rng.randrange(10), rng.random()),
+                )
+                for _ in range(rng.randrange(1, 40))
+            }
+            index.add_many(batch.items())
+            entries.update(batch)
+        else:
+            entry = (rng.choice("ab"), rng.randrange(60), (rng.randrange(10), 1.5))
+            index.add(item_id, entry)
+            entries[item_id] = entry
+
+        if step % 50 == 0:
+            lo = rng.randrange(60)
+            hi = lo + rng.randrange(30)
+            for group in "ab":
+                expected = brute_force(entries, group, lo, hi)
+                actual = index.totals(group, lo, hi)
+                assert (actual is None) == (expected is None)
+                if expected is not None:
+                    assert actual == pytest.approx(expected)
+
+    index.discard_many(list(entries))
+    assert len(index) == 0
+    assert dict(index.all_totals()) == {}
+
+
+@pytest.mark.unit
+def test_store_keeps_sums_through_updates(make_analytics_row):
+    """Test AnalyticsStore summaries follow late updates, deletes and clears."""
+    store = AnalyticsStore()
+    rows = store.add_many([make_analytics_row("campaign-1", day) for day in range(30)])
+    window = (date(2025, 1, 5), date(2025, 1, 10))
+
+    store.update(rows[5].id, {"metrics": make_analytics_row("x", 0, 1000).metrics})
+    store.delete(rows[6].id)
+    store.add(make_analytics_row("campaign-1", 7, impressions=500))
+
+    totals = store.summarize("campaign-1", *window)
+    assert totals.impressions == 100 * 4 + 1000 + 500 - 100
+    assert totals.days == 5
+    assert store.summarize("campaign-1", date(2025, 1, 7), date(2025, 1, 7)).days == 0
+
+    store.clear()
+    assert store.summarize_all(*window) == {}
+
+
+@pytest.mark.unit
+def test_sum_by_falls_back_without_a_matching_index(make_analytics_row):
+    """Test sum_by scans when no prefix sum index matches or items can expire."""
+    rows = [
+        make_analytics_row(f"campaign-{c}", day) for c in (1, 2) for day in range(3)
+    ]
+    plain = InMemoryStore(max_items=None)
+    plain.add_many(rows)
+    expiring = InMemoryStore(max_items=None, eviction_policy=TTLPolicy(60))
+    expiring.add_many(rows)
+    expiring.add_prefix_sum_index("campaign_id", "date", ("metrics.clicks",))
+
+    for store in (plain, expiring):
+        sums = store.sum_by(
+            "campaign_id",
+            ("metrics.clicks",),
+            "date",
+            (date(2025, 1, 2), None),
+        )
+        assert sums == {"campaign-1": (20, 2), "campaign-2": (20, 2)}
+        assert store.sum_by(
+            "campaign_id",
+            ("metrics.clicks",),
+            "date",
+            filters={"campaign_id": "campaign-2"},
+        ) == {"campaign-2": (30, 3)}
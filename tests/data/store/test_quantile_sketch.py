@@ -0,0 +1,101 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from dashboard.data.models.analytics import DateBucketSchema, RollupGranularityEnum
+from dashboard.data.store.analytics_store import AnalyticsStore, sketch_rows
+from dashboard.data.store.columnar_analytics_store import ColumnarAnalyticsStore
+from dashboard.data.store.quantile_sketch import QuantileSketch
+
+
+@pytest.fixture
+def lognormal_values():
+    """Create skewed values like daily spend, with a few zeros."""
+    values = np.random.default_rng(5).lognormal(mean=3, sigma=1, size=20_000)
+    values[:100] = 0
+    return values
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("q", [0.01, 0.5, 0.9, 0.99])
+def test_quantiles_within_relative_accuracy(lognormal_values, q):
+    """Test each quantile is within 1% of the exact value at that rank."""
+    sketch = QuantileSketch()
+    sketch.add_array(lognormal_values)
+
+    exact = np.quantile(lognormal_values, q, method="lower")
+    upper = np.quantile(lognormal_values, q, method="higher")
+
+    assert exact * 0.99 <= sketch.quantile(q) <= upper * 1.01
+    assert len(sketch) < 1000
+
+
+@pytest.mark.unit
+def test_merge_and_remove_are_exact(lognormal_values):
+    """Test merged halves equal the whole and removals undo adds."""
+    whole, left, right = QuantileSketch(), QuantileSketch(), QuantileSketch()
+    whole.add_array(lognormal_values)
+    left.add_many(lognormal_values[:5000].tolist())
+    right.add_array(lognormal_values[5000:])
+
+    left.update(right)
+    assert left.bins == whole.bins
+    assert left.count == whole.count
+
+    for value in lognormal_values[5000:].tolist():
+        left.remove(value)
+    assert left.count == 5000
+    assert left.quantile(0.5) == pytest.approx(
+        np.median(lognormal_values[:5000]),
+        rel=0.02,
+    )
+    assert QuantileSketch().quantile(0.5) is None
+
+
+@pytest.mark.unit
+def test_store_sketches_match_a_scan(make_analytics_row):
+    """Test indexed, scanned and columnar sketches agree after edits."""
+    rows = [
+        make_analytics_row(f"campaign-{campaign}", day, 100 + 37 * day % 500)
+        for campaign in range(3)
+        for day in range(120)
+    ]
+    store, columnar = AnalyticsStore(), ColumnarAnalyticsStore()
+    stored = store.add_many(rows)
+    columnar.add_many(rows)
+    store.delete(stored[5].id)
+    columnar.delete(stored[5].id)
+    buckets = [
+        DateBucketSchema(
+            granularity=RollupGranularityEnum.MONTH,
+            start_date=date(2025, 2, 1),
+            end_date=date(2025, 2, 28),
+        ),
+        DateBucketSchema(
+            granularity=RollupGranularityEnum.WEEK,
+            start_date=date(2025, 1, 6),
+            end_date=date(2025, 1, 12),
+        ),
+        DateBucketSchema(
+            granularity=RollupGranularityEnum.DAY,
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 1, 5),
+        ),
+    ]
+    in_window = [
+        row
+        for row in store.list()
+        if any(b.start_date <= row.date <= b.end_date for b in buckets)
+    ]
+
+    expected = sketch_rows(in_window)
+    for sketches in (
+        store.distribution_sketches(buckets),
+        columnar.distribution_sketches(buckets),
+    ):
+        assert [sketch.bins for sketch in sketches] == [s.bins for s in expected]
+        assert [sketch.count for sketch in sketches] == [s.count for s in expected]
+
+    one = store.distribution_sketches(buckets, "campaign-1")
+    assert one[1].count == len([r for r in in_window if r.campaign_id == "campaign-1"])
@@ -0,0 +1,91 @@
+import pytest
+
+from dashboard.data.models.campaign import CampaignSchema, CampaignStatusEnum
+from dashboard.data.store.analytics_store import AnalyticsStore
+from dashboard.data.store.campaign_store import CampaignStore
+from dashboard.data.store.query_planner import QueryStrategyEnum
+
+
+@pytest.fixture
+def analytics(make_analytics_row):
+    """Create an analytics store with three campaigns over ten days."""
+    store = AnalyticsStore()
+    for campaign_id in ("campaign-1", "campaign-2", "campaign-3"):
+        for day in range(10):
+            store.add(make_analytics_row(campaign_id, day))
+    return store
+
+
+@pytest.mark.unit
+def test_single_indexed_predicate_uses_index(analytics):
+    """Test that an indexed equality filter avoids the scan."""
+    plan = analytics.explain({"campaign_id": "campaign-2"})
+
+    assert plan.strategy == QueryStrategyEnum.INDEX
+    assert plan.index_fields == ["campaign_id"]
+    assert plan.candidate_count == 10
+    assert len(analytics.list({"campaign_id": "campaign-2"})) == 10
+
+
+@pytest.mark.unit
+def test_composite_key_is_preferred(analytics):
+    """Test that a fully bound composite key drives the lookup."""
+    day = analytics.get_by_campaign("campaign-1")[4]
+    filters = {"campaign_id": "campaign-1", "date": day.date}
+
+    plan = analytics.explain(filters)
+
+    assert plan.strategy == QueryStrategyEnum.INDEX
+    assert plan.candidate_count == 1
+    assert [r.id for r in analytics.list(filters)] == [day.id]
+
+
+@pytest.mark.unit
+def test_residual_predicates_only_scan_candidates(analytics):
+    """Test that unindexed filters are checked only on indexed candidates."""
+    row = analytics.get_by_campaign("campaign-3")[0]
+    filters = {"campaign_id": "campaign-3", "metrics": row.metrics}
+
+    plan = analytics.explain(filters)
+
+    assert plan.strategy == QueryStrategyEnum.INDEX
+    assert plan.residual_fields == ["metrics"]
+    assert len(analytics.list(filters)) == 10
+
+
+@pytest.mark.unit
+def test_missing_value_short_circuits(analytics):
+    """Test that a value absent from an index yields an empty plan."""
+    plan = analytics.explain({"campaign_id": "nope", "metrics": None})
+
+    assert plan.strategy == QueryStrategyEnum.EMPTY
+    assert analytics.list({"campaign_id": "nope"}) == []
+
+
+@pytest.mark.unit
+def test_intersects_multiple_indexes_and_scans_without_index():
+    """Test posting-set intersection and the scan fallback."""
+    store = CampaignStore()
+    for i in range(6):
+        store.add(
+            CampaignSchema(
+                name=f"Campaign {i}",
+                banner_id="banner",
+                targeting_id="targeting",
+                budget_usd=100 * (i + 1),
+                start_date="2025-01-01T00:00:00",
+                created_by=f"user-{i % 2}",
+                status=CampaignStatusEnum.ACTIVE if i < 3 else CampaignStatusEnum.DRAFT,
+            ),
+        )
+
+    filters = {"created_by": "user-0", "status": CampaignStatusEnum.ACTIVE}
+    plan = store.explain(filters)
+    assert plan.strategy == QueryStrategyEnum.INTERSECT
+    assert sorted(plan.index_fields) == ["created_by", "status"]
+    assert [c.name for c in store.list(filters)] == ["Campaign 0", "Campaign 2"]
+
+    scan_plan = store.explain({"name": "Campaign 4"})
+    assert scan_plan.strategy == QueryStrategyEnum.SCAN
+    assert scan_plan.candidate_count == 6
+    assert len(store.list({"name": "Campaign 4"})) == 1
@@ -0,0 +1,60 @@
+import pytest
+
+from dashboard.data.store.analytics_store import AnalyticsStore
+from dashboard.data.store.range_index import RangeIndex
+
+
+@pytest.fixture
+def budget_index():
+    """Create a range index over a handful of budgets."""
+    index = RangeIndex()
+    for item_id, budget in [("a", 500), ("b", 100), ("c", 250), ("d", 1000)]:
+        index.add(item_id, budget)
+    return index
+
+
+@pytest.mark.unit
+def test_range_is_inclusive_and_sorted(budget_index):
+    """Test that range bounds are inclusive and results ascend by value."""
+    assert budget_index.range(100, 500) == ["b", "c", "a"]
+    assert budget_index.range(lo=300) == ["a", "d"]
+    assert budget_index.range(hi=99) == []
+    assert budget_index.count_range(100, 500) == 3
+
+
+@pytest.mark.unit
+def test_ordered_descending_with_limit(budget_index):
+    """Test ordered iteration in both directions."""
+    assert list(budget_index.ordered(descending=True, limit=2)) == ["d", "a"]
+    assert list(budget_index.ordered()) == ["b", "c", "a", "d"]
+
+
+@pytest.mark.unit
+def test_readd_moves_item_and_none_is_not_indexed(budget_index):
+    """Test that changing a value re-sorts the item and None drops it."""
+    budget_index.add("b", 2000)
+    assert list(budget_index.ordered(descending=True, limit=1)) == ["b"]
+
+    budget_index.add("b", None)
+    assert "b" not in budget_index
+    assert len(budget_index) == 3
+
+
+@pytest.mark.unit
+def test_store_range_queries_follow_updates(make_analytics_row):
+    """Test that store range lookups see updates and deletes."""
+    store = AnalyticsStore()
+    rows = [store.add(make_analytics_row("campaign-1", day)) for day in range(10)]
+    store.add(make_analytics_row("campaign-2", 3))
+
+    window = store.get_by_campaign_and_date_range(
+        "campaign-1",
+        rows[2].date,
+        rows[4].date,
+    )
+    assert [r.id for r in window] == [r.id for r in rows[2:5]]
+
+    store.delete(rows[3].id)
+    newest = store.get_ordered("date", descending=True, limit=2)
+    assert [r.id for r in newest] == [rows[9].id, rows[8].id]
+    assert len(store.get_by_date_range(rows[2].date, rows[4].date)) == 3
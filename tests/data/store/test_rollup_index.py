@@ -0,0 +1,107 @@
+from datetime import date
+
+import pytest
+
+from dashboard.data.models.analytics import DateBucketSchema, RollupGranularityEnum
+from dashboard.data.store.analytics_store import AnalyticsStore
+from dashboard.data.store.rollup_index import RollupIndex
+
+WEEK = RollupGranularityEnum.WEEK
+MONTH = RollupGranularityEnum.MONTH
+
+
+@pytest.mark.unit
+def test_buckets_follow_adds_updates_and_deletes():
+    """Test each mutation adjusts one bucket and empty buckets disappear."""
+    index = RollupIndex("group", "day", ("value",), lambda day: day // 7)
+    index.add_many((f"row-{day}", ("a", day // 7, (day,))) for day in range(14))
+
+    assert index.totals("a", 0) == (21, 7)
+    assert index.totals("a", 1) == (70, 7)
+
+    index.add("row-3", ("a", 1, (100,)))
+    assert index.totals("a", 0) == (18, 6)
+    assert index.totals("a", 1) == (170, 8)
+
+    index.discard_many([f"row-{day}" for day in range(7)])
+    assert index.totals("a", 0) is None
+    assert len(index) == 1
+
+
+@pytest.mark.unit
+def test_store_rollups_match_daily_sums(make_analytics_row):
+    """Test week and month rollups agree with summing the daily rows."""
+    store = AnalyticsStore()
+    rows = store.add_many([make_analytics_row("campaign-1", day) for day in range(90)])
+    store.delete(rows[10].id)
+    store.update(rows[40].id, {"metrics": make_analytics_row("x", 0, 500).metrics})
+    buckets = [
+        DateBucketSchema(
+            granularity=MONTH,
+            start_date=date(2025, 2, 1),
+            end_date=date(2025, 2, 28),
+        ),
+        DateBucketSchema(
+            granularity=WEEK,
+            start_date=date(2025, 1, 6),
+            end_date=date(2025, 1, 12),
+        ),
+        DateBucketSchema(
+            granularity=RollupGranularityEnum.DAY,
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 1, 3),
+        ),
+    ]
+
+    totals = store.rollup_totals("campaign-1", buckets)
+
+    assert totals == [
+        store.summarize("campaign-1", bucket.start_date, bucket.end_date)
+        for bucket in buckets
+    ]
+    assert totals[0].impressions == 27 * 100 + 500
+    assert totals[1].days == 6
+
+
+@pytest.mark.unit
+def test_deletes_leave_no_float_residue(make_analytics_row):
+    """Test a week whose remaining cost is zero rolls up to exactly zero."""
+    store = AnalyticsStore()
+    rows = store.add_many(
+        [
+            make_analytics_row("campaign-1", day + 5).model_copy(
+                update={
+                    "metrics": make_analytics_row("x", 0).metrics.model_copy(
+                        update={"cost_usd": cost},
+                    ),
+                },
+            )
+            for day, cost in enumerate([1234.567, 0.1, 0.0])
+        ],
+    )
+    store.delete_many([rows[0].id, rows[1].id])
+    week = DateBucketSchema(
+        granularity=WEEK,
+        start_date=date(2025, 1, 6),
+        end_date=date(2025, 1, 12),
+    )
+
+    (totals,) = store.rollup_totals("campaign-1", [week])
+
+    assert totals.cost_usd == 0.0
+    assert totals.days == 1
+
+
+@pytest.mark.unit
+def test_rollup_buckets_must_be_whole_periods(make_analytics_row):
+    """Test a week bucket that is not Monday to Sunday is refused."""
+    store = AnalyticsStore()
+    store.add(make_analytics_row("campaign-1", 0))
+    partial = DateBucketSchema(
+        granularity=WEEK,
+        start_date=date(2025, 1, 1),
+        end_date=date(2025, 1, 7),
+    )
+
+    with pytest.raises(ValueError, match="not a whole week"):
+        store.rollup_totals("campaign-1", [partial])
@@ -0,0 +1,56 @@
+import threading
+import time
+
+import pytest
+
+from dashboard.data.store.rw_lock import ReadWriteLock
+
+
+@pytest.mark.unit
+def test_readers_share_the_lock():
+    """Test that several threads can hold the read side at once."""
+    lock = ReadWriteLock()
+    inside = threading.Barrier(3, timeout=5)
+
+    def reader():
+        with lock.read():
+            inside.wait()
+
+    threads = [threading.Thread(target=reader) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert not any(thread.is_alive() for thread in threads)
+
+
+@pytest.mark.unit
+def test_writer_excludes_readers_and_is_reentrant():
+    """Test that a writer blocks readers and may re-enter both sides."""
+    lock = ReadWriteLock()
+    events: list[str] = []
+
+    def reader():
+        with lock.read():
+            events.append("read")
+
+    with lock.write():
+        with lock.write(), lock.read():
+            pass
+        thread = threading.Thread(target=reader)
+        thread.start()
+        time.sleep(0.05)
+        events.append("write-done")
+
+    thread.join(timeout=5)
+    assert events == ["write-done", "read"], f"Unexpected order {events}"
+
+
+@pytest.mark.unit
+def test_read_lock_cannot_be_upgraded():
+    """Test that upgrading read to write raises instead of deadlocking."""
+    lock = ReadWriteLock()
+
+    with lock.read(), pytest.raises(RuntimeError, match="upgrade"):
+        lock.acquire_write()
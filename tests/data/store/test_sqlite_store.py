@@ -0,0 +1,140 @@
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+
+from dashboard.data.store.analytics_store import AnalyticsStore, SQLiteAnalyticsStore
+
+
+@pytest.fixture
+def store(tmp_path, make_analytics_row):
+    """Create a SQLite analytics store with a few rows."""
+    sqlite_store = SQLiteAnalyticsStore(tmp_path / "stores.sqlite3")
+    sqlite_store.add_many(
+        [make_analytics_row(f"campaign-{c}", day) for c in (1, 2) for day in range(5)],
+    )
+    yield sqlite_store
+    sqlite_store.close()
+
+
+@pytest.mark.unit
+def test_lookups_match_in_memory_semantics(store):
+    """Test equality, range and composite lookups on the SQL indexes."""
+    rows = store.get_by_campaign("campaign-1")
+
+    assert [row.date.day for row in rows] == [1, 2, 3, 4, 5]
+    assert len(store.get_by_date(date(2025, 1, 2))) == 2
+    assert len(store.get_by_date_range(date(2025, 1, 2), date(2025, 1, 3))) == 4
+    window = store.get_by_campaign_and_date_range(
+        "campaign-2",
+        date(2025, 1, 4),
+        date(2025, 1, 9),
+    )
+    assert [row.date.day for row in window] == [4, 5]
+    # Query values are coerced like the field, so an ISO string matches a date
+    matches = store.list({"campaign_id": "campaign-2", "date": "2025-01-03"})
+    assert [row.date for row in matches] == [date(2025, 1, 3)]
+    assert store.list({"campaign_id": "missing"}) == []
+    assert store.list({"no_such_field": 1}) == []
+    assert store.count() == 10
+
+
+@pytest.mark.unit
+def test_declared_indexes_are_used(store):
+    """Test that SQLite plans the lookup through the expression index."""
+    with store._pool.connection() as connection:
+        plan = connection.execute(
+            "EXPLAIN QUERY PLAN SELECT data FROM analytics "
+            "WHERE json_extract(data, '$.campaign_id') = ?",
+            ["campaign-1"],
+        ).fetchall()
+
+    assert "USING INDEX analytics__campaign_id" in str(plan)
+
+
+@pytest.mark.unit
+def test_summaries_are_grouped_in_sql(store, make_analytics_row):
+    """Test the SQL GROUP BY totals match the in-memory store's."""
+    memory_store = AnalyticsStore()
+    memory_store.add_many(
+        [make_analytics_row(f"campaign-{c}", day) for c in (1, 2) for day in range(5)],
+    )
+    window = (date(2025, 1, 2), date(2025, 1, 4))
+
+    totals = store.summarize_all(*window)
+
+    assert totals == memory_store.summarize_all(*window)
+    assert totals["campaign-1"].impressions == 300
+    assert totals["campaign-1"].days == 3
+    assert store.summarize("campaign-2", *window) == totals["campaign-2"]
+    assert store.summarize("missing", *window).days == 0
+    assert store.summarize_all(date(2024, 1, 1), date(2024, 1, 2)) == {}
+
+
+@pytest.mark.unit
+def test_add_upserts_and_update_checks_unique_key(store, make_analytics_row):
+    """Test the unique (campaign_id, date) key on add and update."""
+    original = store.get_by_campaign("campaign-1")[0]
+
+    stored = store.add(make_analytics_row("campaign-1", 0, impressions=900))
+
+    assert stored.id == original.id
+    assert store.get(original.id).metrics.impressions == 900
+    assert store.count() == 10
+
+    second = store.get_by_campaign("campaign-1")[0]
+    with pytest.raises(ValueError, match="collides"):
+        store.update(second.id, {"date": original.date})
+
+    swapped = store.update_many(
+        {original.id: {"date": second.date}, second.id: {"date": original.date}},
+    )
+    assert len(swapped) == 2
+    assert store.get(original.id).date == second.date
+
+
+@pytest.mark.unit
+def test_delete_and_ordering(store):
+    """Test deletes and ordered reads by a range-indexed field."""
+    newest = store.get_ordered("date", descending=True, limit=2)
+
+    assert [row.date.day for row in newest] == [5, 5]
+    assert store.delete_many([row.id for row in newest] + ["missing"]) == 2
+    assert store.delete(newest[0].id) is False
+    assert store.get_ordered("date", descending=True, limit=1)[0].date.day == 4
+    assert store.get_ordered("campaign_id") == []
+
+
+@pytest.mark.unit
+def test_pooled_connections_across_threads(store, make_analytics_row):
+    """Test that concurrent sessions share the pool without locking errors."""
+
+    def session(campaign_number):
+        campaign_id = f"campaign-{campaign_number + 10}"
+        store.add_many([make_analytics_row(campaign_id, day) for day in range(20)])
+        return len(store.get_by_campaign(campaign_id))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        counts = list(pool.map(session, range(16)))
+
+    assert counts == [20] * 16
+    assert store.count() == 10 + 16 * 20
+
+
+@pytest.mark.unit
+def test_generation_sees_commits_from_other_connections(store, make_analytics_row):
+    """Test that own writes and writes by another process both bump it."""
+    generation = store.generation
+    assert store.generation == generation, "Reads must not bump it"
+
+    store.add(make_analytics_row("campaign-3", 0))
+    assert store.generation > generation
+    generation = store.generation
+
+    external = sqlite3.connect(store._pool.path)
+    with external:
+        external.execute("DELETE FROM analytics")
+    external.close()
+
+    assert store.generation > generation
@@ -0,0 +1,169 @@
+from datetime import UTC, date, datetime, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from dashboard.data.store.analytics_store import AnalyticsStore
+from dashboard.data.store.campaign_store import CampaignStore
+from dashboard.data.store.virtual_analytics_store import VirtualAnalyticsStore
+
+TODAY = date(2025, 3, 31)
+CREATED = datetime(2025, 2, 28)  # noqa: DTZ001
+
+
+def assert_same_totals(actual, expected):
+    """Assert per-campaign totals are equal, up to float summation order."""
+    assert actual.keys() == expected.keys()
+    for campaign_id, totals in actual.items():
+        np.testing.assert_allclose(
+            [[t.impressions, t.clicks, t.cost_usd, t.days] for t in totals],
+            [
+                [t.impressions, t.clicks, t.cost_usd, t.days]
+                for t in expected[campaign_id]
+            ],
+        )
+
+
+@pytest.fixture
+def campaigns(make_campaign):
+    """Create campaigns created on Feb 28, one of them ending on Mar 15."""
+    store = CampaignStore()
+    for number in range(3):
+        store.add(
+            make_campaign(f"campaign-{number}").model_copy(
+                update={"created_at": CREATED},
+            ),
+        )
+    store.add(
+        make_campaign("ended").model_copy(
+            update={
+                "created_at": CREATED,
+                "end_date": datetime(2025, 3, 15, tzinfo=UTC),
+            },
+        ),
+    )
+    return store
+
+
+@pytest.fixture
+def store(campaigns):
+    """Create a virtual store over the campaigns, on TODAY."""
+    with patch(
+        "dashboard.data.store.virtual_analytics_store._today",
+        return_value=TODAY,
+    ):
+        yield VirtualAnalyticsStore(campaigns)
+
+
+@pytest.mark.unit
+def test_rows_depend_only_on_campaign_and_date(store, make_campaign):
+    """Test rows are the same whatever the range, store or other campaigns."""
+    other_campaigns = CampaignStore()
+    other_campaigns.add(make_campaign("unrelated"))
+    other_campaigns.add(
+        make_campaign("campaign-1").model_copy(update={"created_at": CREATED}),
+    )
+    other = VirtualAnalyticsStore(other_campaigns)
+
+    month = store.get_by_campaign_and_date_range(
+        "campaign-1",
+        date(2025, 3, 1),
+        date(2025, 3, 31),
+    )
+    week = other.get_by_campaign_and_date_range(
+        "campaign-1",
+        date(2025, 3, 10),
+        date(2025, 3, 16),
+    )
+    assert week == month[9:16]
+    # Fixed by the hashes, so the same in every process with this campaign
+    assert month[0].id == "ef126573-3b94-45f5-a007-790a106cde79"
+    assert month[0].metrics.impressions == 1390
+    assert month[0].metrics.cost_usd == 215.62
+
+
+@pytest.mark.unit
+def test_rows_cover_history_until_today_or_end(store):
+    """Test a month of history before creation and no rows past today or the end."""
+    rows = store.get_by_campaign("campaign-0")
+    assert rows[0].date == CREATED.date() - timedelta(days=30)
+    assert rows[-1].date == TODAY
+    assert len(rows) == len({row.date for row in rows}) == 62
+
+    assert store.get_by_campaign("ended")[-1].date == date(2025, 3, 15)
+    assert store.get_by_date(TODAY + timedelta(days=1)) == []
+    assert store.get_by_campaign("missing") == []
+    assert store.count() == 3 * 62 + 46
+
+
+@pytest.mark.unit
+def test_rows_have_the_synthetic_shape(store):
+    """Test the month-long 50% ramp, weekend boost and metric ranges."""
+    rows = store.get_by_date_range(date(2025, 1, 29), TODAY)
+    impressions = np.array([row.metrics.impressions for row in rows])
+    ctr = np.array([row.metrics.ctr_pct for row in rows])
+    weekend = np.array([row.date.weekday() >= 5 for row in rows])
+
+    assert impressions.min() >= 500 * 0.8
+    assert impressions.max() <= 2000 * 1.5 * 1.2 * 1.2
+    assert 1.5 * 0.9 <= ctr.min() <= ctr.max() <= 4.5 * 1.1
+    assert impressions[weekend].mean() > impressions[~weekend].mean()
+
+    ramp = store.summarize("campaign-2", date(2025, 1, 29), date(2025, 2, 4))
+    plateau = store.summarize("campaign-2", date(2025, 3, 3), date(2025, 3, 9))
+    assert plateau.cost_usd / ramp.cost_usd == pytest.approx(1.4, rel=0.1)
+
+
+@pytest.mark.unit
+def test_queries_match_a_row_store(store):
+    """Test summaries agree with an AnalyticsStore holding the same rows."""
+    row_store = AnalyticsStore()
+    row_store.add_many(store.get_by_date_range(date(2025, 1, 1), TODAY))
+    window = (date(2025, 3, 10), date(2025, 3, 20))
+    periods = [(date(2025, 3, 1), date(2025, 3, 9)), window]
+
+    assert_same_totals(
+        {"ended": [store.summarize("ended", *window)]},
+        {"ended": [row_store.summarize("ended", *window)]},
+    )
+    assert_same_totals(
+        {key: [totals] for key, totals in store.summarize_all(*window).items()},
+        {key: [totals] for key, totals in row_store.summarize_all(*window).items()},
+    )
+    assert_same_totals(
+        store.summarize_periods(periods),
+        row_store.summarize_periods(periods),
+    )
+    assert_same_totals(
+        store.summarize_periods(periods, "campaign-1"),
+        row_store.summarize_periods(periods, "campaign-1"),
+    )
+
+    matrix = store.daily_matrix(*window)
+    expected = row_store.daily_matrix(*window)
+    assert sorted(matrix.campaign_ids) == sorted(expected.campaign_ids)
+    order = [expected.campaign_ids.index(c) for c in matrix.campaign_ids]
+    np.testing.assert_array_equal(matrix.cost_usd, expected.cost_usd[order])
+
+
+@pytest.mark.unit
+def test_nothing_is_held_per_row(store, campaigns, make_campaign):
+    """Test queries leave memory unchanged and campaign writes move the generation."""
+    size = store.size_bytes()
+    generation = store.generation
+    store.daily_matrix(date(2025, 1, 1), TODAY)
+
+    assert store.size_bytes() == size
+    assert store.generation == generation
+
+    campaigns.add(make_campaign("new").model_copy(update={"created_at": CREATED}))
+    assert store.generation > generation
+    assert store.size_bytes() > size
+    assert "new" in store.summarize_all(TODAY, TODAY)
+
+
+@pytest.mark.unit
+def test_writes_are_refused(store, make_analytics_row):
+    with pytest.raises(ValueError, match="cannot be written to"):
+        store.add_many([make_analytics_row("campaign-1", 0)])
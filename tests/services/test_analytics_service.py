@@ -1,18 +1,53 @@
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
+from itertools import pairwise
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
+from dashboard.data.models.analytics import (
+    DistributionMetricEnum,
+    MetricsSchema,
+    RollupGranularityEnum,
+    SeriesResolutionEnum,
+)
+from dashboard.data.store.analytics_store import AnalyticsStore, HourlyAnalyticsStore
+from dashboard.data.store.campaign_store import CampaignStore
+from dashboard.data.store.hyperloglog import hash_integers
+from dashboard.data.store.reach_store import ReachStore
 from dashboard.services.analytics_service import (
     calculate_campaign_performance_summary,
+    clear_cache,
+    compare_all_campaigns_performance,
+    compare_campaign_performance,
+    estimate_unique_users,
+    generate_hourly_analytics,
+    generate_synthetic_analytics,
+    get_all_campaigns_performance,
+    get_cache_stats,
+    get_campaign_metric_series,
+    get_campaign_rollup_series,
+    get_metric_distribution,
+    load_synthetic_analytics,
+    plan_date_buckets,
+    previous_period,
 )
 
 
+@pytest.fixture
+def seeded_store(sample_analytics_data):
+    """Patch the service's analytics store with one holding the sample data."""
+    store = AnalyticsStore()
+    store.add_many(sample_analytics_data)
+    with patch("dashboard.services.analytics_service.analytics_store", store):
+        yield store
+
+
 def test_calculate_campaign_performance_summary_empty():
     """Test calculating performance summary with no data."""
     with patch(
-        "dashboard.services.analytics_service.get_campaign_analytics",
-        return_value=[],
+        "dashboard.services.analytics_service.analytics_store",
+        AnalyticsStore(),
     ):
         summary = calculate_campaign_performance_summary(
             "test-campaign-id",
@@ -26,19 +61,347 @@ def test_calculate_campaign_performance_summary_empty():
         assert summary.cost_usd == 0
 
 
-def test_calculate_campaign_performance_summary(sample_analytics_data):
+def test_calculate_campaign_performance_summary(seeded_store):
     """Test calculating performance summary with sample data."""
-    with patch(
-        "dashboard.services.analytics_service.get_campaign_analytics",
-        return_value=sample_analytics_data,
+    summary = calculate_campaign_performance_summary(
+        "test-campaign-id",
+        datetime.now(UTC).date() - timedelta(days=1),
+        datetime.now(UTC).date(),
+    )
+
+    assert summary.impressions == 2500
+    assert summary.clicks == 110
+    assert summary.ctr_pct == pytest.approx(4.4, 0.01)
+    assert summary.cost_usd == 55.0
+
+
+def test_get_all_campaigns_performance(seeded_store, make_campaign):
+    """Test grouped summaries match per-campaign ones, with zeros for idle ones."""
+    campaigns = CampaignStore()
+    active = campaigns.add(make_campaign("test-campaign-id"))
+    idle = campaigns.add(make_campaign("idle-campaign"))
+    start_date = datetime.now(UTC).date() - timedelta(days=1)
+    end_date = datetime.now(UTC).date()
+
+    with patch("dashboard.services.analytics_service.campaign_store", campaigns):
+        performance = get_all_campaigns_performance(start_date, end_date)
+
+    summary = calculate_campaign_performance_summary(active.id, start_date, end_date)
+    assert list(performance) == [active.id, idle.id]
+    assert performance[active.id].model_dump() == summary.model_dump(
+        exclude={"unique_users"},
+    )
+    assert performance[idle.id].impressions == 0
+    assert performance[idle.id].ctr_pct == 0
+
+
+def test_plan_date_buckets_covers_a_year_with_few_buckets():
+    """Test a one-year plan is contiguous, whole-period and about 20 buckets."""
+    start_date, end_date = date(2025, 3, 13), date(2026, 3, 12)
+
+    buckets = plan_date_buckets(start_date, end_date)
+
+    assert len(buckets) <= 22
+    assert buckets[0].start_date == start_date
+    assert buckets[-1].end_date == end_date
+    for previous, current in pairwise(buckets):
+        assert current.start_date == previous.end_date + timedelta(days=1)
+    for bucket in buckets:
+        granularity = bucket.granularity
+        if granularity is not RollupGranularityEnum.DAY:
+            assert granularity.period_start(bucket.start_date) == bucket.start_date
+            assert granularity.period_end(bucket.start_date) == bucket.end_date
+    months = [b for b in buckets if b.granularity is RollupGranularityEnum.MONTH]
+    assert len(months) == 11
+
+
+def test_get_campaign_rollup_series(make_analytics_row):
+    """Test weekly points sum whole weeks and partial edge weeks."""
+    store = AnalyticsStore()
+    store.add_many([make_analytics_row("campaign-1", day) for day in range(60)])
+
+    with patch("dashboard.services.analytics_service.analytics_store", store):
+        weekly = get_campaign_rollup_series(
+            "campaign-1",
+            date(2025, 1, 1),
+            date(2025, 1, 31),
+            RollupGranularityEnum.WEEK,
+        )
+        monthly = get_campaign_rollup_series(
+            "campaign-1",
+            date(2025, 1, 20),
+            date(2025, 2, 10),
+            RollupGranularityEnum.MONTH,
+        )
+
+    # Wed 1st to Sun 5th, four whole weeks, then Mon 27th to Fri 31st
+    assert [point.date.day for point in weekly] == [30, 6, 13, 20, 27]
+    assert [point.metrics.impressions for point in weekly] == [
+        500,
+        700,
+        700,
+        700,
+        500,
+    ]
+    assert [(point.date, point.metrics.impressions) for point in monthly] == [
+        (date(2025, 1, 1), 1200),
+        (date(2025, 2, 1), 1000),
+    ]
+
+
+def test_generate_synthetic_analytics_is_seeded():
+    """Test a seed reproduces the same rows and every row is a valid day."""
+    campaign_ids = ["campaign-1", "campaign-2", "campaign-3"]
+    end_date = date(2025, 3, 31)
+
+    rows = generate_synthetic_analytics(campaign_ids, 90, seed=7, end_date=end_date)
+    again = generate_synthetic_analytics(campaign_ids, 90, seed=7, end_date=end_date)
+    other = generate_synthetic_analytics(campaign_ids, 90, seed=8, end_date=end_date)
+
+    assert rows == again
+    assert rows != other
+    assert len(rows) == 270
+    assert len({row.id for row in rows}) == 270
+    assert {(row.campaign_id, row.date) for row in rows} == {
+        (campaign_id, end_date - timedelta(days=offset))
+        for campaign_id in campaign_ids
+        for offset in range(90)
+    }
+    for row in rows:
+        validated = MetricsSchema.model_validate(row.metrics.model_dump())
+        assert validated.clicks <= validated.impressions
+
+
+def test_load_synthetic_analytics_in_chunks():
+    """Test campaigns split across chunks still load one row per campaign-day."""
+    store = AnalyticsStore()
+
+    with (
+        patch("dashboard.services.analytics_service.analytics_store", store),
+        patch("dashboard.services.analytics_service._SYNTHETIC_CHUNK_ROWS", 100),
     ):
-        summary = calculate_campaign_performance_summary(
-            "test-campaign-id",
-            datetime.now(UTC).date() - timedelta(days=1),
-            datetime.now(UTC).date(),
+        loaded = load_synthetic_analytics(7, 30, seed=1, end_date=date(2025, 1, 30))
+
+    assert loaded == store.count() == 210
+    assert len(store.get_by_campaign("synthetic-campaign-6")) == 30
+
+
+def test_generate_hourly_analytics_adds_up_to_the_day(make_analytics_row):
+    """Test 24 hourly rows per day sum back to the daily metrics."""
+    daily = [make_analytics_row("campaign-1", day, 1000 + day) for day in range(3)]
+
+    hourly = generate_hourly_analytics(daily, seed=3)
+
+    assert len(hourly) == 72
+    for day, row in enumerate(daily):
+        hours = hourly[24 * day : 24 * day + 24]
+        assert {hour.hour.date() for hour in hours} == {row.date}
+        assert sum(hour.metrics.impressions for hour in hours) == 1000 + day
+        assert sum(hour.metrics.clicks for hour in hours) == row.metrics.clicks
+        assert sum(hour.metrics.cost_usd for hour in hours) == pytest.approx(
+            row.metrics.cost_usd,
+        )
+        assert all(hour.metrics.clicks <= hour.metrics.impressions for hour in hours)
+
+
+def test_get_campaign_metric_series_fits_the_window(make_analytics_row):
+    """Test the resolution follows the window and falls back to daily rows."""
+    daily = [make_analytics_row("campaign-1", day) for day in range(400)]
+    store = AnalyticsStore()
+    store.add_many(daily)
+    hourly_store = HourlyAnalyticsStore()
+    hourly_store.add_many(generate_hourly_analytics(daily[:2], seed=1))
+
+    with (
+        patch("dashboard.services.analytics_service.analytics_store", store),
+        patch(
+            "dashboard.services.analytics_service.hourly_analytics_store",
+            hourly_store,
+        ),
+    ):
+        one_day = get_campaign_metric_series(
+            "campaign-1",
+            date(2025, 1, 1),
+            date(2025, 1, 1),
+        )
+        no_hours = get_campaign_metric_series(
+            "campaign-1",
+            date(2025, 1, 10),
+            date(2025, 1, 11),
+        )
+        year = get_campaign_metric_series(
+            "campaign-1",
+            date(2025, 1, 1),
+            date(2025, 12, 31),
+            SeriesResolutionEnum.DAY,
+        )
+
+    assert len(one_day) == 24
+    assert {point.resolution for point in one_day} == {SeriesResolutionEnum.HOUR}
+    assert sum(point.metrics.impressions for point in one_day) == 100
+    assert [point.resolution for point in no_hours] == [SeriesResolutionEnum.DAY] * 2
+    assert len(year) <= 100
+    assert {point.resolution for point in year} == {SeriesResolutionEnum.WEEK}
+    assert sum(point.metrics.impressions for point in year) == 365 * 100
+
+
+def test_unique_users_are_merged_across_days_and_campaigns(
+    make_analytics_row,
+    make_campaign,
+):
+    """Test reach sketches count users shared by days or campaigns once.
+
+    Users of a campaign missing from the campaign store are left out.
+    """
+    store = ReachStore()
+    day = date(2025, 1, 1)
+    store.add_users("campaign-1", day, hash_integers(np.arange(0, 6000)))
+    store.add_users("campaign-1", day, hash_integers(np.arange(4000, 8000)))
+    store.add_users(
+        "campaign-1",
+        day + timedelta(days=1),
+        hash_integers(np.arange(5000, 10_000)),
+    )
+    store.add_users("campaign-2", day, hash_integers(np.arange(9000, 12_000)))
+    store.add_users("removed", day, hash_integers(np.arange(20_000, 30_000)))
+    analytics = AnalyticsStore()
+    analytics.add(make_analytics_row("campaign-1", 0))
+    campaigns = CampaignStore()
+    campaigns.add(make_campaign("campaign-1"))
+    campaigns.add(make_campaign("campaign-2"))
+
+    with (
+        patch("dashboard.services.analytics_service.reach_store", store),
+        patch("dashboard.services.analytics_service.analytics_store", analytics),
+        patch("dashboard.services.analytics_service.campaign_store", campaigns),
+    ):
+        first_day = calculate_campaign_performance_summary("campaign-1", day, day)
+        both_days = estimate_unique_users(day, day + timedelta(days=1), ["campaign-1"])
+        everyone = estimate_unique_users(day, day + timedelta(days=1))
+
+    assert store.count() == 4
+    assert first_day.impressions == 100
+    assert first_day.unique_users == pytest.approx(8000, rel=0.05)
+    assert both_days == pytest.approx(10_000, rel=0.05)
+    assert everyone == pytest.approx(12_000, rel=0.05)
+
+
+def test_get_metric_distribution(make_analytics_row):
+    """Test daily CPC and spend percentiles over a year for all campaigns."""
+    store = AnalyticsStore()
+    store.add_many(
+        [
+            make_analytics_row(f"campaign-{campaign}", day, 100 * (campaign + 1))
+            for campaign in range(10)
+            for day in range(365)
+        ],
+    )
+
+    with patch("dashboard.services.analytics_service.analytics_store", store):
+        cpc, spend = get_metric_distribution(date(2025, 1, 1), date(2025, 12, 31))
+
+    assert spend.metric is DistributionMetricEnum.SPEND
+    assert spend.count == 3650
+    assert spend.p50 == pytest.approx(5.0, rel=0.01)
+    assert spend.p99 == pytest.approx(10.0, rel=0.01)
+    assert cpc.p90 == pytest.approx(0.1, rel=0.01)
+
+
+def test_metric_distribution_covers_every_stored_day(
+    make_analytics_row,
+    make_campaign,
+):
+    """Test days of campaigns missing from the campaign store still count."""
+    store = AnalyticsStore()
+    store.add_many(
+        [make_analytics_row(campaign_id, 0) for campaign_id in ("known", "removed")],
+    )
+    campaigns = CampaignStore()
+    campaigns.add(make_campaign("known"))
+
+    with (
+        patch("dashboard.services.analytics_service.analytics_store", store),
+        patch("dashboard.services.analytics_service.campaign_store", campaigns),
+    ):
+        everyone = get_metric_distribution(date(2025, 1, 1), date(2025, 1, 1))
+        removed = get_metric_distribution(
+            date(2025, 1, 1),
+            date(2025, 1, 1),
+            "removed",
+        )
+
+    assert [distribution.count for distribution in everyone] == [2, 2]
+    assert [distribution.count for distribution in removed] == [1, 1]
+
+
+def test_summary_is_cached_until_the_store_changes(seeded_store, make_analytics_row):
+    """Test reruns hit the result cache and a write is seen straight away."""
+    today = datetime.now(UTC).date()
+    clear_cache()
+
+    first = calculate_campaign_performance_summary("test-campaign-id", today, today)
+    again = calculate_campaign_performance_summary("test-campaign-id", today, today)
+    (row,) = seeded_store.get_by_date(today)
+    seeded_store.update(
+        row.id,
+        {"metrics": MetricsSchema(impressions=1, clicks=0, ctr_pct=0, cost_usd=0)},
+    )
+    updated = calculate_campaign_performance_summary("test-campaign-id", today, today)
+
+    stats = get_cache_stats()
+    assert again is first
+    assert first.impressions == 1000
+    assert updated.impressions == 1
+    # The rerun hits, and so does the reach estimate after the analytics write
+    assert (stats.hits, stats.misses) == (2, 3)
+
+
+def test_previous_period_is_equally_long_and_adjacent():
+    """Test the previous period ends the day before and has as many days."""
+    assert previous_period(date(2025, 3, 1), date(2025, 3, 31)) == (
+        date(2025, 1, 29),
+        date(2025, 2, 28),
+    )
+    assert previous_period(date(2025, 1, 1), date(2025, 1, 1)) == (
+        date(2024, 12, 31),
+        date(2024, 12, 31),
+    )
+
+
+def test_compare_performance_sums_both_periods(make_analytics_row, make_campaign):
+    """Test single and all-campaign comparisons match the summaries of each period."""
+    store = AnalyticsStore()
+    store.add_many(
+        [
+            make_analytics_row(campaign_id, day, 100 * (day + 1))
+            for campaign_id in ("campaign-1", "campaign-2")
+            for day in range(10)
+        ],
+    )
+    campaigns = CampaignStore()
+    for campaign_id in ("campaign-1", "campaign-2"):
+        campaigns.add(make_campaign(campaign_id))
+    start_date, end_date = date(2025, 1, 6), date(2025, 1, 10)
+
+    with (
+        patch("dashboard.services.analytics_service.analytics_store", store),
+        patch("dashboard.services.analytics_service.campaign_store", campaigns),
+    ):
+        single = compare_campaign_performance("campaign-1", start_date, end_date)
+        overall = compare_all_campaigns_performance(start_date, end_date)
+        before = calculate_campaign_performance_summary(
+            "campaign-1",
+            date(2025, 1, 1),
+            date(2025, 1, 5),
         )
+        performance = get_all_campaigns_performance(start_date, end_date)
 
-        assert summary.impressions == 2500
-        assert summary.clicks == 110
-        assert summary.ctr_pct == pytest.approx(4.4, 0.01)
-        assert summary.cost_usd == 55.0
+    assert (single.previous_start_date, single.previous_end_date) == (
+        date(2025, 1, 1),
+        date(2025, 1, 5),
+    )
+    assert single.current.impressions == 600 + 700 + 800 + 900 + 1000
+    assert single.previous == before
+    assert overall.current.impressions == 2 * single.current.impressions
+    assert overall.previous.cost_usd == 2 * before.cost_usd
+    assert performance["campaign-2"].impressions == single.current.impressions
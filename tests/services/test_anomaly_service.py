@@ -0,0 +1,115 @@
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from dashboard.data.models.analytics import (
+    AnomalyMethodEnum,
+    AnomalyMetricEnum,
+    CampaignAnalyticsSchema,
+    MetricsSchema,
+)
+from dashboard.data.store.analytics_store import AnalyticsStore
+from dashboard.services.anomaly_service import detect_anomalies, rolling_scores
+
+START = date(2025, 1, 1)
+
+
+def make_row(
+    campaign_id: str,
+    day: int,
+    clicks: int,
+    cost: float,
+) -> CampaignAnalyticsSchema:
+    return CampaignAnalyticsSchema.model_validate(
+        {
+            "campaign_id": campaign_id,
+            "date": START + timedelta(days=day),
+            "metrics": MetricsSchema(
+                impressions=1000,
+                clicks=clicks,
+                ctr_pct=clicks / 10,
+                cost_usd=cost,
+            ),
+        },
+    )
+
+
+@pytest.fixture
+def store():
+    """Patch in 40 days for 3 campaigns with day-to-day noise and one spike each.
+
+    campaign-spend triples its spend on day 35, campaign-ctr quarters its CTR
+    on day 36 and campaign-steady only has noise.
+    """
+    rng = np.random.default_rng(7)
+    analytics_store = AnalyticsStore()
+    for campaign_id in ("campaign-spend", "campaign-ctr", "campaign-steady"):
+        for day in range(40):
+            clicks = int(rng.integers(45, 56))
+            cost = float(rng.uniform(95, 105))
+            if campaign_id == "campaign-spend" and day == 35:
+                cost *= 3
+            if campaign_id == "campaign-ctr" and day == 36:
+                clicks //= 4
+            analytics_store.add(make_row(campaign_id, day, clicks, cost))
+    with patch("dashboard.services.anomaly_service.analytics_store", analytics_store):
+        yield analytics_store
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("method", list(AnomalyMethodEnum))
+def test_detect_anomalies_flags_only_the_spikes(store, method):
+    """Test each method flags the broken trend days and nothing else."""
+    anomalies = detect_anomalies(
+        START + timedelta(days=20),
+        START + timedelta(days=39),
+        method,
+    )
+
+    flagged = {(a.campaign_id, a.metric, (a.date - START).days) for a in anomalies}
+    assert flagged == {
+        ("campaign-spend", AnomalyMetricEnum.SPEND, 35),
+        ("campaign-ctr", AnomalyMetricEnum.CTR, 36),
+    }
+    spend = next(a for a in anomalies if a.metric is AnomalyMetricEnum.SPEND)
+    assert spend.value > 250
+    assert spend.expected == pytest.approx(100, abs=5)
+    ctr = next(a for a in anomalies if a.metric is AnomalyMetricEnum.CTR)
+    assert spend.score > 0 > ctr.score
+
+
+@pytest.mark.unit
+def test_missing_days_are_skipped(store):
+    """Test a deleted day neither gets scored nor breaks the history."""
+    for row in store.get_by_date(START + timedelta(days=35)):
+        store.delete(row.id)
+
+    anomalies = detect_anomalies(START + timedelta(days=20), START + timedelta(days=39))
+
+    assert [(a.campaign_id, (a.date - START).days) for a in anomalies] == [
+        ("campaign-ctr", 36),
+    ]
+
+
+@pytest.mark.unit
+def test_median_ignores_outliers_in_the_window():
+    """Test MAD keeps scoring a later spike that an earlier one hides from z-scores."""
+    values = np.full((1, 22), 100.0)
+    values[0, ::2] = 102.0
+    values[0, 10] = 1000.0  # An earlier outlier inside the window
+    values[0, 21] = 130.0
+
+    _, zscores = rolling_scores(values, 14, AnomalyMethodEnum.ZSCORE)
+    medians, mad_scores = rolling_scores(values, 14, AnomalyMethodEnum.MAD)
+
+    assert abs(zscores[0, -1]) < 1
+    assert medians[0, -1] == pytest.approx(101)
+    assert mad_scores[0, -1] > 10
+
+
+@pytest.mark.unit
+def test_short_window_is_rejected(store):
+    with pytest.raises(ValueError, match="at least"):
+        detect_anomalies(START, START, window=3)
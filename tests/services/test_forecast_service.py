@@ -0,0 +1,118 @@
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from dashboard.data.models.analytics import (
+    CampaignAnalyticsSchema,
+    ForecastMethodEnum,
+    MetricsSchema,
+)
+from dashboard.data.store.analytics_store import AnalyticsStore
+from dashboard.services.forecast_service import (
+    FORECAST_MAX_DAYS,
+    forecast_all_campaigns,
+    get_campaign_forecast,
+)
+
+START = date(2025, 1, 6)  # A Monday
+AS_OF = START + timedelta(days=55)
+# Weekday multipliers, Monday first
+WEEKLY = np.array([1.2, 1.1, 1.0, 1.0, 0.9, 0.7, 1.1])
+
+
+def make_row(campaign_id: str, day: int, impressions: int) -> CampaignAnalyticsSchema:
+    return CampaignAnalyticsSchema.model_validate(
+        {
+            "campaign_id": campaign_id,
+            "date": START + timedelta(days=day),
+            "metrics": MetricsSchema(
+                impressions=impressions,
+                clicks=impressions // 20,
+                ctr_pct=5.0,
+                cost_usd=impressions / 100,
+            ),
+        },
+    )
+
+
+@pytest.fixture
+def store():
+    """Patch in eight weeks of a flat, a growing and a too-new campaign.
+
+    campaign-flat shows 1000 impressions times the weekday multiplier plus
+    noise, campaign-growing adds 10 a day on top, and campaign-new only has
+    the last 10 days.
+    """
+    rng = np.random.default_rng(3)
+    analytics_store = AnalyticsStore()
+    rows = []
+    for day in range(56):
+        season = WEEKLY[day % 7]
+        noise = rng.normal(0, 10, 2)
+        rows.append(make_row("campaign-flat", day, int(1000 * season + noise[0])))
+        growing = int((1000 + 10 * day) * season + noise[1])
+        rows.append(make_row("campaign-growing", day, growing))
+        if day >= 46:
+            rows.append(make_row("campaign-new", day, 1000))
+    analytics_store.add_many(rows)
+    with patch("dashboard.services.forecast_service.analytics_store", analytics_store):
+        yield analytics_store
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("method", list(ForecastMethodEnum))
+def test_forecast_follows_the_weekly_pattern(store, method):
+    """Test both methods forecast the flat campaign's weekdays inside tight bands."""
+    forecast = get_campaign_forecast("campaign-flat", AS_OF, 14, method)
+
+    assert forecast is not None
+    assert [point.date for point in forecast.impressions] == [
+        AS_OF + timedelta(days=day) for day in range(1, 15)
+    ]
+    expected = np.array([point.expected for point in forecast.impressions])
+    np.testing.assert_allclose(expected[:7], 1000 * WEEKLY, rtol=0.05)
+    for point in forecast.impressions:
+        assert point.lower < point.expected < point.upper
+        assert point.upper - point.lower < 0.1 * point.expected
+    assert forecast.cost_usd[0].expected == pytest.approx(12, rel=0.05)
+
+
+@pytest.mark.unit
+def test_trend_extrapolates_and_bands_widen(store):
+    """Test the linear trend keeps growing and grows less certain with time."""
+    trend = get_campaign_forecast(
+        "campaign-growing",
+        AS_OF,
+        FORECAST_MAX_DAYS,
+        ForecastMethodEnum.TREND,
+    )
+    smoothed = get_campaign_forecast("campaign-growing", AS_OF, FORECAST_MAX_DAYS)
+
+    # The 29th forecast day is a Monday, 84 days after the start
+    monday = trend.impressions[28]
+    assert monday.date.weekday() == 0
+    assert monday.expected == pytest.approx((1000 + 10 * 84) * WEEKLY[0], rel=0.03)
+    assert smoothed.impressions[28].expected < monday.expected
+    first_monday = trend.impressions[0]
+    assert monday.upper - monday.lower > first_monday.upper - first_monday.lower
+
+
+@pytest.mark.unit
+def test_forecasts_are_fitted_once_per_store_generation(store):
+    """Test campaigns share one fit, short histories are skipped and writes refit."""
+    forecasts = forecast_all_campaigns(AS_OF)
+
+    assert sorted(forecasts.campaign_ids) == ["campaign-flat", "campaign-growing"]
+    assert get_campaign_forecast("campaign-new", AS_OF) is None
+    assert forecast_all_campaigns(AS_OF) is forecasts
+
+    store.add(make_row("campaign-flat", 56, 5000))
+    assert forecast_all_campaigns(AS_OF) is not forecasts
+
+
+@pytest.mark.unit
+def test_forecast_length_is_bounded(store):
+    with pytest.raises(ValueError, match="7 to 30 days"):
+        get_campaign_forecast("campaign-flat", AS_OF, 90)
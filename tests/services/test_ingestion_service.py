@@ -0,0 +1,109 @@
+import json
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from dashboard.data.store.analytics_store import AnalyticsStore
+from dashboard.services.ingestion_service import (
+    MetricFileFormatEnum,
+    ingest_metrics_file,
+    main,
+)
+
+
+@pytest.fixture
+def ingest_store():
+    """Patch the ingestion service's analytics store with an empty one."""
+    store = AnalyticsStore()
+    with patch("dashboard.services.ingestion_service.analytics_store", store):
+        yield store
+
+
+def test_ingest_csv_coerces_and_rejects(tmp_path, ingest_store):
+    """Test CSV strings are coerced and invalid rows are counted, not loaded."""
+    path = tmp_path / "metrics.csv"
+    path.write_text(
+        "campaign_id,date,impressions,clicks,cost_usd\n"
+        "campaign-1,2025-01-01,1000,50,12.5\n"
+        "campaign-1,2025-01-02,oops,50,12.5\n"
+        "campaign-1,2025-01-03,10,20,1.0\n"
+        "campaign-2,2025-01-01,200,0,3\n",
+    )
+
+    report = ingest_metrics_file(path)
+
+    assert report.rows_read == 4
+    assert report.rows_loaded == 2
+    assert report.rows_rejected == 2
+    assert report.errors[0].startswith("line 3: impressions:")
+    assert report.rows_per_second > 0
+    row = ingest_store.get_by_campaign("campaign-1")[0]
+    assert row.date == date(2025, 1, 1)
+    assert row.metrics.ctr_pct == 5.0
+
+
+def test_ingest_jsonl_dedupes_across_batches(tmp_path, ingest_store):
+    """Test the last row per campaign-day wins, in and across batches."""
+    lines = [
+        {
+            "campaign_id": "campaign-1",
+            "date": "2025-01-01",
+            "impressions": 100,
+            "clicks": 1,
+            "cost_usd": 1.0,
+        },
+        {
+            "campaign_id": "campaign-1",
+            "date": "2025-01-01",
+            "impressions": 200,
+            "clicks": 2,
+            "cost_usd": 2.0,
+        },
+        {
+            "campaign_id": "campaign-1",
+            "date": "2025-01-02",
+            "metrics": {"impressions": 300, "clicks": 3, "cost_usd": 3.0},
+        },
+        {
+            "campaign_id": "campaign-1",
+            "date": "2025-01-01",
+            "impressions": 400,
+            "clicks": 4,
+            "cost_usd": 4.0,
+        },
+    ]
+    path = tmp_path / "metrics.log"
+    path.write_text(
+        "\n".join([*map(json.dumps, lines), "{not json"]) + "\n",
+    )
+
+    report = ingest_metrics_file(path, MetricFileFormatEnum.JSONL, batch_size=2)
+
+    assert report.rows_read == 5
+    assert report.duplicates == 1
+    assert report.rows_rejected == 1
+    assert ingest_store.count() == 2
+    summary = ingest_store.summarize("campaign-1", date(2025, 1, 1), date(2025, 1, 2))
+    assert summary.impressions == 700
+
+
+def test_main_rejects_an_unknown_suffix(tmp_path, ingest_store, capsys):
+    """Test a file whose format cannot be told is a usage error, not a crash."""
+    path = tmp_path / "metrics.txt"
+    path.write_text("campaign_id,date,impressions,clicks,cost_usd\n")
+
+    with (
+        patch("sys.argv", ["ingest", str(path)]),
+        pytest.raises(SystemExit) as exit_info,
+    ):
+        main()
+
+    assert exit_info.value.code == 2
+    assert "pass --format" in capsys.readouterr().err
+    assert ingest_store.count() == 0
+
+    with patch("sys.argv", ["ingest", str(path), "--format", "csv"]):
+        main()
+
+    assert "read 0 rows" in capsys.readouterr().out
@@ -0,0 +1,142 @@
+from datetime import UTC, date, datetime
+from unittest.mock import patch
+
+import pytest
+
+from dashboard.data.models.analytics import PacingStatusEnum
+from dashboard.data.models.campaign import CampaignStatusEnum
+from dashboard.data.store.analytics_store import AnalyticsStore
+from dashboard.data.store.campaign_store import CampaignStore
+from dashboard.services.pacing_service import calculate_budget_pacing
+
+AS_OF = date(2025, 1, 10)
+END_OF_MONTH = datetime(2025, 1, 31, tzinfo=UTC)
+
+
+@pytest.fixture
+def stores(make_analytics_row, make_campaign):
+    """Patch in campaigns running since 2025-01-01 with steady daily spend.
+
+    Ending Jan 31 with a $310 budget, $10 a day is on pace, $20 overpaces and
+    $2 (with no row yet for Jan 10) underpaces. A $50 budget spent at $10 a
+    day is exhausted, and an open-ended campaign is never off pace.
+    """
+    campaigns = CampaignStore()
+    analytics = AnalyticsStore()
+    spend = {
+        "on-pace": (310, END_OF_MONTH, 10, 10),
+        "over": (310, END_OF_MONTH, 20, 10),
+        "under": (310, END_OF_MONTH, 2, 9),
+        "spent": (50, END_OF_MONTH, 10, 10),
+        "open-ended": (1000, None, 10, 10),
+        "paused": (310, END_OF_MONTH, 50, 10),
+    }
+    for campaign_id, (budget, end_date, daily, days) in spend.items():
+        campaign = make_campaign(campaign_id, budget).model_copy(
+            update={
+                "end_date": end_date,
+                "status": (
+                    CampaignStatusEnum.PAUSED
+                    if campaign_id == "paused"
+                    else CampaignStatusEnum.ACTIVE
+                ),
+            },
+        )
+        campaigns.add(campaign)
+        analytics.add_many(
+            [make_analytics_row(campaign_id, day, daily * 100) for day in range(days)],
+        )
+
+    with (
+        patch("dashboard.services.pacing_service.campaign_store", campaigns),
+        patch("dashboard.services.pacing_service.analytics_store", analytics),
+    ):
+        yield campaigns, analytics
+
+
+@pytest.mark.unit
+def test_pacing_flags_off_pace_campaigns_first(stores):
+    """Test spend, expected curve, exhaustion and status of each active campaign."""
+    pacing = calculate_budget_pacing(AS_OF)
+    by_id = {pace.campaign_id: pace for pace in pacing}
+
+    assert [pace.status for pace in pacing] == [
+        PacingStatusEnum.EXHAUSTED,
+        PacingStatusEnum.OVERPACING,
+        PacingStatusEnum.UNDERPACING,
+        PacingStatusEnum.ON_PACE,
+        PacingStatusEnum.ON_PACE,
+    ]
+    assert "paused" not in by_id
+
+    on_pace = by_id["on-pace"]
+    assert on_pace.spend_to_date_usd == 100
+    assert on_pace.daily_budget_usd == 10
+    assert on_pace.expected_spend_usd == 100
+    assert on_pace.daily_run_rate_usd == 10
+    assert on_pace.projected_exhaustion_date == date(2025, 1, 31)
+    assert not on_pace.at_risk
+
+    assert by_id["over"].projected_exhaustion_date == date(2025, 1, 16)
+    assert by_id["under"].daily_run_rate_usd == pytest.approx(12 / 7, abs=0.01)
+    assert by_id["under"].projected_exhaustion_date is None
+    assert by_id["spent"].projected_exhaustion_date == AS_OF
+    assert by_id["open-ended"].expected_spend_usd is None
+    assert by_id["open-ended"].projected_exhaustion_date == date(2025, 4, 10)
+
+
+@pytest.mark.unit
+def test_pacing_follows_new_spend_rows(stores, make_analytics_row):
+    """Test a spend row arriving is reflected in the next pacing."""
+    _, analytics = stores
+    before = {pace.campaign_id: pace for pace in calculate_budget_pacing(AS_OF)}
+
+    analytics.add(make_analytics_row("under", 9, 500 * 100))
+    after = {pace.campaign_id: pace for pace in calculate_budget_pacing(AS_OF)}
+
+    assert before["under"].status is PacingStatusEnum.UNDERPACING
+    assert after["under"].spend_to_date_usd == 518
+    assert after["under"].status is PacingStatusEnum.EXHAUSTED
+
+
+@pytest.mark.unit
+def test_pacing_ignores_spend_outside_each_campaigns_schedule(
+    make_analytics_row,
+    make_campaign,
+):
+    """Test rows before a campaign's own start count neither as spend nor rate."""
+    campaigns = CampaignStore()
+    analytics = AnalyticsStore()
+    for campaign_id, start_day in (("early", 1), ("mid-window", 7), ("future", 20)):
+        campaigns.add(
+            make_campaign(campaign_id, 310).model_copy(
+                update={
+                    "start_date": datetime(2025, 1, start_day, tzinfo=UTC),
+                    "end_date": END_OF_MONTH,
+                    "status": CampaignStatusEnum.ACTIVE,
+                },
+            ),
+        )
+        analytics.add_many(
+            [make_analytics_row(campaign_id, day, 10 * 100) for day in range(10)],
+        )
+
+    with (
+        patch("dashboard.services.pacing_service.campaign_store", campaigns),
+        patch("dashboard.services.pacing_service.analytics_store", analytics),
+    ):
+        by_id = {pace.campaign_id: pace for pace in calculate_budget_pacing(AS_OF)}
+
+    assert by_id["early"].spend_to_date_usd == 100
+    # Started Jan 7: four days of spend, all inside the run rate window
+    assert by_id["mid-window"].spend_to_date_usd == 40
+    assert by_id["mid-window"].daily_run_rate_usd == 10
+    assert by_id["future"].spend_to_date_usd == 0
+    assert by_id["future"].daily_run_rate_usd == 0
+    assert by_id["future"].status is PacingStatusEnum.ON_PACE
+
+
+@pytest.mark.unit
+def test_no_active_campaigns():
+    with patch("dashboard.services.pacing_service.campaign_store", CampaignStore()):
+        assert calculate_budget_pacing(AS_OF) == []
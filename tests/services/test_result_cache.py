@@ -0,0 +1,80 @@
+import pytest
+
+from dashboard.data.store.analytics_store import AnalyticsStore
+from dashboard.services.result_cache import ResultCache
+
+cache_store = AnalyticsStore()
+calls: list[tuple[str, ...]] = []
+cache = ResultCache(max_entries=2)
+
+
+@cache.memoize("cache_store")
+def count_rows(campaign_ids: list[str], scale: int = 1) -> int:
+    calls.append(tuple(campaign_ids))
+    return sum(len(cache_store.get_by_campaign(c)) for c in campaign_ids) * scale
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    """Start every test with an empty cache and store."""
+    cache.clear()
+    cache_store.clear()
+    calls.clear()
+
+
+@pytest.mark.unit
+def test_repeated_calls_are_served_from_cache(make_analytics_row):
+    """Test that equal arguments hit, however they are passed."""
+    cache_store.add(make_analytics_row("campaign-1", 0))
+
+    assert count_rows(["campaign-1"]) == 1
+    assert count_rows(["campaign-1"], 1) == 1
+    assert count_rows(campaign_ids=["campaign-1"], scale=1) == 1
+    assert count_rows(["campaign-1"], scale=2) == 2
+
+    assert calls == [("campaign-1",), ("campaign-1",)]
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (2, 2, 2)
+    assert stats.hit_rate == 0.5
+
+
+@pytest.mark.unit
+def test_write_invalidates_cached_results(make_analytics_row):
+    """Test that a store write makes the next call recompute."""
+    assert count_rows(["campaign-1"]) == 0
+
+    cache_store.add(make_analytics_row("campaign-1", 0))
+
+    assert count_rows(["campaign-1"]) == 1
+    assert count_rows(["campaign-1"]) == 1
+    assert len(calls) == 2
+
+
+@pytest.mark.unit
+def test_least_recently_used_entry_is_evicted():
+    """Test that the cache stays within max_entries, dropping the oldest use."""
+    count_rows(["a"])
+    count_rows(["b"])
+    count_rows(["a"])
+    count_rows(["c"])
+    count_rows(["a"])
+    count_rows(["b"])
+
+    assert calls == [("a",), ("b",), ("c",), ("b",)]
+    stats = cache.stats()
+    assert stats.evictions == 2
+    assert stats.size == 2
+
+
+@pytest.mark.unit
+def test_zero_capacity_disables_caching():
+    """Test that max_entries=0 always runs the function."""
+    cache.max_entries = 0
+    try:
+        count_rows(["a"])
+        count_rows(["a"])
+    finally:
+        cache.max_entries = 2
+
+    assert len(calls) == 2
+    assert cache.stats().size == 0